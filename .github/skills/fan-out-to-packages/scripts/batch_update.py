@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Run ``copier update`` across local clones, each in a worktree of its own, and report what it did.
+
+A release reaches the fleet as one ``copier update`` per repo, and §4 of the
+fan-out skill is the list of what that command does without saying so: it
+overwrites drifted files with no conflict, leaves conflicts inline with no
+``.rej``, skips ``_skip_if_exists`` files it would have changed, and recreates
+the ones a repo deleted. This runs every update on a bounded process pool and
+sweeps each result for all of those, into one JSON report:
+
+- ``changed``: every path the update touched, against the clone's ``HEAD``;
+- ``rej``: ``.rej`` files, which hold the *project's* hunks that did not apply;
+- ``conflicted``: paths git left unmerged, and touched files carrying conflict
+  markers -- copier delivers most conflicts inline now, with zero ``.rej``;
+- ``overwritten``: paths whose local content differed from the baseline render
+  and is now exactly the target render, or gone -- local work lost with no
+  conflict at all;
+- ``skip_if_exists``: skip-listed paths the release would have changed but the
+  repo kept (``kept``), and ones the repo had deleted that came back
+  (``recreated``).
+
+Each clone is updated in a detached ``git worktree`` under the scratch
+directory, from its committed ``HEAD``, so the clone itself is never touched
+and uncommitted work in it is not part of the update. The worktrees are left in
+place for review; ``git worktree remove`` them when done. Conflicts are left
+inline, copier's default: ``--conflict rej`` is never passed, for the reasons §4
+gives.
+
+The pristine renders the sweeps compare against are rendered once per distinct
+answer set and ref, by ``drift_scan``, and shared by every repo that answered
+alike -- and with a ``drift_scan`` run given the same ``--scratch``. ``copier
+update`` still renders its own pair inside each worktree; there is no way to
+hand it one.
+
+It runs offline: each worktree's ``_src_path`` is pointed at the local template
+clone for the update, through a commit that is reset away afterwards, and the
+original ``_src_path`` is written back. It needs only copier installed:
+``pathspec``, which matches the ``_skip_if_exists`` patterns, and ``yaml`` both
+come in as copier's own dependencies.
+
+    python .github/skills/fan-out-to-packages/scripts/batch_update.py \\
+        --template ~/src/python-package-copier --to v0.45.0 --scratch /tmp/v0.45.0 ~/src/yohou ~/src/yohou-nixtla
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+from drift_scan import ANSWERS_FILE, check_names, read_answers, render_key, render_pristines
+from pathspec import PathSpec
+
+# The anchored form misses `<<<<<<< HEAD`; see §5 on false-clean marker regexes.
+CONFLICT_MARKER = re.compile(rb"^(<<<<<<<|>>>>>>>|=======)( |$)", re.MULTILINE)
+_UNMERGED = {"DD", "AU", "UD", "UA", "DU", "AA", "UU"}
+_SRC_PATH = re.compile(r"^_src_path:.*$", re.MULTILINE)
+
+
+def _git(cwd, *args, text=True):
+    return subprocess.run(
+        ["git", "-c", "user.name=batch-update", "-c", "user.email=batch-update@localhost", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=text,
+        check=True,
+    ).stdout
+
+
+def _status(worktree):
+    """``{path: XY}`` from ``git status``, untracked files listed one by one.
+
+    A rename or copy is keyed by its new path; ``-z`` writes its source path as
+    the next field, which is consumed here rather than read as an entry.
+    """
+    fields = iter(_git(worktree, "status", "--porcelain=v1", "-z", "--untracked-files=all").split("\0"))
+    status = {}
+    for entry in fields:
+        if not entry:
+            continue
+        status[entry[3:]] = entry[:2]
+        if "R" in entry[:2] or "C" in entry[:2]:
+            next(fields, None)
+    return status
+
+
+def skip_patterns(template, ref):
+    """The ``_skip_if_exists`` patterns of the template's ``copier.yml`` at *ref*."""
+    config = yaml.safe_load(_git(template, "show", f"{ref}:copier.yml")) or {}
+    patterns = config.get("_skip_if_exists") or []
+    return [patterns] if isinstance(patterns, str) else list(patterns)
+
+
+def _read(path):
+    return path.read_bytes() if path.is_file() else None
+
+
+def _committed(worktree, ref, path):
+    """The bytes of *path* at *ref*, or ``None`` where it does not exist."""
+    result = subprocess.run(["git", "show", f"{ref}:{path}"], cwd=worktree, capture_output=True, check=False)
+    return result.stdout if result.returncode == 0 else None
+
+
+def _update(clone, worktree, template, to_ref):
+    # Module-level so the process pool can pickle it; returns the worktree's
+    # unmerged paths and the clone's HEAD, or raises.
+    from copier import run_update
+
+    _git(clone, "worktree", "add", "--quiet", "--detach", str(worktree), "HEAD")
+    head = _git(worktree, "rev-parse", "HEAD").strip()
+    answers_path = worktree / ANSWERS_FILE
+    original = answers_path.read_text(encoding="utf-8")
+    source = _SRC_PATH.search(original)
+    # Quoted: a bare path holding `: `, ` #` or a leading `~` or `&` is other YAML.
+    offline = _SRC_PATH.sub(lambda _: f"_src_path: {json.dumps(str(template))}", original, count=1)
+    redirected = offline != original
+    if redirected:
+        answers_path.write_text(offline, encoding="utf-8")
+        _git(
+            worktree,
+            "commit",
+            "--quiet",
+            "--no-verify",
+            "-m",
+            "batch_update: point _src_path at the local template",
+            "--",
+            ANSWERS_FILE,
+        )
+
+    try:
+        run_update(
+            str(worktree), vcs_ref=to_ref, defaults=True, overwrite=True, skip_answered=True, unsafe=True, quiet=True
+        )
+        # Read before the reset below clears the index of its unmerged entries.
+        unmerged = sorted(path for path, code in _status(worktree).items() if code in _UNMERGED)
+    finally:
+        if redirected:
+            _git(worktree, "reset", "--quiet", "--mixed", head)
+            updated = answers_path.read_text(encoding="utf-8")
+            answers_path.write_text(_SRC_PATH.sub(lambda _: source.group(0), updated, count=1), encoding="utf-8")
+    return head, unmerged
+
+
+def update_repo(clone, worktree, template, to_ref, baseline, target, patterns):
+    """Update one clone in *worktree* and sweep the result; never raises.
+
+    *baseline* and *target* are the pristine renders at the clone's answers, at
+    its ``_commit`` and at *to_ref*.
+    """
+    result = {"path": str(clone), "worktree": str(worktree), "status": "updated"}
+    try:
+        head, unmerged = _update(clone, worktree, template, to_ref)
+    except Exception as error:  # noqa: BLE001 -- one repo's failure is reported, not fatal to the batch
+        return {**result, "status": "failed", "error": f"{type(error).__name__}: {error}"}
+
+    # An unmerged path is reported as modified here and listed under `conflicted`.
+    changed = {
+        path: "A" if code == "??" else "M" if code in _UNMERGED else code.strip()[0]
+        for path, code in sorted(_status(worktree).items())
+    }
+    marked = [
+        path for path in changed if (content := _read(worktree / path)) is not None and CONFLICT_MARKER.search(content)
+    ]
+    conflicted = sorted(set(unmerged) | set(marked))
+
+    overwritten = []
+    for path in changed:
+        if path == ANSWERS_FILE or path.endswith(".rej") or path in conflicted:
+            continue
+        before = _committed(worktree, head, path)
+        after, new = _read(worktree / path), _read(target / path)
+        if before is not None and before not in (_read(baseline / path), new) and after in (new, None):
+            overwritten.append(path)
+
+    spec = PathSpec.from_lines("gitwildmatch", patterns)
+    listed = [
+        path.relative_to(target).as_posix()
+        for path in sorted(target.rglob("*"))
+        if path.is_file() and spec.match_file(path.relative_to(target).as_posix())
+    ]
+    kept, recreated = [], []
+    for path in listed:
+        before = _committed(worktree, head, path)
+        if before is None and (worktree / path).is_file():
+            recreated.append(path)
+        elif before is not None and before != _read(target / path):
+            kept.append(path)
+
+    return {
+        **result,
+        "changed": changed,
+        "rej": [path for path in changed if path.endswith(".rej")],
+        "conflicted": conflicted,
+        "overwritten": overwritten,
+        "skip_if_exists": {"kept": kept, "recreated": recreated},
+    }
+
+
+def batch_update(template, clones, to_ref, scratch=None, workers=None):
+    """Update every clone to *to_ref* in its own worktree; the report, as a JSON-ready dict."""
+    template = Path(template).resolve()
+    scratch = Path(scratch or tempfile.mkdtemp(prefix="batch-update-"))
+    repos = {}
+    for clone in clones:
+        answers, commit = read_answers(clone)
+        if not commit:
+            raise ValueError(f"no _commit recorded in {ANSWERS_FILE} of {clone}")
+        repos[Path(clone).resolve()] = (answers, commit)
+    check_names(repos)
+    worktrees = scratch / "worktrees"
+    taken = [str(worktrees / clone.name) for clone in repos if (worktrees / clone.name).exists()]
+    if taken:
+        raise FileExistsError(f"worktrees from an earlier run are in the way: {', '.join(taken)}")
+
+    requests = [pair for answers, ref in repos.values() for pair in ((answers, ref), (answers, to_ref))]
+    trees = render_pristines(template, requests, scratch / "renders", workers)
+    patterns = skip_patterns(template, to_ref)
+
+    report = {"template": str(template), "to": to_ref, "renders": len(trees), "repos": {}}
+    worktrees.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=max(1, min(workers or os.cpu_count() or 1, len(repos)))) as pool:
+        futures = {
+            clone: pool.submit(
+                update_repo,
+                clone,
+                worktrees / clone.name,
+                template,
+                to_ref,
+                trees[render_key(answers, ref)],
+                trees[render_key(answers, to_ref)],
+                patterns,
+            )
+            for clone, (answers, ref) in repos.items()
+        }
+        for clone, future in futures.items():
+            answers, ref = repos[clone]
+            report["repos"][clone.name] = {"from": ref, "answer_set": render_key(answers, ""), **future.result()}
+    return report
+
+
+def summary(report):
+    """One line per repo, then one per path that needs a human."""
+    lines = [f"{report['renders']} pristine renders; updated to {report['to']}"]
+    for name, repo in report["repos"].items():
+        if repo["status"] == "failed":
+            lines.append(f"{name} ({repo['from']} -> {report['to']}): FAILED  {repo['error']}")
+            continue
+        skip = repo["skip_if_exists"]
+        lines.append(
+            f"{name} ({repo['from']} -> {report['to']}): {len(repo['changed'])} changed, "
+            f"{len(repo['rej'])} .rej, {len(repo['conflicted'])} conflicted, "
+            f"{len(repo['overwritten'])} overwritten  [{repo['worktree']}]"
+        )
+        lines.extend(f"  conflicted   {path}" for path in repo["conflicted"])
+        lines.extend(f"  rej          {path}" for path in repo["rej"])
+        lines.extend(f"  overwritten  {path}" for path in repo["overwritten"])
+        lines.extend(f"  skip, kept   {path}" for path in skip["kept"])
+        lines.extend(f"  recreated    {path}" for path in skip["recreated"])
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("clones", nargs="+", type=Path, help="local clones of generated repos")
+    parser.add_argument("--template", type=Path, required=True, help="local clone of the template repository")
+    parser.add_argument("--to", dest="to_ref", required=True, help="the release being rolled out (a tag)")
+    parser.add_argument(
+        "--scratch", type=Path, help="where renders and worktrees go (default: a new temporary directory)"
+    )
+    parser.add_argument("--workers", type=int, help="render and update processes (default: the CPU count)")
+    parser.add_argument("--json", type=Path, help="write the full report here")
+    args = parser.parse_args(argv)
+
+    report = batch_update(args.template, args.clones, args.to_ref, args.scratch, args.workers)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(summary(report))
+    return 1 if any(repo["status"] == "failed" for repo in report["repos"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Pre-flight a release against local clones: what each repo receives, and what it has changed.
+
+Section 2 of the fan-out skill asks for two measurements before any brief is
+written, both by content:
+
+- the delta: the two pristine renders across the version pair, at each repo's
+  own answers -- what the release actually changes for that repo;
+- the drift: every file the release touches, in the repo as it is against the
+  pristine render it was generated from -- the local content an update can lose.
+
+This renders every pristine both need across a process pool, once per distinct
+(answers, ref) pair: repos that answered alike share their renders, so the fleet's
+two ``include_examples`` values cost two renders per ref, not seven. It runs
+offline -- the template and the clones are local git repositories -- and pins
+every render to an explicit ref, never the working tree.
+
+Drift is measured with ``git diff --no-index --histogram``. The skill's warning
+about drift counts stands: another algorithm gives other ``+``/``-`` totals for
+the same pair, so the report names the one it used and the counts estimate risk,
+not loss.
+
+    python .github/skills/fan-out-to-packages/scripts/drift_scan.py \\
+        --template ~/src/python-package-copier --to v0.45.0 ~/src/yohou ~/src/yohou-nixtla
+
+``--from`` defaults to each repo's own ``_commit``, which is the baseline its
+update will start from. ``--json`` writes the full report, patches included.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ANSWERS_FILE = ".copier-answers.yml"
+ALGORITHM = "git diff --no-index --histogram"
+
+
+def read_answers(clone):
+    """The answers a clone was generated with, and the ``_commit`` it was generated at."""
+    # Imported here, as copier is in _render: PyYAML comes in with copier, and
+    # `--help` works without either.
+    import yaml
+
+    recorded = yaml.safe_load((Path(clone) / ANSWERS_FILE).read_text(encoding="utf-8")) or {}
+    answers = {key: value for key, value in recorded.items() if not key.startswith("_")}
+    return answers, recorded.get("_commit")
+
+
+def check_names(clones):
+    """Refuse clones that share a directory name: reports and worktrees are keyed by it."""
+    by_name = {}
+    for clone in clones:
+        by_name.setdefault(Path(clone).name, []).append(str(clone))
+    clashes = ["; ".join(paths) for paths in by_name.values() if len(paths) > 1]
+    if clashes:
+        raise ValueError(f"clones must have distinct directory names, got: {' | '.join(clashes)}")
+
+
+def render_key(answers, ref):
+    """Name of the render of *answers* at *ref*: identical pairs render once."""
+    payload = json.dumps([ref, answers], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _render(template, ref, answers, destination):
+    # Module-level so the process pool can pickle it. copier is imported here so
+    # `--help` works without it installed.
+    from copier import run_copy
+
+    if not destination.is_dir():
+        # Per process, so two runs sharing a scratch directory never stage into
+        # each other's tree.
+        staging = destination.with_name(f"{destination.name}.tmp-{os.getpid()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        run_copy(
+            str(template),
+            str(staging),
+            data=answers,
+            vcs_ref=ref,
+            defaults=True,
+            overwrite=True,
+            unsafe=True,
+            quiet=True,
+        )
+        try:
+            staging.rename(destination)
+        except OSError:
+            # Another run sharing the scratch published the same render first.
+            shutil.rmtree(staging, ignore_errors=True)
+            if not destination.is_dir():
+                raise
+    return destination
+
+
+def render_pristines(template, requests, scratch, workers=None):
+    """Render every distinct ``(answers, ref)`` in *requests*; return ``{key: tree}``.
+
+    A render already under *scratch* is reused, so a scan and a batch update run
+    against the same scratch directory render each pristine once between them.
+    """
+    distinct = {render_key(answers, ref): (answers, ref) for answers, ref in requests}
+    scratch = Path(scratch)
+    scratch.mkdir(parents=True, exist_ok=True)
+    jobs = {key: (template, ref, answers, scratch / key) for key, (answers, ref) in distinct.items()}
+    with ProcessPoolExecutor(max_workers=max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))) as pool:
+        futures = {key: pool.submit(_render, *job) for key, job in jobs.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def tree_hashes(tree):
+    """``{relative path: sha256}`` for every file a render produced, the answers file aside.
+
+    The answers file records the ref, so it differs across any version pair by
+    construction and says nothing about what the release changes.
+    """
+    tree = Path(tree)
+    return {
+        path.relative_to(tree).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(tree.rglob("*"))
+        if path.is_file() and ".git" not in path.relative_to(tree).parts and path.name != ANSWERS_FILE
+    }
+
+
+def template_delta(before, after):
+    """``{path: added|removed|modified}`` between two renders' hashes."""
+    delta = dict.fromkeys(before.keys() - after.keys(), "removed")
+    delta.update(dict.fromkeys(after.keys() - before.keys(), "added"))
+    delta.update({path: "modified" for path in before.keys() & after.keys() if before[path] != after[path]})
+    return dict(sorted(delta.items()))
+
+
+def content_diff(old, new):
+    """``(lines added, lines removed, patch)`` from *old* to *new*; ``None`` counts for binaries."""
+    result = subprocess.run(
+        ["git", "diff", "--no-index", "--histogram", "--no-color", "--numstat", "--patch", "--", str(old), str(new)],
+        capture_output=True,
+        text=True,
+        errors="replace",
+        check=False,
+    )
+    if result.returncode not in (0, 1):
+        raise RuntimeError(f"git diff failed on {old} and {new}: {result.stderr.strip()}")
+    if not result.stdout:
+        return 0, 0, ""
+    numstat, _, patch = result.stdout.partition("\n")
+    added, removed, _ = numstat.split("\t", 2)
+    if added == "-":
+        return None, None, patch
+    return int(added), int(removed), patch
+
+
+def _local_state(clone, path, baseline, target):
+    """How the clone's copy of *path* stands against the baseline and target pristines."""
+    local = Path(clone) / path
+    if not local.is_file():
+        return {"local": "absent"}
+    base = baseline / path
+    if base.is_file() and local.read_bytes() == base.read_bytes():
+        return {"local": "pristine"}
+    if (target / path).is_file() and local.read_bytes() == (target / path).read_bytes():
+        return {"local": "at-target"}
+    added, removed, patch = content_diff(base if base.is_file() else os.devnull, local)
+    return {"local": "drifted", "added": added, "removed": removed, "diff": patch}
+
+
+def scan(template, clones, to_ref, from_ref=None, scratch=None, workers=None):
+    """The drift report for *clones* across ``from_ref``..``to_ref``, as a JSON-ready dict."""
+    template = Path(template).resolve()
+    scratch = Path(scratch or tempfile.mkdtemp(prefix="drift-scan-"))
+    repos = {}
+    for clone in clones:
+        answers, commit = read_answers(clone)
+        repos[Path(clone).resolve()] = (answers, from_ref or commit)
+    missing = [str(clone) for clone, (_, ref) in repos.items() if not ref]
+    if missing:
+        raise ValueError(f"no --from given and no _commit recorded in {ANSWERS_FILE} of: {', '.join(missing)}")
+    check_names(repos)
+
+    requests = [pair for answers, ref in repos.values() for pair in ((answers, ref), (answers, to_ref))]
+    trees = render_pristines(template, requests, scratch / "renders", workers)
+    hashes = {key: tree_hashes(tree) for key, tree in trees.items()}
+
+    report = {"template": str(template), "to": to_ref, "algorithm": ALGORITHM, "renders": len(trees), "repos": {}}
+    for clone, (answers, ref) in repos.items():
+        baseline, target = render_key(answers, ref), render_key(answers, to_ref)
+        delta = template_delta(hashes[baseline], hashes[target])
+        files = {
+            path: {"template": change, **_local_state(clone, path, trees[baseline], trees[target])}
+            for path, change in delta.items()
+        }
+        report["repos"][clone.name] = {
+            "path": str(clone),
+            "from": ref,
+            "answer_set": render_key(answers, ""),
+            "files": files,
+        }
+    return report
+
+
+def summary(report):
+    """One line per repo and one per drifted file the release touches."""
+    lines = [f"{report['renders']} pristine renders; drift by {report['algorithm']}"]
+    for name, repo in report["repos"].items():
+        drifted = {path: entry for path, entry in repo["files"].items() if entry["local"] == "drifted"}
+        lines.append(f"{name} ({repo['from']} -> {report['to']}): {len(repo['files'])} touched, {len(drifted)} drifted")
+        for path, entry in drifted.items():
+            counts = "binary" if entry["added"] is None else f"+{entry['added']} -{entry['removed']}"
+            lines.append(f"  {entry['template']:<8} {path}  ({counts})")
+        lines.extend(
+            f"  {entry['template']:<8} {path}  (absent locally)"
+            for path, entry in repo["files"].items()
+            if entry["local"] == "absent" and entry["template"] != "added"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("clones", nargs="+", type=Path, help="local clones of generated repos")
+    parser.add_argument("--template", type=Path, required=True, help="local clone of the template repository")
+    parser.add_argument("--to", dest="to_ref", required=True, help="the release being rolled out (a tag)")
+    parser.add_argument("--from", dest="from_ref", help="the baseline ref (default: each repo's _commit)")
+    parser.add_argument("--scratch", type=Path, help="where renders are kept (default: a new temporary directory)")
+    parser.add_argument("--workers", type=int, help="render processes (default: the CPU count)")
+    parser.add_argument("--json", type=Path, help="write the full report, patches included, here")
+    args = parser.parse_args(argv)
+
+    report = scan(args.template, args.clones, args.to_ref, args.from_ref, args.scratch, args.workers)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(summary(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
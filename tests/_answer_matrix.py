@@ -0,0 +1,194 @@
+"""Every combination of the template's choice questions, rendered once per session.
+
+The option tests each rendered their own combination, serially, inside the test.
+This computes the whole set up front -- the product of the feature toggles,
+plus a sweep of each remaining choice question over the defaults -- and renders
+it through the shared ``RenderCache`` store before the first test asks, across
+a process pool when the session has one process and spread across the xdist
+workers when it has several. Tests then read the stored trees directly.
+
+Two reductions keep the set to what is actually distinct:
+
+- Before rendering, each combination is reduced to what a user can reach: a
+  question whose ``when`` is false in ``copier.yml`` is never asked, so it takes
+  its default rather than the value the combination names. ``include_codecov``
+  with ``include_actions`` off is one answer, not two.
+- After rendering, the trees are compared by content, ``.copier-answers.yml``
+  aside (it records the answers, so it differs by construction). ``report()``
+  states how many distinct trees the template has, and which answer sets
+  rendered identically: an answer that changed nothing where it was given.
+
+The trees are shared by every test that asks for them: read, never write.
+With ``COPIER_RENDER_CACHE=0`` nothing is shared or rendered up front: each
+``tree`` call renders its combination fresh, into a directory of its own.
+"""
+
+import hashlib
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import jinja2
+import yaml
+from _project_index import ProjectIndex
+from _render_cache import DEFAULT_ANSWERS
+
+# Crossed with each other: these gate files and whole directories together.
+TOGGLES = {
+    "include_actions": [True, False],
+    "include_examples": [True, False],
+    "repo_visibility": ["public", "private"],
+    "include_codecov": [True, False],
+}
+
+# Varied one at a time, over the defaults.
+SWEEPS = {
+    "license": ["Apache-2.0", "MIT", "BSD-3-Clause", "GPL-3.0", "Proprietary"],
+    "min_python_version": ["3.11", "3.12", "3.13", "3.14"],
+}
+
+_ANSWERS_FILE = ".copier-answers.yml"
+_TRUE = {"true", "1", "yes", "y", "on"}
+
+
+def _questions(template_dir):
+    """The questions of ``copier.yml``, in the order copier asks them."""
+    config = yaml.safe_load((template_dir / "copier.yml").read_text(encoding="utf-8"))
+    return {name: spec for name, spec in config.items() if not name.startswith("_") and isinstance(spec, dict)}
+
+
+def _evaluate(value, answers, kind):
+    """*value* as copier resolves it: rendered when it is a template, then cast."""
+    if isinstance(value, str):
+        # copier.yml expressions, not HTML: escaping would change what they evaluate to.
+        value = jinja2.Environment().from_string(value).render(**answers)  # noqa: S701
+        if kind == "bool":
+            return value.strip().lower() in _TRUE
+    return value
+
+
+def reachable(answers, questions):
+    """*answers* with every question its ``when`` skips set to that question's default."""
+    answers = dict(answers)
+    for name, spec in questions.items():
+        if "when" in spec and not _evaluate(spec["when"], answers, "bool"):
+            answers[name] = _evaluate(spec.get("default"), answers, spec.get("type"))
+    return answers
+
+
+def toggle_combinations():
+    """The product of ``TOGGLES``, as choices over the defaults."""
+    return [dict(zip(TOGGLES, values, strict=True)) for values in itertools.product(*TOGGLES.values())]
+
+
+def combinations():
+    """Every combination the matrix covers, as the choices it makes over the defaults."""
+    choices = toggle_combinations()
+    for name, values in SWEEPS.items():
+        choices.extend({name: value} for value in values if value != DEFAULT_ANSWERS[name])
+    return choices
+
+
+def _tree_digest(tree):
+    """Hash of every file under *tree* but the answers file."""
+    digest = hashlib.sha256()
+    for path in sorted(tree.rglob("*")):
+        relative = path.relative_to(tree).as_posix()
+        if relative == _ANSWERS_FILE or path.is_dir():
+            continue
+        digest.update(relative.encode("utf-8") + b"\0")
+        digest.update(os.readlink(path).encode("utf-8") if path.is_symlink() else path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _ensure(cache, answers):
+    # Module-level so a process pool can pickle it.
+    return cache.ensure(answers)
+
+
+class AnswerMatrix:
+    """The rendered trees of ``combinations()``, shared by the tests that read them."""
+
+    def __init__(self, cache, scratch):
+        self.cache = cache
+        # Where fresh renders go when the cache is off, one directory per call.
+        self.scratch = scratch
+        self._fresh = itertools.count()
+        self._questions = _questions(cache.template_dir)
+        self.choices = combinations()
+        self._answers = [self._resolve(choice) for choice in self.choices]
+
+    def _resolve(self, choice):
+        return reachable({**DEFAULT_ANSWERS, **choice}, self._questions)
+
+    def render_all(self):
+        """Render every distinct answer set not already in the store; nothing when the cache is off."""
+        if not self.cache.enabled:
+            return
+        distinct = list({self.cache.key(answers): answers for answers in self._answers}.values())
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            # Each worker starts at a different point of the list, so they share
+            # the renders out instead of queueing on the same lock in turn.
+            count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+            offset = int(worker.removeprefix("gw")) * len(distinct) // count
+            for answers in distinct[offset:] + distinct[:offset]:
+                self.cache.ensure(answers)
+            return
+        with ProcessPoolExecutor(max_workers=min(len(distinct), os.cpu_count() or 1)) as pool:
+            list(pool.map(_ensure, itertools.repeat(self.cache), distinct))
+
+    def tree(self, **choices) -> Path:
+        """The rendered project for *choices* over the defaults; read-only.
+
+        With the cache off, a fresh render on every call.
+        """
+        answers = self._resolve(choices)
+        if self.cache.enabled:
+            return self.cache.ensure(answers)
+        project_dir = self.scratch / f"{self.cache.key(answers)}-{next(self._fresh)}"
+        self.cache.render(answers, project_dir)
+        return project_dir
+
+    def diff(self, before, after):
+        """What changes in the rendered project from the choices *before* to *after*.
+
+        Both are choices over the defaults, as for ``tree``; the result is a
+        ``TreeDiff`` whose ``report()`` lists the files added and removed and the
+        config keys or lines that changed.
+        """
+        if self.cache.enabled:
+            return self.cache.index(self._resolve(before)).diff(self.cache.index(self._resolve(after)))
+        # One render for one answer set: two fresh renders of a dirty template
+        # record different `_commit`s and would diff against themselves.
+        first = ProjectIndex(self.tree(**before))
+        same = self._resolve(before) == self._resolve(after)
+        return first.diff(first if same else ProjectIndex(self.tree(**after)))
+
+    def report(self):
+        """How many combinations, answer sets and distinct trees the matrix came to."""
+        keys = [self.cache.key(answers) for answers in self._answers]
+        if not self.cache.enabled:
+            return (
+                f"answer matrix: {len(self.choices)} combinations, {len(set(keys))} reachable answer sets, "
+                "each rendered fresh per test (render cache off)"
+            )
+        digests = {key: _tree_digest(self.cache.store / key) for key in set(keys)}
+        # One representative choice per answer set, grouped by the tree it rendered.
+        groups = {}
+        for choice, key in zip(self.choices, keys, strict=True):
+            groups.setdefault(digests[key], {}).setdefault(key, choice)
+        lines = [
+            f"answer matrix: {len(self.choices)} combinations, {len(digests)} reachable answer sets, "
+            f"{len(groups)} distinct trees"
+        ]
+        for group in groups.values():
+            if len(group) > 1:
+                lines.append("  rendered identically: " + " = ".join(_label(choice) for choice in group.values()))
+        return "\n".join(lines)
+
+
+def _label(choice):
+    return "{" + ", ".join(f"{name}={value}" for name, value in choice.items()) + "}"
@@ -0,0 +1,235 @@
+"""Synthetic large projects for timing the generated docs tooling at scale.
+
+Every other test renders the template's own ``hello.py`` with at most one
+example notebook, which is exactly the size at which nothing in ``docs_build/``
+is slow. A regression in how the API surface, the sidebar TOC, the notebook
+index, the glossary matcher or the Markdown export *scales* passes all of them.
+This module grows a rendered project to a chosen size and times the build
+phases on it; ``test_docs_build_benchmark.py`` drives it.
+
+Results are written as JSON under ``.artifacts/benchmarks/docs_build/``, one file
+per size. A run compares itself against a baseline directory of the same files
+and reports every phase that slowed down by more than the allowed factor:
+
+- ``DOCS_BENCH_BASELINE`` -- the baseline directory (default: ``baseline/``
+  beside the results). Timings only compare on one machine, so the default
+  baseline is local and never committed.
+- ``DOCS_BENCH_UPDATE=1`` -- record this run as the new baseline.
+- ``DOCS_BENCH_MAX_SLOWDOWN`` -- the allowed factor (default ``1.5``).
+"""
+
+import html
+import json
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from _build_layout import ARTIFACTS_DIR
+from _docs_build_modules import FakePage, load_build, load_glossary, load_markers
+
+RESULTS_DIR = Path(__file__).parent.parent / ARTIFACTS_DIR / "benchmarks" / "docs_build"
+
+# A phase must be this many seconds slower, as well as proportionally slower, to
+# count as a regression: a 20 ms phase doubling is scheduler noise, not a finding.
+_NOISE_FLOOR = 0.05
+
+
+class Size(NamedTuple):
+    """How large a synthetic project is."""
+
+    submodules: int
+    classes: int
+    notebooks: int
+    terms: int
+    pages: int
+
+
+SIZES = {
+    "small": Size(submodules=5, classes=4, notebooks=5, terms=50, pages=10),
+    "medium": Size(submodules=20, classes=8, notebooks=20, terms=300, pages=40),
+    "large": Size(submodules=60, classes=15, notebooks=80, terms=1000, pages=120),
+}
+
+# The frontend bundle every marimo export inlines, large enough for the example
+# asset dedup to extract it.
+_RUNTIME = "window.marimoBench = function (x) { return x * 2; };\n" * 2000
+
+
+def _module_source(i, size):
+    """Submodule ``bench_<i>``: ``size.classes`` documented classes and a function."""
+    parts = [f'"""Synthetic module {i}."""\n']
+    for j in range(size.classes):
+        see_also = f"\n    See Also\n    --------\n    Widget{i}_{(j + 1) % size.classes} : The next widget.\n"
+        parts.append(
+            f"\n\nclass Widget{i}_{j}:\n"
+            f'    """Widget {j} of module {i}.\n\n'
+            "    Parameters\n    ----------\n    size : int\n        How big it is.\n"
+            f'{see_also}    """\n\n'
+            "    def __init__(self, size: int = 1) -> None:\n        self.size = size\n\n"
+            '    def grow(self, by: int) -> int:\n        """Return the size after growing by ``by``."""\n'
+            "        return self.size + by\n"
+        )
+    parts.append(f'\n\ndef make_{i}(size: int = 1) -> "Widget{i}_0":\n    """Build the first widget."""\n')
+    parts.append(f"    return Widget{i}_0(size)\n")
+    return "".join(parts)
+
+
+def _notebook_source(k, size, package):
+    """Example notebook ``bench_<k>``: gallery metadata and an import from the package."""
+    module = k % size.submodules
+    companion = f', "companion": "pages/bench/page_{k % size.pages}.md"' if k % 3 == 0 else ""
+    return (
+        '"""Notebook."""\n\nimport marimo\n\n__generated_with = "0.9.0"\n'
+        f'__gallery__ = {{"title": "Bench {k}", "description": "Demo {k}.", "category": "how-to", '
+        f'"section": "section-{k % 4}"{companion}}}\n'
+        "app = marimo.App()\n\n\n@app.cell\ndef _():\n"
+        f"    from {package}.bench_{module} import Widget{module}_0\n\n    return (Widget{module}_0,)\n"
+    )
+
+
+def populate(project_dir, package, size):
+    """Grow the rendered project at *project_dir* to *size*."""
+    src = project_dir / "src" / package
+    for i in range(size.submodules):
+        (src / f"bench_{i}.py").write_text(_module_source(i, size), encoding="utf-8")
+
+    examples = project_dir / "examples"
+    exports = project_dir / "docs" / "examples"
+    for k in range(size.notebooks):
+        (examples / f"bench_{k}.py").write_text(_notebook_source(k, size, package), encoding="utf-8")
+        # What `_notebooks.export` would have left, so postbuild has exports to copy.
+        (exports / f"bench_{k}").mkdir(parents=True, exist_ok=True)
+        (exports / f"bench_{k}" / "index.html").write_text(
+            f'<html><head><script type="module">{_RUNTIME}</script>'
+            f'<script type="application/json">{{"notebook": {k}}}</script></head><body>{k}</body></html>',
+            encoding="utf-8",
+        )
+
+    glossary = project_dir / "docs" / "pages" / "explanation" / "glossary.md"
+    glossary.write_text(
+        "# Glossary\n\n"
+        + "".join(f"Term {g} {{ #term-{g} .autolink }}\n: Definition of term {g}.\n\n" for g in range(size.terms)),
+        encoding="utf-8",
+    )
+
+    bench = project_dir / "docs" / "pages" / "bench"
+    bench.mkdir(parents=True, exist_ok=True)
+    (bench / "index.md").write_text("# Bench\n\n<!-- SUBPAGES -->\n", encoding="utf-8")
+    (bench / "api.md").write_text("# API\n\n<!-- API_TABLE -->\n", encoding="utf-8")
+    (bench / "gallery.md").write_text(
+        "# Gallery\n\n<!-- GALLERY -->\n\n" + "".join(f"<!-- GALLERY:section:section-{s} -->\n\n" for s in range(4)),
+        encoding="utf-8",
+    )
+    for p in range(size.pages):
+        prose = "\n\n".join(
+            f"Paragraph {n} discusses term {(p * 7 + n) % size.terms} and term {(p + n * 13) % size.terms}, "
+            f"with `term {n}` in code and a [link about term {n}](../index.md)."
+            for n in range(20)
+        )
+        (bench / f"page_{p}.md").write_text(f"# Page {p}\n\n{prose}\n", encoding="utf-8")
+
+
+def _clear_state(project_dir):
+    """Forget everything a previous run persisted, so a phase is timed cold."""
+    shutil.rmtree(project_dir / ARTIFACTS_DIR / "docs_build", ignore_errors=True)
+
+
+def _timed(func):
+    """Run *func* once; return ``(seconds, result)``."""
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def _site_page(markdown):
+    """A built page whose article holds *markdown* as paragraphs."""
+    paragraphs = "".join(f"<p>{html.escape(block)}</p>" for block in markdown.split("\n\n") if block.strip())
+    return f'<html><body><article class="md-content__inner md-typeset">{paragraphs}</article></body></html>'
+
+
+def run(project_dir, size_name):
+    """Time every phase on the project at *project_dir*; return the result record."""
+    size = SIZES[size_name]
+    phases = {}
+    previous = os.environ.get("MKDOCS_SKIP_NOTEBOOKS")
+    # Exporting runs marimo once per notebook; that is the notebooks' cost, not
+    # the tooling's, and the exports are synthesised above instead.
+    os.environ["MKDOCS_SKIP_NOTEBOOKS"] = "1"
+    try:
+        _clear_state(project_dir)
+        build = load_build(project_dir, f"bench_{size_name}")
+        phases["prebuild"], _ = _timed(build.prebuild)
+        phases["prebuild_warm"], _ = _timed(build.prebuild)
+    finally:
+        if previous is None:
+            os.environ.pop("MKDOCS_SKIP_NOTEBOOKS", None)
+        else:
+            os.environ["MKDOCS_SKIP_NOTEBOOKS"] = previous
+
+    docs_dir = project_dir / "docs"
+    sources = sorted(path.relative_to(docs_dir).as_posix() for path in docs_dir.rglob("*.md"))
+    pages = [
+        FakePage(src, "index.html" if src == "index.md" else src.removesuffix(".md") + "/index.html") for src in sources
+    ]
+
+    markers = load_markers(project_dir, f"bench_markers_{size_name}")
+    markers.reset_caches()
+    texts = {page: (docs_dir / src).read_text(encoding="utf-8") for src, page in zip(sources, pages, strict=True)}
+    phases["inject"], injected = _timed(lambda: {page: markers._inject(texts[page], page) for page in pages})
+
+    glossary = load_glossary(project_dir, f"bench_glossary_{size_name}")
+    phases["glossary"], _ = _timed(lambda: [glossary._linkify(texts[page].split("\n"), page) for page in pages])
+
+    site_dir = project_dir / "site-bench"
+    shutil.rmtree(site_dir, ignore_errors=True)
+    for page in pages:
+        target = site_dir / page.file.dest_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(_site_page(injected[page]), encoding="utf-8")
+    phases["postbuild"], _ = _timed(lambda: build.postbuild(str(site_dir)))
+
+    return {
+        "size": size_name,
+        "params": size._asdict(),
+        "pages": len(pages),
+        "python": platform.python_version(),
+        "phases": {name: round(seconds, 4) for name, seconds in phases.items()},
+    }
+
+
+def record(result):
+    """Write *result* to the results directory, and to the baseline when asked."""
+    payload = json.dumps(result, indent=2) + "\n"
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    (RESULTS_DIR / f"{result['size']}.json").write_text(payload, encoding="utf-8")
+    if os.environ.get("DOCS_BENCH_UPDATE"):
+        baseline = _baseline_dir()
+        baseline.mkdir(parents=True, exist_ok=True)
+        (baseline / f"{result['size']}.json").write_text(payload, encoding="utf-8")
+
+
+def _baseline_dir():
+    """Where baselines are read from and written to: ``DOCS_BENCH_BASELINE``, else under the results."""
+    return Path(os.environ.get("DOCS_BENCH_BASELINE") or RESULTS_DIR / "baseline")
+
+
+def regressions(result):
+    """Phases of *result* slower than the baseline allows, as readable lines.
+
+    A missing baseline, or a phase the baseline does not have, is not a
+    regression: the first run on a machine is what sets it.
+    """
+    try:
+        baseline = json.loads((_baseline_dir() / f"{result['size']}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    allowed = float(os.environ.get("DOCS_BENCH_MAX_SLOWDOWN") or 1.5)
+    found = []
+    for phase, seconds in result["phases"].items():
+        before = baseline.get("phases", {}).get(phase)
+        if before is not None and seconds > before * allowed and seconds - before > _NOISE_FLOOR:
+            found.append(f"{phase}: {seconds:.3f}s against a baseline of {before:.3f}s (allowed x{allowed})")
+    return found
@@ -0,0 +1,146 @@
+"""Isolated loaders for a generated project's docs build modules, and mkdocs stand-ins.
+
+The docs tooling imports its siblings as plain top-level names (``_api_pages``,
+``_config``, ...), which ``sys.modules`` caches globally. Every loader here
+purges them first and imports its entry module under a name unique to the
+caller, so two projects in one session never share build steps. Shared by
+every test module that drives the tooling directly.
+"""
+
+import importlib.util
+import sys
+
+from _build_layout import BUILD_DIR
+
+# The build steps the docs tooling imports as siblings, and `_artifacts` and
+# `_config`, the state and mkdocs.yml helpers they share. They are plain
+# top-level module names, so `sys.modules` caches them globally and a second
+# project would silently reuse the first project's copies -- see load_markers.
+BUILD_STEP_MODULES = (
+    "_api_pages",
+    "_notebooks",
+    "_notebook_index",
+    "_example_assets",
+    "_markdown_export",
+    "_precompress",
+    "_profile",
+    "_artifacts",
+    "_config",
+)
+
+
+def load_markers(project_dir, unique_suffix):
+    """Import a generated docs_build/_markers.py under a unique module name.
+
+    The module name must be unique per project: importing two differently
+    generated marker modules under one name makes ``sys.modules`` return the
+    first, so the second variant is never actually exercised and the test passes
+    while asserting nothing.
+
+    The same trap is wider than it looks. ``_markers.py`` puts its own directory
+    on ``sys.path`` and imports ``_api_pages`` and the shared ``_git_ref`` helper
+    as plain top-level names, which ``sys.modules`` caches globally -- so the
+    *second* project loaded in a session would get the first project's build
+    steps, pointed at the first project's source tree, while its own markers
+    module looked correctly isolated. Purging those names before each load is
+    what keeps the isolation real; ``sys.path.insert(0, ...)`` inside
+    ``_markers.py`` then resolves them against this project.
+
+    Reach the build steps through the returned module (``markers._api_pages``),
+    not by importing them directly -- that is the copy bound to this project.
+    Reset caches through the returned module (``markers.reset_caches()``) so the
+    reset lands on the very caches the marker builders read.
+    """
+    for name in (*BUILD_STEP_MODULES, "_git_ref", "_markers"):
+        sys.modules.pop(name, None)
+
+    spec = importlib.util.spec_from_file_location(
+        f"generated_markers_{unique_suffix}", project_dir / BUILD_DIR / "_markers.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_build(project_dir, unique_suffix):
+    """Import a generated docs_build/build.py under a unique module name.
+
+    ``build.py`` hosts the explicit pre/post-build steps (``prebuild`` /
+    ``postbuild``) that replaced the mkdocs ``on_pre_build`` / ``on_post_build``
+    hooks, and imports ``_api_pages``, ``_markdown_export`` and (with examples)
+    ``_notebooks`` as plain top-level names. Same isolation trap as
+    ``load_markers``: purge the build steps before each load, or a second
+    project binds the first project's steps. Reach the steps through the returned
+    module (``build._notebooks`` / ``build._markdown_export`` / ``build._api_pages``).
+    """
+    for name in (*BUILD_STEP_MODULES, "_git_ref"):
+        sys.modules.pop(name, None)
+
+    spec = importlib.util.spec_from_file_location(
+        f"generated_build_{unique_suffix}", project_dir / BUILD_DIR / "build.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_git_ref(project_dir, unique_suffix):
+    """Import a generated docs_build/_git_ref.py under a unique module name.
+
+    ``_git_ref.py`` is the single definition of "which commit is this build",
+    shared by the marker and source-link extensions. It imports no build steps,
+    but a unique module name per load matches the isolation discipline the other
+    loaders use and keeps its module cache (``_CACHE``) from bleeding between
+    projects.
+    """
+    for name in (*BUILD_STEP_MODULES, "_git_ref"):
+        sys.modules.pop(name, None)
+
+    spec = importlib.util.spec_from_file_location(
+        f"generated_git_ref_{unique_suffix}", project_dir / BUILD_DIR / "_git_ref.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_glossary(project_dir, unique_suffix):
+    """Import a generated docs_build/_glossary.py under a unique module name.
+
+    The glossary extension imports ``_current_page`` from ``_markers`` as a plain
+    top-level name, which pulls in ``_markers``, ``_git_ref`` and the build steps
+    -- all cached globally by ``sys.modules``. Purge them (``_markers`` included)
+    before each load, or a second project's glossary binds the first project's
+    modules and reads the wrong glossary file. The linker's one cache lives on
+    the module loaded here and is checked against the glossary file's stamp, so
+    nothing else needs resetting between calls.
+    """
+    for name in (*BUILD_STEP_MODULES, "_git_ref", "_markers"):
+        sys.modules.pop(name, None)
+
+    spec = importlib.util.spec_from_file_location(
+        f"generated_glossary_{unique_suffix}", project_dir / BUILD_DIR / "_glossary.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeFile:
+    """The subset of mkdocs' File the marker Preprocessor reads."""
+
+    def __init__(self, src_path, dest_path, abs_src_path=None):
+        self.src_path = src_path
+        self.dest_path = dest_path
+        # mkdocs' File exposes the on-disk source; the subpage index reads each
+        # sibling's own H1 and summary out of it.
+        self.abs_src_path = abs_src_path
+
+
+class FakePage:
+    """The subset of mkdocs' Page the marker Preprocessor and its tests touch."""
+
+    def __init__(self, src_path, dest_path):
+        self.file = FakeFile(src_path, dest_path)
+        self.meta = {}
+        self.toc = []
@@ -0,0 +1,179 @@
+"""A rendered project read once, for tests to query and for two renders to be compared.
+
+Tests used to open the same rendered files again and again -- ``pyproject.toml``
+and ``mkdocs.yml`` a few dozen times a session, every workflow YAML re-parsed
+for each gate derivation -- and each kept its own idea of how to load them.
+``ProjectIndex`` reads a project's files once, when it is rendered, and holds
+what the tests ask of them:
+
+- every file's content hash, so two renders compare file by file in one pass;
+- the text and lines of each file, decoded once;
+- the parsed YAML or TOML of each config file, parsed once on first use.
+
+The index is a snapshot: files a tool run writes into the project later (a
+``uv.lock``, a ``.coverage``) are not in it, and a test that edits a file and
+wants to see its edit must read the file, not the index.
+
+``ProjectIndex.diff`` compares two renders -- two answer sets, or one answer set
+before and after a template change -- and reports, per changed file, the config
+keys that changed or the lines that did.
+"""
+
+import difflib
+import fnmatch
+import hashlib
+import tomllib
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+import yaml
+
+_YAML_SUFFIXES = (".yml", ".yaml")
+_TOML_SUFFIXES = (".toml",)
+
+
+class _Loader(yaml.SafeLoader):
+    """``safe_load`` that tolerates the tags in ``mkdocs.yml``."""
+
+
+_Loader.add_multi_constructor("tag:yaml.org,2002:python/name:", lambda _loader, suffix, _node: suffix)
+_Loader.add_constructor("!ENV", lambda _loader, _node: None)
+
+
+class TreeDiff(NamedTuple):
+    """What differs between two indexed projects, by path relative to the project root."""
+
+    added: list[str]
+    removed: list[str]
+    # path -> the config keys (dotted) or the unified-diff hunk headers that differ
+    changed: dict[str, list[str]]
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def report(self):
+        """The difference as readable lines, one section per kind of change."""
+        lines = [f"+ {path}" for path in self.added]
+        lines += [f"- {path}" for path in self.removed]
+        for path, details in self.changed.items():
+            lines.append(f"~ {path}")
+            lines.extend(f"    {detail}" for detail in details)
+        return "\n".join(lines)
+
+
+def _key_changes(before, after, prefix=""):
+    """Dotted paths of the keys whose values differ between two parsed configs."""
+    if isinstance(before, dict) and isinstance(after, dict):
+        changes = []
+        for key in sorted(before.keys() | after.keys(), key=str):
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if key not in after:
+                changes.append(f"{path} removed")
+            elif key not in before:
+                changes.append(f"{path} added")
+            else:
+                changes.extend(_key_changes(before[key], after[key], path))
+        return changes
+    return [] if before == after else [prefix or "(document)"]
+
+
+class ProjectIndex:
+    """The files of one rendered project, read once."""
+
+    def __init__(self, project_dir: Path):
+        project_dir = Path(project_dir)
+        self._content = {
+            path.relative_to(project_dir).as_posix(): path.read_bytes()
+            for path in sorted(project_dir.rglob("*"))
+            if path.is_file() and ".git" not in path.relative_to(project_dir).parts
+        }
+        self.hashes = {path: hashlib.sha256(data).hexdigest() for path, data in self._content.items()}
+        self._configs = {}
+        self._lines = {}
+
+    def __contains__(self, path):
+        return path in self._content
+
+    def paths(self, pattern="**"):
+        """Indexed paths matching the glob *pattern* (``*`` does not cross ``/``)."""
+        return [path for path in self._content if fnmatch.fnmatchcase(path, pattern) and _same_depth(path, pattern)]
+
+    def content(self, path):
+        """The file's content as rendered."""
+        return self._content[path]
+
+    def text(self, path):
+        """The file's content as rendered, decoded."""
+        return self._texts[path]
+
+    def lines(self, path):
+        """The file's lines as rendered, without their line endings."""
+        if path not in self._lines:
+            self._lines[path] = self.text(path).splitlines()
+        return self._lines[path]
+
+    def grep(self, needle, pattern="**"):
+        """``(path, line number, line)`` for every line containing *needle* in files matching *pattern*."""
+        return [
+            (path, number, line)
+            for path in self.paths(pattern)
+            if path in self._texts
+            for number, line in enumerate(self.lines(path), start=1)
+            if needle in line
+        ]
+
+    def config(self, path):
+        """The parsed YAML or TOML of a config file, parsed on first use."""
+        if path not in self._configs:
+            if path.endswith(_TOML_SUFFIXES):
+                self._configs[path] = tomllib.loads(self.text(path))
+            elif path.endswith(_YAML_SUFFIXES):
+                self._configs[path] = yaml.load(self.text(path), Loader=_Loader)  # noqa: S506
+            else:
+                raise ValueError(f"{path} is not a YAML or TOML file")
+        return self._configs[path]
+
+    def root_files(self, directory=""):
+        """Names of the files directly in *directory* (default: the project root)."""
+        prefix = f"{directory}/" if directory else ""
+        return sorted(
+            path[len(prefix) :] for path in self._content if path.startswith(prefix) and "/" not in path[len(prefix) :]
+        )
+
+    @cached_property
+    def _texts(self):
+        texts = {}
+        for path, data in self._content.items():
+            try:
+                texts[path] = data.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+        return texts
+
+    def diff(self, other):
+        """What changed from this project to *other*, compared in one pass over the hashes."""
+        changed = {}
+        for path in sorted(self.hashes.keys() & other.hashes.keys()):
+            if self.hashes[path] == other.hashes[path]:
+                continue
+            if path.endswith(_YAML_SUFFIXES + _TOML_SUFFIXES):
+                details = _key_changes(self.config(path), other.config(path))
+            elif path in self._texts and path in other._texts:
+                details = [
+                    line.strip()
+                    for line in difflib.unified_diff(self.lines(path), other.lines(path), n=0, lineterm="")
+                    if line.startswith("@@")
+                ]
+            else:
+                details = []
+            changed[path] = details or ["content differs"]
+        return TreeDiff(
+            added=sorted(other.hashes.keys() - self.hashes.keys()),
+            removed=sorted(self.hashes.keys() - other.hashes.keys()),
+            changed=changed,
+        )
+
+
+def _same_depth(path, pattern):
+    return "**" in pattern or path.count("/") == pattern.count("/")
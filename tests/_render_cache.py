@@ -0,0 +1,190 @@
+"""Render each distinct set of answers once per session, and copy it for every test.
+
+The function-scoped ``copie*`` fixtures hand every test its own project, and most
+of those projects are identical: a hundred-odd tests ask for the default answers
+or flip one toggle. ``run_copy`` clones the template repository and renders every
+file each time, which dominated the suite's wall time. This renders into a
+pristine store under a key of (answers, template tree, copier version) and gives
+each test a copy of the stored tree.
+
+The copy is a real copy, not a hardlink farm: tests edit generated files in
+place (``write_text`` truncates the shared inode), and one test editing the store
+would silently change what every later test renders. ``shutil.copytree`` copies
+each file in-kernel, which is a small fraction of what a render costs. Readers
+that never write -- ``ensure`` and ``index`` -- get the stored tree itself, with
+no copy at all.
+
+The store is shared by the xdist workers of one session, so a render is guarded
+by a per-key lock file, created with ``O_EXCL`` so that it works on Windows as
+well, and published with an atomic rename: a worker either finds a finished tree
+or waits for the one rendering it. Set ``COPIER_RENDER_CACHE=0`` to render every
+project fresh.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import copier
+from _project_index import ProjectIndex
+from copier import run_copy
+
+_DISABLE_ENV = "COPIER_RENDER_CACHE"
+# A render takes seconds; a lock file this old was left by a worker that died holding it.
+_STALE_LOCK_SECONDS = 10 * 60
+
+# What the function-scoped `copie*` fixtures answer unless a test overrides it.
+DEFAULT_ANSWERS = {
+    "project_name": "Test Project",
+    "project_slug": "test-project",
+    "package_name": "test_project",
+    "description": "A test project",
+    "author_name": "Test Author",
+    "author_email": "test@example.com",
+    "github_username": "testuser",
+    "code_owner": "@testowner",
+    "version": "0.1.0",
+    "min_python_version": "3.11",
+    "max_python_version": "3.14",
+    "license": "MIT",
+    "repo_visibility": "public",
+    "include_actions": True,
+    "include_examples": True,
+    "include_codecov": True,
+    "renovate_preset": "",
+}
+
+
+def _template_digest(template_dir: Path) -> str:
+    """Hash of everything a render reads: the tracked and untracked template files.
+
+    Ignored files are left out because copier renders from a git clone, which
+    never sees them -- a stray ``__pycache__`` under ``template/`` must not miss
+    the cache. ``HEAD`` is included for the ``_commit`` the answers file records.
+    """
+    listed = subprocess.run(
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "copier.yml", "template"],
+        cwd=template_dir,
+        capture_output=True,
+        check=True,
+    ).stdout
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=template_dir, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    digest = hashlib.sha256(f"{copier.__version__}\0{head}\0".encode())
+    for name in sorted(set(listed.decode("utf-8").split("\0")) - {""}):
+        path = template_dir / name
+        digest.update(name.encode("utf-8") + b"\0")
+        # A file deleted but not yet staged is still listed by --cached.
+        if path.is_file():
+            digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def _locked(lock_path: Path):
+    """Hold *lock_path* for the body: whoever creates the file owns the lock.
+
+    ``fcntl`` does not exist on Windows, and the fast tests run there; an
+    exclusive create is atomic on every platform. A lock older than
+    ``_STALE_LOCK_SECONDS`` is removed rather than waited on forever.
+    """
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - lock_path.stat().st_mtime > _STALE_LOCK_SECONDS
+            except FileNotFoundError:
+                continue
+            if stale:
+                lock_path.unlink(missing_ok=True)
+            else:
+                time.sleep(0.05)
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+class RenderCache:
+    """A session-wide store of rendered projects, one per distinct set of answers."""
+
+    def __init__(self, template_dir: Path, store: Path):
+        self.template_dir = template_dir
+        self.store = store
+        self.enabled = os.environ.get(_DISABLE_ENV, "1") != "0"
+        self._template_key = None
+        self._indexes = {}
+
+    def key(self, answers: dict) -> str:
+        """The store key of *answers* under the current template tree."""
+        if self._template_key is None:
+            self._template_key = _template_digest(self.template_dir)
+        payload = json.dumps(answers, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{self._template_key}\0{payload}".encode()).hexdigest()[:32]
+
+    def ensure(self, answers: dict) -> Path:
+        """The stored render of *answers*, rendering it first if no process has.
+
+        The tree is shared: read it, never write to it.
+        """
+        return self._ensure(answers)[0]
+
+    def index(self, answers: dict) -> ProjectIndex:
+        """The `ProjectIndex` of the stored render of *answers*, built once per process."""
+        key = self.key(answers)
+        if key not in self._indexes:
+            self._indexes[key] = ProjectIndex(self.ensure(answers))
+        return self._indexes[key]
+
+    def _ensure(self, answers: dict):
+        key = self.key(answers)
+        rendered = self.store / key
+        worker = None
+        if not rendered.is_dir():
+            self.store.mkdir(parents=True, exist_ok=True)
+            with _locked(self.store / f"{key}.lock"):
+                if not rendered.is_dir():
+                    staging = self.store / f"{key}.tmp-{os.getpid()}"
+                    shutil.rmtree(staging, ignore_errors=True)
+                    try:
+                        worker = _run_copy(self.template_dir, staging, answers)
+                    except BaseException:
+                        shutil.rmtree(staging, ignore_errors=True)
+                        raise
+                    staging.rename(rendered)
+        return rendered, worker
+
+    def render(self, answers: dict, project_dir: Path):
+        """Put the project *answers* render at *project_dir*; return copier's worker or None.
+
+        The worker is returned only when this call rendered; a copy of a stored
+        render has none.
+        """
+        if not self.enabled:
+            return _run_copy(self.template_dir, project_dir, answers)
+
+        rendered, worker = self._ensure(answers)
+        shutil.copytree(rendered, project_dir, symlinks=True, dirs_exist_ok=True)
+        return worker
+
+
+def _run_copy(template_dir: Path, project_dir: Path, answers: dict):
+    # Use HEAD to get latest changes
+    return run_copy(
+        str(template_dir),
+        str(project_dir),
+        data=answers,
+        defaults=True,
+        overwrite=True,
+        unsafe=True,
+        vcs_ref="HEAD",
+    )
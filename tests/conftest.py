@@ -1,47 +1,41 @@
 """Pytest configuration for template tests."""
 
+import os
 from pathlib import Path
 
 import pytest
+from _answer_matrix import AnswerMatrix
+from _project_index import ProjectIndex
+from _render_cache import DEFAULT_ANSWERS, RenderCache
 from copier import run_copy
 
+# The answer matrix's report, for the terminal summary. Under xdist each worker
+# that built the matrix sends its report back through `workeroutput`.
+_MATRIX_REPORT = pytest.StashKey[str]()
+
 
 class CopierTestFixture:
     """Helper class for testing copier templates."""
 
-    def __init__(self, template_dir: Path, tmp_path: Path):
+    def __init__(self, template_dir: Path, tmp_path: Path, cache: RenderCache | None = None):
         self.template_dir = template_dir
         self.tmp_path = tmp_path
+        self.cache = cache
 
     def copy(self, extra_answers: dict | None = None):
         """Copy the template with given answers."""
         project_dir = self.tmp_path / "test-project"
 
-        # Default answers
-        answers = {
-            "project_name": "Test Project",
-            "project_slug": "test-project",
-            "package_name": "test_project",
-            "description": "A test project",
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "github_username": "testuser",
-            "code_owner": "@testowner",
-            "version": "0.1.0",
-            "min_python_version": "3.11",
-            "max_python_version": "3.14",
-            "license": "MIT",
-            "repo_visibility": "public",
-            "include_actions": True,
-            "include_examples": True,
-            "include_codecov": True,
-            "renovate_preset": "",
-        }
+        answers = dict(DEFAULT_ANSWERS)
 
         # Override with extra answers
         if extra_answers:
             answers.update(extra_answers)
 
+        if self.cache is not None:
+            result = self.cache.render(answers, project_dir)
+            return CopierResult(project_dir=project_dir, result=result, index=self.cache.index(answers))
+
         # Run copier - use HEAD to get latest changes
         result = run_copy(
             str(self.template_dir),
@@ -56,32 +50,26 @@ class CopierTestFixture:
         return CopierResult(project_dir=project_dir, result=result)
 
 
-def _snapshot_shipped_files(project_dir: Path) -> list[str]:
+def _snapshot_shipped_files(index: ProjectIndex) -> list[str]:
     """Files the template rendered, at the project root and the top of `.github/`.
 
     Paths are relative to the project, so a `.github/` entry is distinguishable from
     a root one of the same name.
     """
-    if not project_dir.exists():
-        return []
-
-    files = [path.name for path in project_dir.iterdir() if path.is_file()]
-
-    github = project_dir / ".github"
-    if github.is_dir():
-        files += [f".github/{path.name}" for path in github.iterdir() if path.is_file()]
-
-    return sorted(files)
+    return sorted(index.root_files() + [f".github/{name}" for name in index.root_files(".github")])
 
 
 class CopierResult:
     """Result of a copier template copy operation."""
 
-    def __init__(self, project_dir: Path, result):
+    def __init__(self, project_dir: Path, result, index: ProjectIndex | None = None):
         self.project_dir = project_dir
         self.result = result
         self.exit_code = 0 if project_dir.exists() else 1
         self.exception = None
+        # The rendered files, read once now; see `_project_index`. A render served
+        # from the render cache shares the index of the stored tree it was copied from.
+        self.index = index if index is not None else ProjectIndex(project_dir)
         # What the template actually rendered into the project root, captured now.
         #
         # Session-scoped projects are shared, and the tests that run tooling inside one
@@ -100,7 +88,7 @@ class CopierResult:
         # parity while nothing measured the controls at all. Only the top level is
         # taken; `workflows/`, `skills/` and `codeql/` are covered by other gate shapes
         # or are not controls.
-        self.rendered_root_files = _snapshot_shipped_files(project_dir)
+        self.rendered_root_files = _snapshot_shipped_files(self.index)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -129,6 +117,33 @@ def session_projects_dir(tmp_path_factory):
     return tmp_path_factory.mktemp("session_projects")
 
 
+@pytest.fixture(scope="session")
+def render_cache(tmp_path_factory):
+    """Session-scoped: the store the function-scoped `copie*` fixtures render through.
+
+    Under xdist every worker has its own base temp directory; the store goes in
+    their common parent so a render done by one worker serves all of them.
+    """
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+    return RenderCache(Path(__file__).parent.parent, root / "render_cache")
+
+
+@pytest.fixture(scope="session")
+def answer_matrix(render_cache, request, tmp_path_factory):
+    """Session-scoped: every combination in `_answer_matrix`, rendered up front.
+
+    `answer_matrix.tree(include_actions=False, ...)` is the rendered project for
+    those choices over the defaults. The tree is shared by every test that reads
+    it, so tests must not write to it; use `copie` to get a project to modify.
+    """
+    matrix = AnswerMatrix(render_cache, tmp_path_factory.mktemp("answer_matrix"))
+    matrix.render_all()
+    request.config.stash[_MATRIX_REPORT] = matrix.report()
+    return matrix
+
+
 @pytest.fixture(scope="session")
 def copie_session_default(session_projects_dir):
     """Session-scoped: Generated project with DEFAULT values.
@@ -275,7 +290,7 @@ def copie_session_custom(session_projects_dir):
 
 
 @pytest.fixture
-def copie(tmp_path):
+def copie(tmp_path, render_cache):
     """Fixture that provides a copier test helper.
 
     This is a function-scoped fixture that generates a fresh project
@@ -288,20 +303,23 @@ def copie(tmp_path):
     - copie_session_default
     - copie_session_minimal
     - copie_session_custom
+
+    Renders go through `render_cache`, so a test gets its own copy of a project
+    that was rendered once per distinct set of answers.
     """
     template_dir = Path(__file__).parent.parent
-    return CopierTestFixture(template_dir, tmp_path)
+    return CopierTestFixture(template_dir, tmp_path, render_cache)
 
 
 @pytest.fixture
-def copie_custom_values(tmp_path):
+def copie_custom_values(tmp_path, render_cache):
     """Fixture that provides a copier helper with custom (non-default) values.
 
     Useful for testing that template variables propagate correctly
     when users provide their own values.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, render_cache)
 
     # Pre-configured with custom values
     fixture.custom_answers = {
@@ -323,14 +341,14 @@ def copie_custom_values(tmp_path):
 
 
 @pytest.fixture
-def copie_edge_cases(tmp_path):
+def copie_edge_cases(tmp_path, render_cache):
     """Fixture that provides a copier helper with edge case values.
 
     Tests empty strings, unicode, and special characters to ensure
     robust template handling.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, render_cache)
 
     # Pre-configured with edge case values
     fixture.edge_case_answers = {
@@ -349,13 +367,13 @@ def copie_edge_cases(tmp_path):
 
 
 @pytest.fixture
-def copie_minimal(tmp_path):
+def copie_minimal(tmp_path, render_cache):
     """Fixture that provides minimal configuration (all optional features disabled).
 
     Useful for testing the minimal viable generated project.
     """
     template_dir = Path(__file__).parent.parent
-    fixture = CopierTestFixture(template_dir, tmp_path)
+    fixture = CopierTestFixture(template_dir, tmp_path, render_cache)
 
     fixture.minimal_answers = {
         "project_name": "Minimal Project",
@@ -372,6 +390,44 @@ def copie_minimal(tmp_path):
     return fixture
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip the scaling benchmarks unless the run selects them by marker.
+
+    They take minutes and time a machine rather than check a behaviour, so an
+    ordinary `pytest` -- and `just test`, which runs everything -- must not pay
+    for them. `-m benchmark` (or any expression naming the marker) opts in.
+    """
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmark: select with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    """Hand a worker's answer-matrix report to the xdist controller."""
+    report = session.config.stash.get(_MATRIX_REPORT, None)
+    if report and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["answer_matrix"] = report
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the answer-matrix report a worker built (xdist controller only)."""
+    report = getattr(node, "workeroutput", {}).get("answer_matrix")
+    if report:
+        node.config.stash[_MATRIX_REPORT] = report
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Say how many distinct trees the answer matrix rendered, when a test used it."""
+    report = config.stash.get(_MATRIX_REPORT, None)
+    if report and not hasattr(config, "workeroutput"):
+        terminalreporter.write_sep("-", "answer matrix")
+        terminalreporter.write_line(report)
+
+
 # Constants for test configuration
 SUBPROCESS_TIMEOUT = 120  # Timeout for subprocess tests in seconds
 INTEGRATION_TEST_MARKER = "integration"  # Marker for integration tests
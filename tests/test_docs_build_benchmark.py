@@ -0,0 +1,36 @@
+"""Scaling benchmarks for the generated docs tooling.
+
+Opt-in: these are skipped unless selected with ``-m benchmark`` (``just
+bench-docs``). Each size grows a copy of the default project (see
+``_docs_benchmark.py``), times prebuild, marker injection on every page, the
+glossary pass and postbuild, writes the timings under
+``.artifacts/benchmarks/docs_build/`` and fails on a phase that slowed down
+against the stored baseline by more than ``DOCS_BENCH_MAX_SLOWDOWN``.
+"""
+
+import shutil
+
+import _docs_benchmark
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+
+@pytest.mark.parametrize("size_name", list(_docs_benchmark.SIZES))
+def test_docs_build_scales(copie_session_default, tmp_path, size_name):
+    """Time every build phase at one project size and compare it with the baseline."""
+    project_dir = tmp_path / "project"
+    shutil.copytree(copie_session_default.project_dir, project_dir, symlinks=True)
+    _docs_benchmark.populate(project_dir, "test_project", _docs_benchmark.SIZES[size_name])
+
+    result = _docs_benchmark.run(project_dir, size_name)
+    _docs_benchmark.record(result)
+
+    size = _docs_benchmark.SIZES[size_name]
+    generated = project_dir / "docs" / "pages" / "api" / "generated"
+    assert len(list(generated.glob("test_project.bench_*.md"))) >= size.submodules * size.classes, (
+        "the synthetic modules did not reach the API pages, so prebuild timed less than it claims"
+    )
+    assert result["pages"] > size.pages
+    slower = _docs_benchmark.regressions(result)
+    assert not slower, f"{size_name} project slowed down:\n" + "\n".join(slower)
@@ -0,0 +1,222 @@
+"""Tests for the fan-out skill's fleet scripts, against a miniature template and fleet.
+
+The scripts exist to measure a release before it reaches the real seven repos, so
+they are tested the same way they are used: a local template repository with two
+tagged releases, and local clones generated from the first. Everything is offline
+and small enough that a render takes a fraction of a second.
+"""
+
+import importlib.util
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from copier import run_copy
+
+_SCRIPTS = Path(__file__).resolve().parent.parent / ".github" / "skills" / "fan-out-to-packages" / "scripts"
+
+
+def _load_script(name):
+    """Import one of the skill's scripts; they import each other as top-level names."""
+    if str(_SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(_SCRIPTS))
+    sys.modules.pop(name, None)
+    spec = importlib.util.spec_from_file_location(name, _SCRIPTS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def _write(root, files):
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def _release(template, tag, files):
+    _write(template, files)
+    _git(template, "add", "-A")
+    _git(template, "commit", "-q", "-m", tag)
+    _git(template, "tag", tag)
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """A template tagged v1 and v2, and three clones generated at v1.
+
+    ``alpha`` and ``beta`` answered alike; ``gamma`` turned ``extras`` on. Between the
+    releases the template changes ``config.toml``, ``README.md``, the binary
+    ``logo.png`` and the skip-listed ``keep.txt``. ``alpha`` has edited
+    ``config.toml`` and ``keep.txt`` locally.
+    """
+    template = tmp_path / "template"
+    template.mkdir()
+    _git(template, "init", "-q")
+    _release(
+        template,
+        "v1",
+        {
+            "copier.yml": yaml.safe_dump({
+                "_skip_if_exists": ["keep.txt"],
+                "extras": {"type": "bool", "default": False},
+            }),
+            "{{ _copier_conf.answers_file }}.jinja": "{{ _copier_answers | to_nice_yaml -}}\n",
+            "README.md.jinja": "# Demo\n{% if extras %}With extras.\n{% endif %}",
+            "config.toml": "a = 1\nb = 2\n",
+            "keep.txt": "template keep v1\n",
+            "logo.png": "\x00PNG v1\n",
+        },
+    )
+    _release(
+        template,
+        "v2",
+        {
+            "config.toml": "a = 1\nb = 3\n",
+            "README.md.jinja": "# Demo\n\nUpdated.\n",
+            "keep.txt": "template keep v2\n",
+            "logo.png": "\x00PNG v2\n",
+        },
+    )
+
+    clones = {}
+    for name, extras in (("alpha", False), ("beta", False), ("gamma", True)):
+        clone = tmp_path / "fleet" / name
+        run_copy(str(template), str(clone), data={"extras": extras}, vcs_ref="v1", defaults=True, quiet=True)
+        _git(clone, "init", "-q")
+        clones[name] = clone
+    _write(clones["alpha"], {"config.toml": "a = 1\nb = 2\nlocal = true\n", "keep.txt": "our own keep\n"})
+    for clone in clones.values():
+        _git(clone, "add", "-A")
+        _git(clone, "commit", "-q", "-m", "generated")
+    return template, clones
+
+
+def test_drift_scan_renders_each_answer_set_once_and_reports_drift_by_content(fleet, tmp_path):
+    """Two answer sets at two refs is four renders, and only alpha's edit is drift."""
+    template, clones = fleet
+    drift_scan = _load_script("drift_scan")
+
+    report = drift_scan.scan(template, list(clones.values()), "v2", scratch=tmp_path / "scratch", workers=2)
+
+    assert report["renders"] == 4, "alpha and beta answered alike and must share their renders"
+    alpha, beta = report["repos"]["alpha"], report["repos"]["beta"]
+    assert alpha["answer_set"] == beta["answer_set"] != report["repos"]["gamma"]["answer_set"]
+    assert alpha["from"] == "v1", "the baseline defaults to the repo's own _commit"
+
+    config = alpha["files"]["config.toml"]
+    assert (config["template"], config["local"], config["added"], config["removed"]) == ("modified", "drifted", 1, 0)
+    assert "+local = true" in config["diff"]
+    assert alpha["files"]["README.md"]["local"] == "pristine"
+    assert all(entry["local"] == "pristine" for entry in beta["files"].values())
+    assert ".copier-answers.yml" not in alpha["files"], "the answers file differs across any pair by construction"
+    assert "config.toml  (+1 -0)" in drift_scan.summary(report)
+
+
+def test_batch_update_reports_conflicts_overwrites_and_skips_per_repo(fleet, tmp_path):
+    """Each clone updates offline in its own worktree, and the report names what needs a human."""
+    template, clones = fleet
+    batch_update = _load_script("batch_update")
+    # gamma points at a remote the update must not reach, and has its own logo,
+    # which copier replaces without a conflict.
+    answers = clones["gamma"] / ".copier-answers.yml"
+    remote = "_src_path: https://github.com/example/template.git"
+    answers.write_text(re.sub(r"^_src_path:.*$", remote, answers.read_text(encoding="utf-8"), flags=re.M))
+    (clones["gamma"] / "logo.png").write_bytes(b"\x00PNG gamma\n")
+    _git(clones["gamma"], "commit", "-q", "-am", "own logo")
+    heads = {name: _git(clone, "rev-parse", "HEAD") for name, clone in clones.items()}
+
+    report = batch_update.batch_update(template, list(clones.values()), "v2", scratch=tmp_path / "scratch", workers=2)
+
+    assert report["renders"] == 4, "the sweeps share drift_scan's renders across alike answers"
+    alpha, beta, gamma = (report["repos"][name] for name in ("alpha", "beta", "gamma"))
+    assert {repo["status"] for repo in (alpha, beta, gamma)} == {"updated"}
+    assert alpha["conflicted"] == ["config.toml"], "alpha's local line sits on the line v2 changes"
+    assert alpha["rej"] == [], "conflicts stay inline; --conflict rej is never passed"
+    assert alpha["skip_if_exists"] == {"kept": ["keep.txt"], "recreated": []}
+    assert (beta["conflicted"], beta["overwritten"]) == ([], [])
+    assert beta["changed"]["logo.png"] == "M"
+    assert gamma["overwritten"] == ["logo.png"], "the local logo was replaced with no conflict"
+
+    gamma_tree = Path(gamma["worktree"])
+    assert (gamma_tree / "logo.png").read_bytes() == b"\x00PNG v2\n"
+    assert remote in (gamma_tree / ".copier-answers.yml").read_text(encoding="utf-8")
+    assert "_commit: v2" in (gamma_tree / ".copier-answers.yml").read_text(encoding="utf-8")
+    assert _git(gamma_tree, "rev-parse", "HEAD") == heads["gamma"], "the offline redirect is reset away"
+    assert {name: _git(clone, "rev-parse", "HEAD") for name, clone in clones.items()} == heads
+    assert not _git(clones["alpha"], "status", "--porcelain"), "the clones themselves are never touched"
+    assert "overwritten  logo.png" in batch_update.summary(report)
+
+
+@pytest.mark.parametrize(("script", "entry"), [("drift_scan", "scan"), ("batch_update", "batch_update")])
+def test_fan_out_scripts_refuse_clones_that_share_a_directory_name(fleet, tmp_path, script, entry):
+    """Reports and worktrees are keyed by directory name, so a second ``alpha`` is refused up front."""
+    template, clones = fleet
+    twin = tmp_path / "elsewhere" / "alpha"
+    shutil.copytree(clones["alpha"], twin)
+
+    with pytest.raises(ValueError, match="distinct directory names") as excinfo:
+        getattr(_load_script(script), entry)(template, [clones["alpha"], twin], "v2", scratch=tmp_path / "scratch")
+
+    assert str(twin) in str(excinfo.value)
+    assert not (tmp_path / "scratch" / "renders").exists(), "nothing is rendered before the names are checked"
+
+
+def test_batch_update_status_keys_a_rename_by_its_new_path(tmp_path):
+    """``-z`` writes a rename's source as a field of its own, which is not an entry."""
+    batch_update = _load_script("batch_update")
+    _git(tmp_path, "init", "-q")
+    _write(tmp_path, {"old.txt": "moved\n", "kept.txt": "kept\n"})
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "mv", "old.txt", "new.txt")
+    _write(tmp_path, {"kept.txt": "edited\n", "extra.txt": "untracked\n"})
+
+    assert batch_update._status(tmp_path) == {"new.txt": "R ", "kept.txt": " M", "extra.txt": "??"}
+
+
+def test_batch_update_quotes_a_template_path_yaml_would_misread(fleet, tmp_path):
+    """``_src_path`` is redirected to the local template as a quoted scalar, whatever its path holds."""
+    template, clones = fleet
+    odd = shutil.copytree(template, tmp_path / "~templates: v2 #local")
+    batch_update = _load_script("batch_update")
+
+    report = batch_update.batch_update(odd, [clones["beta"]], "v2", scratch=tmp_path / "scratch", workers=1)
+
+    beta = report["repos"]["beta"]
+    assert beta["status"] == "updated", beta.get("error")
+    assert "_commit: v2" in (Path(beta["worktree"]) / ".copier-answers.yml").read_text(encoding="utf-8")
+
+
+def test_drift_scan_render_losing_the_publish_race_returns_the_winner(tmp_path, monkeypatch):
+    """Two runs sharing ``--scratch`` can render one key at once; the second rename is not an error."""
+    import copier
+
+    drift_scan = _load_script("drift_scan")
+    destination = tmp_path / "renders" / "key"
+
+    def run_copy(template, staging, **_kwargs):
+        _write(Path(staging), {"README.md": "ours\n"})
+        # The other run publishes the same key while this one is still rendering.
+        _write(destination, {"README.md": "theirs\n"})
+
+    monkeypatch.setattr(copier, "run_copy", run_copy)
+
+    assert drift_scan._render(tmp_path / "template", "v1", {}, destination) == destination
+    assert (destination / "README.md").read_text(encoding="utf-8") == "theirs\n"
+    assert [path.name for path in destination.parent.iterdir()] == ["key"], "the losing staging tree was left behind"
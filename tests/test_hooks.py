@@ -2,7 +2,7 @@
 
 import pytest
 from _build_layout import BUILD_DIR, site_path
-from test_template import _load_build, _load_git_ref
+from _docs_build_modules import load_build, load_git_ref
 
 
 @pytest.fixture
@@ -70,7 +70,7 @@ def test_hooks_file_created_without_examples(copie_without_examples):
 
 def test_on_post_build_copies_markdown(copie_with_examples, tmp_path):
     """The postbuild step copies markdown files into the built site."""
-    build = _load_build(copie_with_examples.project_dir, "post_md")
+    build = load_build(copie_with_examples.project_dir, "post_md")
 
     site_dir = tmp_path / "site"
     site_dir.mkdir()
@@ -145,7 +145,7 @@ def test_on_pre_build_exports_notebooks(copie_with_examples):
 
 def test_on_post_build_handles_missing_examples_dir(copie_with_examples, tmp_path):
     """postbuild gracefully handles a missing examples directory."""
-    build = _load_build(copie_with_examples.project_dir, "post_missing")
+    build = load_build(copie_with_examples.project_dir, "post_missing")
 
     site_dir = tmp_path / "site"
     site_dir.mkdir()
@@ -208,7 +208,7 @@ def test_on_post_build_converts_html_to_markdown(copie_with_examples, tmp_path):
 
 def test_on_post_build_copies_llms_txt_if_exists(copie_with_examples, tmp_path):
     """postbuild copies llms.txt if it exists."""
-    build = _load_build(copie_with_examples.project_dir, "post_llms")
+    build = load_build(copie_with_examples.project_dir, "post_llms")
 
     # Create llms.txt in docs
     docs_dir = copie_with_examples.project_dir / "docs"
@@ -228,7 +228,7 @@ def test_on_post_build_copies_llms_txt_if_exists(copie_with_examples, tmp_path):
 
 def test_on_post_build_removes_legacy_llm_directory(copie_with_examples, tmp_path):
     """postbuild removes a legacy llm/ directory."""
-    build = _load_build(copie_with_examples.project_dir, "post_legacy")
+    build = load_build(copie_with_examples.project_dir, "post_legacy")
 
     site_dir = tmp_path / "site"
     site_dir.mkdir()
@@ -246,7 +246,7 @@ def test_on_post_build_removes_legacy_llm_directory(copie_with_examples, tmp_pat
 
 def test_html_to_markdown_conversion_preserves_structure(copie_with_examples):
     """HTML to markdown conversion preserves document structure."""
-    build = _load_build(copie_with_examples.project_dir, "h2m_struct")
+    build = load_build(copie_with_examples.project_dir, "h2m_struct")
 
     # Test HTML with various elements
     test_html = """
@@ -273,7 +273,7 @@ def test_html_to_markdown_conversion_preserves_structure(copie_with_examples):
 
 def test_html_to_markdown_handles_tables(copie_with_examples):
     """HTML to markdown conversion handles tables correctly."""
-    build = _load_build(copie_with_examples.project_dir, "h2m_tables")
+    build = load_build(copie_with_examples.project_dir, "h2m_tables")
 
     test_html = """
     <table>
@@ -393,7 +393,7 @@ def test_get_git_ref_prefers_readthedocs_over_missing_git(copie_with_examples, m
     usable ``.git`` at all -- which is exactly when the old implementation
     reported ``main`` for a build that was really at a known commit.
     """
-    git_ref = _load_git_ref(copie_with_examples.project_dir, f"gitref_{expected.replace('.', '_')}")
+    git_ref = load_git_ref(copie_with_examples.project_dir, f"gitref_{expected.replace('.', '_')}")
 
     for var in ("READTHEDOCS_GIT_COMMIT_HASH", "READTHEDOCS_GIT_IDENTIFIER"):
         monkeypatch.delenv(var, raising=False)
@@ -1,5 +1,6 @@
 """Tests for template option combinations and integration scenarios."""
 
+import _answer_matrix
 import pytest
 import yaml
 from _build_layout import BUILD_DIR
@@ -14,19 +15,15 @@ from _build_layout import BUILD_DIR
         (False, False),
     ],
 )
-def test_option_combinations(copie, include_examples, include_actions):
+def test_option_combinations(answer_matrix, include_examples, include_actions):
     """Test all combinations of include_examples and include_actions."""
-    result = copie.copy(
-        extra_answers={
-            "include_examples": include_examples,
-            "include_actions": include_actions,
-        },
+    project_dir = answer_matrix.tree(
+        include_examples=include_examples,
+        include_actions=include_actions,
     )
 
-    assert result.exit_code == 0
-
     # Test examples-related files
-    examples_dir = result.project_dir / "examples"
+    examples_dir = project_dir / "examples"
     if include_examples:
         assert examples_dir.is_dir(), "examples/ should exist when include_examples=True"
         assert (examples_dir / "hello.py").is_file(), "examples/hello.py should exist"
@@ -34,7 +31,7 @@ def test_option_combinations(copie, include_examples, include_actions):
         assert not examples_dir.exists(), "examples/ should not exist when include_examples=False"
 
     # Test GitHub Actions workflows
-    workflows_dir = result.project_dir / ".github" / "workflows"
+    workflows_dir = project_dir / ".github" / "workflows"
     if include_actions:
         assert workflows_dir.is_dir(), ".github/workflows/ should exist when include_actions=True"
         assert (workflows_dir / "tests.yml").is_file(), "tests.yml should exist"
@@ -42,9 +39,9 @@ def test_option_combinations(copie, include_examples, include_actions):
         assert not workflows_dir.exists(), ".github/workflows/ should not exist when include_actions=False"
 
     # Test build.py content (hooks.py was replaced by explicit build steps)
-    build_file = result.project_dir / BUILD_DIR / "build.py"
+    build_file = project_dir / BUILD_DIR / "build.py"
     assert build_file.is_file(), "docs_build/build.py should always exist"
-    assert not (result.project_dir / BUILD_DIR / "hooks.py").exists(), "hooks.py should be gone"
+    assert not (project_dir / BUILD_DIR / "hooks.py").exists(), "hooks.py should be gone"
     build_content = build_file.read_text(encoding="utf-8")
 
     if include_examples:
@@ -55,7 +52,7 @@ def test_option_combinations(copie, include_examples, include_actions):
         assert "_notebooks" not in build_content, "notebook export should not be wired when include_examples=False"
 
     # Test pyproject.toml dependencies
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
+    pyproject_content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
     if include_examples:
         assert "marimo" in pyproject_content, "marimo should be in dependencies when include_examples=True"
         assert "plotly" in pyproject_content, "plotly should be in dependencies when include_examples=True"
@@ -64,7 +61,7 @@ def test_option_combinations(copie, include_examples, include_actions):
         assert "plotly" not in pyproject_content, "plotly should not be in dependencies when include_examples=False"
 
     # Test noxfile sessions
-    noxfile_content = (result.project_dir / "noxfile.py").read_text(encoding="utf-8")
+    noxfile_content = (project_dir / "noxfile.py").read_text(encoding="utf-8")
     if include_examples:
         assert "def test_examples(session:" in noxfile_content, (
             "test_examples session should exist when include_examples=True"
@@ -79,17 +76,13 @@ def test_option_combinations(copie, include_examples, include_actions):
     "license_type",
     ["Apache-2.0", "MIT", "BSD-3-Clause", "GPL-3.0", "Proprietary"],
 )
-def test_all_licenses(copie, license_type):
+def test_all_licenses(answer_matrix, license_type):
     """Test that all license types generate correctly."""
-    result = copie.copy(
-        extra_answers={
-            "license": license_type,
-        },
+    project_dir = answer_matrix.tree(
+        license=license_type,
     )
 
-    assert result.exit_code == 0
-
-    license_file = result.project_dir / "LICENSE"
+    license_file = project_dir / "LICENSE"
     assert license_file.is_file(), f"LICENSE file should exist for {license_type}"
 
     license_content = license_file.read_text(encoding="utf-8")
@@ -110,14 +103,14 @@ def test_all_licenses(copie, license_type):
         assert "Proprietary License" in license_content or "All Rights Reserved" in license_content
 
     # Verify pyproject.toml has correct license (uses table format)
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
+    pyproject_content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
     assert f'license = {{ text = "{license_type}" }}' in pyproject_content
 
     # CITATION.cff validates its `license` against the SPDX list, and "Proprietary" is
     # not an SPDX identifier. The field is optional, so it is emitted only for the four
     # answers that are identifiers; emitting it for the fifth would ship a file that
     # fails schema validation in every tool that reads it.
-    citation = yaml.safe_load((result.project_dir / "CITATION.cff").read_text(encoding="utf-8"))
+    citation = yaml.safe_load((project_dir / "CITATION.cff").read_text(encoding="utf-8"))
     assert citation, f"CITATION.cff did not parse for {license_type}"
     if license_type == "Proprietary":
         assert "license" not in citation, (
@@ -131,22 +124,18 @@ def test_all_licenses(copie, license_type):
     "python_version",
     ["3.11", "3.12", "3.13", "3.14"],
 )
-def test_all_python_versions(copie, python_version):
+def test_all_python_versions(answer_matrix, python_version):
     """Test that all Python version options work correctly."""
-    result = copie.copy(
-        extra_answers={
-            "min_python_version": python_version,
-        },
+    project_dir = answer_matrix.tree(
+        min_python_version=python_version,
     )
 
-    assert result.exit_code == 0
-
     # Check pyproject.toml
-    pyproject_content = (result.project_dir / "pyproject.toml").read_text(encoding="utf-8")
+    pyproject_content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
     assert f'requires-python = ">={python_version}"' in pyproject_content
 
     # Check noxfile.py Python version matrix
-    noxfile_content = (result.project_dir / "noxfile.py").read_text(encoding="utf-8")
+    noxfile_content = (project_dir / "noxfile.py").read_text(encoding="utf-8")
     assert f'MIN_VERSION = "{python_version}"' in noxfile_content
 
     # Verify version is in the test matrix
@@ -155,6 +144,52 @@ def test_all_python_versions(copie, python_version):
         assert f'"{version}"' in noxfile_content, f"Python {version} should be in noxfile"
 
 
+@pytest.mark.parametrize("choices", _answer_matrix.toggle_combinations(), ids=str)
+def test_codecov_upload_follows_its_toggles(answer_matrix, choices):
+    """The test workflow uploads to Codecov exactly when Actions and Codecov are both on."""
+    project_dir = answer_matrix.tree(**choices)
+    workflow = project_dir / ".github" / "workflows" / "tests.yml"
+    if not choices["include_actions"]:
+        assert not workflow.exists()
+        return
+    uploads = "Upload test results to Codecov" in workflow.read_text(encoding="utf-8")
+    assert uploads == choices["include_codecov"], f"Codecov upload wiring disagrees with {choices}"
+
+
+def test_answer_matrix_collapses_answers_copier_never_asks(answer_matrix):
+    """With Actions off `include_codecov` is never asked, so both values are one render."""
+    first = answer_matrix.tree(include_actions=False, include_codecov=True)
+    second = answer_matrix.tree(include_actions=False, include_codecov=False)
+    assert _answer_matrix._tree_digest(first) == _answer_matrix._tree_digest(second)
+
+
+def test_answer_matrix_renders_fresh_with_the_cache_off(render_cache, tmp_path, monkeypatch):
+    """`COPIER_RENDER_CACHE=0` gives every matrix tree a render of its own, outside the store."""
+    from _render_cache import RenderCache
+
+    monkeypatch.setenv("COPIER_RENDER_CACHE", "0")
+    cache = RenderCache(render_cache.template_dir, tmp_path / "store")
+    matrix = _answer_matrix.AnswerMatrix(cache, tmp_path / "fresh")
+    matrix.render_all()
+
+    first = matrix.tree(include_examples=False)
+    second = matrix.tree(include_examples=False)
+    assert first != second, "two tests were handed the same render"
+    assert first.parent == second.parent == tmp_path / "fresh"
+    assert (first / "pyproject.toml").is_file() and (second / "pyproject.toml").is_file()
+    assert not (tmp_path / "store").exists(), "a render went through the shared store"
+
+
+def test_answer_matrix_diffs_two_answer_sets_structurally(answer_matrix):
+    """Turning examples off removes the notebooks and reports config changes by key."""
+    diff = answer_matrix.diff({"include_examples": True}, {"include_examples": False})
+
+    assert "examples/hello.py" in diff.removed
+    assert not diff.added, f"disabling examples should only remove files:\n{diff.report()}"
+    assert any(key.startswith("dependency-groups.") for key in diff.changed["pyproject.toml"]), diff.report()
+    assert not answer_matrix.diff({"license": "MIT"}, {"license": "MIT"})
+
+
 def test_readthedocs_config_consistency(copie):
     """Test that .readthedocs.yml configuration is consistent."""
     result = copie.copy(extra_answers={})
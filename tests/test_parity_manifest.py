@@ -41,21 +41,22 @@ def _derive_shipped_gates(generated):
     two places a gate is declared, and both are structural, so a gate added to the
     template appears here without anyone editing this file.
 
-    Takes the generation result, not a directory, because the root-file half must read
-    what was *rendered* rather than what is in the directory now. The session project is
+    Takes the generation result, not a directory, because it must read what was
+    *rendered* -- the result's `index`, read at generation time -- rather than what is
+    in the directory now. The session project is
     shared, and the nox smoke test runs a full tool pass inside it, so by the time this
     runs the directory may also hold `uv.lock`, `.coverage`, `coverage.xml` and
     `junit.*.xml`. Re-listing counted those as gates the template ships and demanded
     manifest entries for them, which made this gate pass or fail on test order alone.
     """
-    project_dir = generated.project_dir
+    index = generated.index
     gates = set()
-    for workflow_path in sorted((project_dir / ".github" / "workflows").glob("*.yml")):
-        workflow = yaml.safe_load(workflow_path.read_text(encoding="utf-8"))
+    for workflow_path in index.paths(".github/workflows/*.yml"):
+        workflow = index.config(workflow_path)
         for job_id in workflow.get("jobs") or {}:
-            gates.add(f"{workflow_path.name}:{job_id}")
+            gates.add(f"{workflow_path.rsplit('/', 1)[-1]}:{job_id}")
 
-    hooks_config = yaml.safe_load((project_dir / ".pre-commit-config.yaml").read_text(encoding="utf-8"))
+    hooks_config = index.config(".pre-commit-config.yaml")
     for repo in hooks_config.get("repos") or []:
         for hook in repo.get("hooks") or []:
             gates.add(f"hook:{hook['id']}")
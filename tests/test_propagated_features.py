@@ -13,19 +13,19 @@ class TestPyprojectNewDeps:
     def test_hypothesis_in_tests_group(self, copie_session_default):
         """Test that hypothesis is in the tests dependency group."""
         result = copie_session_default
-        content = (result.project_dir / "pyproject.toml").read_text()
+        content = result.index.text("pyproject.toml")
         assert '"hypothesis>=' in content
 
     def test_mkdocs_autorefs_in_docs_group(self, copie_session_default):
         """Test that mkdocs-autorefs is in the docs dependency group."""
         result = copie_session_default
-        content = (result.project_dir / "pyproject.toml").read_text()
+        content = result.index.text("pyproject.toml")
         assert '"mkdocs-autorefs>=' in content
 
     def test_rumdl_config_present(self, copie_session_default):
         """Test that [tool.rumdl] section exists in pyproject.toml."""
         result = copie_session_default
-        content = (result.project_dir / "pyproject.toml").read_text()
+        content = result.index.text("pyproject.toml")
         assert "[tool.rumdl]" in content
         assert 'flavor = "mkdocs"' in content
         assert '"MD013"' in content  # disabled rule
@@ -41,11 +41,8 @@ class TestPyprojectNewDeps:
         remaining match was the *comment* explaining that it had been dropped. A
         check that a comment can satisfy is not checking the configuration.
         """
-        import tomllib
-
         result = copie_session_default
-        content = (result.project_dir / "pyproject.toml").read_text()
-        ignores = tomllib.loads(content)["tool"]["ruff"]["lint"]["per-file-ignores"]
+        ignores = result.index.config("pyproject.toml")["tool"]["ruff"]["lint"]["per-file-ignores"]
 
         # The build scripts live in docs_build/ and print progress / hold caches.
         assert "T201" in ignores[f"{BUILD_DIR}/*.py"]
@@ -70,50 +67,50 @@ class TestMkdocsYmlFeatures:
     def test_navigation_indexes_feature(self, copie_session_default):
         """Test that navigation.indexes feature is enabled."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "navigation.indexes" in content
 
     def test_navigation_prune_feature(self, copie_session_default):
         """Test that navigation.prune feature is enabled."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "navigation.prune" in content
 
     def test_autorefs_plugin(self, copie_session_default):
         """Test that autorefs plugin is configured."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "autorefs" in content
 
     def test_mathjax_javascript(self, copie_session_default):
         """Test that MathJax JavaScript is included."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "mathjax.js" in content
         assert "tex-mml-chtml.js" in content  # MathJax CDN
 
     def test_extra_css_theme(self, copie_session_default):
         """Test that theme.css is always in extra_css."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "stylesheets/theme.css" in content
 
     def test_extra_css_gallery_when_examples(self, copie):
         """Test that gallery.css is in extra_css when include_examples=True."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "stylesheets/gallery.css" in content
 
     def test_extra_css_no_gallery_when_no_examples(self, copie):
         """Test that gallery.css is NOT in extra_css when include_examples=False."""
         result = copie.copy(extra_answers={"include_examples": False})
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "stylesheets/gallery.css" not in content
 
     def test_mkdocstrings_crossrefs(self, copie_session_default):
         """Test that mkdocstrings cross-reference options are configured."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "signature_crossrefs: true" in content
         assert "scoped_crossrefs: true" in content
         assert "relative_crossrefs: true" in content
@@ -121,7 +118,7 @@ class TestMkdocsYmlFeatures:
     def test_not_in_nav_block(self, copie_session_default):
         """Test that not_in_nav block exists with API wildcard."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "not_in_nav" in content
         assert "pages/api/*.md" in content
 
@@ -133,8 +130,8 @@ class TestMkdocsYmlFeatures:
         ``docs_dir`` and must not need an ``exclude_docs`` entry to be safe.
         """
         result = copie_session_default
-        assert not (result.project_dir / "docs" / "api-submodule.html").exists()
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        assert "docs/api-submodule.html" not in result.index
+        content = result.index.text("mkdocs.yml")
         assert "api-submodule.html" not in content, (
             "the scaffold is excluded by living outside docs_dir, not by exclude_docs"
         )
@@ -142,7 +139,7 @@ class TestMkdocsYmlFeatures:
     def test_nav_uses_api_reference(self, copie_session_default):
         """Test that nav points to pages/reference/api.md."""
         result = copie_session_default
-        content = (result.project_dir / "mkdocs.yml").read_text()
+        content = result.index.text("mkdocs.yml")
         assert "pages/reference/api.md" in content
 
 
@@ -152,13 +149,12 @@ class TestAPISubmodulePages:
     def test_api_submodule_template_exists(self, copie_session_default):
         """Test that api-submodule.html template file exists (in docs_build/)."""
         result = copie_session_default
-        template = result.project_dir / "docs_build" / "api-submodule.html"
-        assert template.is_file()
+        assert "docs_build/api-submodule.html" in result.index
 
     def test_api_submodule_template_has_placeholders(self, copie_session_default):
         """Test that api-submodule.html has the expected placeholders."""
         result = copie_session_default
-        content = (result.project_dir / "docs_build" / "api-submodule.html").read_text()
+        content = result.index.text("docs_build/api-submodule.html")
         assert "{package_name}" in content
         assert "{module_name}" in content
         assert "{module_doc}" in content
@@ -167,7 +163,7 @@ class TestAPISubmodulePages:
     def test_api_index_has_table_placeholder(self, copie_session_default):
         """Test that API reference page has the API_TABLE placeholder."""
         result = copie_session_default
-        content = (result.project_dir / "docs" / "pages" / "reference" / "api.md").read_text()
+        content = result.index.text("docs/pages/reference/api.md")
         assert "<!-- API_TABLE -->" in content
         assert "# API Reference" in content
 
@@ -179,9 +175,8 @@ class TestAPISubmodulePages:
         is what keeps a second, drifting copy from passing this test.
         """
         result = copie_session_default
-        build = result.project_dir / BUILD_DIR
-        api_pages = (build / "_api_pages.py").read_text()
-        markers = (build / "_markers.py").read_text()
+        api_pages = result.index.text(f"{BUILD_DIR}/_api_pages.py")
+        markers = result.index.text(f"{BUILD_DIR}/_markers.py")
         # These are the discovery layer's entry points, not its internals.
         # `_extract_module_docstring` and `_get_module_members` used to be on
         # this list and are gone: they were AST helpers that Griffe answers
@@ -209,14 +204,14 @@ class TestAPISubmodulePages:
         works because prebuild regenerates on every rebuild.
         """
         result = copie_session_default
-        content = (result.project_dir / BUILD_DIR / "build.py").read_text()
+        content = result.index.text(f"{BUILD_DIR}/build.py")
         assert "def prebuild(" in content
         assert "_api_pages.generate(" in content
 
     def test_gitignore_excludes_generated_api_pages(self, copie_session_default):
         """Test that .gitignore excludes generated API pages."""
         result = copie_session_default
-        content = (result.project_dir / ".gitignore").read_text()
+        content = result.index.text(".gitignore")
         assert "docs/pages/api/" in content
 
 
@@ -226,34 +221,30 @@ class TestNewStaticFiles:
     def test_mathjax_js_exists(self, copie_session_default):
         """Test that mathjax.js exists with correct content."""
         result = copie_session_default
-        mathjax = result.project_dir / "docs" / "javascripts" / "mathjax.js"
-        assert mathjax.is_file()
-        content = mathjax.read_text()
+        assert "docs/javascripts/mathjax.js" in result.index
+        content = result.index.text("docs/javascripts/mathjax.js")
         assert "MathJax" in content
         assert "document$.subscribe" in content
 
     def test_theme_css_exists(self, copie_session_default):
         """Test that theme.css exists with CSS custom properties."""
         result = copie_session_default
-        theme_css = result.project_dir / "docs" / "stylesheets" / "theme.css"
-        assert theme_css.is_file()
-        content = theme_css.read_text()
+        assert "docs/stylesheets/theme.css" in result.index
+        content = result.index.text("docs/stylesheets/theme.css")
         assert "--md-primary-fg-color" in content
         assert "--md-accent-fg-color" in content
 
     def test_gallery_css_when_examples(self, copie):
         """Test that gallery.css exists when include_examples=True."""
         result = copie.copy(extra_answers={"include_examples": True})
-        gallery_css = result.project_dir / "docs" / "stylesheets" / "gallery.css"
-        assert gallery_css.is_file()
-        content = gallery_css.read_text()
+        assert "docs/stylesheets/gallery.css" in result.index
+        content = result.index.text("docs/stylesheets/gallery.css")
         assert "grid-template-columns" in content
 
     def test_no_gallery_css_when_no_examples(self, copie):
         """Test that gallery.css does NOT exist when include_examples=False."""
         result = copie.copy(extra_answers={"include_examples": False})
-        gallery_css = result.project_dir / "docs" / "stylesheets" / "gallery.css"
-        assert not gallery_css.exists()
+        assert "docs/stylesheets/gallery.css" not in result.index
 
 
 class TestGallerySystem:
@@ -262,13 +253,13 @@ class TestGallerySystem:
     def test_examples_page_has_gallery_placeholder(self, copie):
         """Test that examples.md uses the GALLERY placeholder."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / "docs" / "pages" / "examples" / "index.md").read_text()
+        content = result.index.text("docs/pages/examples/index.md")
         assert "<!-- GALLERY -->" in content
 
     def test_hello_notebook_has_gallery_metadata(self, copie):
         """Test that hello.py has __gallery__ metadata."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / "examples" / "hello.py").read_text()
+        content = result.index.text("examples/hello.py")
         assert "__gallery__" in content
         assert '"title"' in content
         assert '"description"' in content
@@ -277,7 +268,7 @@ class TestGallerySystem:
     def test_hooks_has_gallery_functions_when_examples(self, copie):
         """The marker extension includes gallery functions when examples enabled."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / BUILD_DIR / "_markers.py").read_text()
+        content = result.index.text(f"{BUILD_DIR}/_markers.py")
         assert "_get_gallery_items" in content
         assert "_build_gallery_html" in content
         assert "_build_gallery_cards" in content
@@ -285,7 +276,7 @@ class TestGallerySystem:
     def test_hooks_gallery_groups_by_category(self, copie):
         """The marker extension's gallery groups items by tutorial/how-to category."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / BUILD_DIR / "_markers.py").read_text()
+        content = result.index.text(f"{BUILD_DIR}/_markers.py")
         assert '"tutorial"' in content
         assert '"how-to"' in content
         assert "Tutorials" in content
@@ -294,7 +285,7 @@ class TestGallerySystem:
     def test_hooks_no_gallery_when_no_examples(self, copie):
         """The marker extension omits gallery functions when examples disabled."""
         result = copie.copy(extra_answers={"include_examples": False})
-        content = (result.project_dir / BUILD_DIR / "_markers.py").read_text()
+        content = result.index.text(f"{BUILD_DIR}/_markers.py")
         assert "_get_gallery_items" not in content
         assert "_build_gallery_html" not in content
 
@@ -305,33 +296,33 @@ class TestJustfileRecipes:
     def test_lint_includes_rumdl(self, copie_session_default):
         """Test that lint recipe includes rumdl."""
         result = copie_session_default
-        content = (result.project_dir / "justfile").read_text()
+        content = result.index.text("justfile")
         assert "rumdl" in content
 
     def test_link_recipe_exists(self, copie_session_default):
         """Test that link recipe exists for linkchecker."""
         result = copie_session_default
-        content = (result.project_dir / "justfile").read_text()
+        content = result.index.text("justfile")
         assert "linkchecker" in content
         assert "link:" in content
 
     def test_build_fast_when_examples(self, copie):
         """Test that build-fast recipe exists when examples enabled."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / "justfile").read_text()
+        content = result.index.text("justfile")
         assert "build-fast:" in content
         assert "MKDOCS_SKIP_NOTEBOOKS" in content
 
     def test_serve_fast_when_examples(self, copie):
         """Test that serve-fast recipe exists when examples enabled."""
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / "justfile").read_text()
+        content = result.index.text("justfile")
         assert "serve-fast:" in content
 
     def test_no_build_fast_when_no_examples(self, copie):
         """Test that build-fast/serve-fast are absent when examples disabled."""
         result = copie.copy(extra_answers={"include_examples": False})
-        content = (result.project_dir / "justfile").read_text()
+        content = result.index.text("justfile")
         assert "build-fast:" not in content
         assert "serve-fast:" not in content
 
@@ -342,7 +333,7 @@ class TestPreCommitRumdl:
     def test_precommit_has_rumdl(self, copie_session_default):
         """Test that pre-commit config includes rumdl hook."""
         result = copie_session_default
-        content = (result.project_dir / ".pre-commit-config.yaml").read_text()
+        content = result.index.text(".pre-commit-config.yaml")
         assert "rumdl" in content
 
 
@@ -352,13 +343,13 @@ class TestNoxfileChanges:
     def test_nox_lint_includes_rumdl(self, copie_session_default):
         """Test that nox lint session runs rumdl."""
         result = copie_session_default
-        content = (result.project_dir / "noxfile.py").read_text()
+        content = result.index.text("noxfile.py")
         assert "rumdl" in content
 
     def test_nox_link_docs_session(self, copie_session_default):
         """Test that nox link_docs session exists."""
         result = copie_session_default
-        content = (result.project_dir / "noxfile.py").read_text()
+        content = result.index.text("noxfile.py")
         assert "link_docs" in content
         assert "linkchecker" in content
 
@@ -369,7 +360,7 @@ class TestWorkflowFixes:
     def test_tests_yml_no_undefined_python_version(self, copie):
         """Test that tests.yml lint job no longer uses undefined {{ python_version }}."""
         result = copie.copy(extra_answers={"include_actions": True})
-        content = (result.project_dir / ".github" / "workflows" / "tests.yml").read_text()
+        content = result.index.text(".github/workflows/tests.yml")
 
         # The lint job should use 'uv python install' (no version arg)
         # not 'uv python install <undefined>'
@@ -385,7 +376,7 @@ class TestWorkflowFixes:
     def test_tests_yml_has_lfs(self, copie):
         """Test that checkout steps in tests.yml have lfs: true."""
         result = copie.copy(extra_answers={"include_actions": True})
-        content = (result.project_dir / ".github" / "workflows" / "tests.yml").read_text()
+        content = result.index.text(".github/workflows/tests.yml")
         assert "lfs: true" in content
 
 
@@ -395,14 +386,14 @@ class TestPRTemplate:
     def test_pr_template_uses_just_fix(self, copie):
         """Test that PR template references 'just fix' not 'just format'."""
         result = copie.copy(extra_answers={"include_actions": True})
-        content = (result.project_dir / ".github" / "PULL_REQUEST_TEMPLATE.md").read_text()
+        content = result.index.text(".github/PULL_REQUEST_TEMPLATE.md")
         assert "just fix" in content
         assert "just format" not in content
 
     def test_pr_template_uses_just_lint(self, copie):
         """Test that PR template references 'just lint' not 'just check'."""
         result = copie.copy(extra_answers={"include_actions": True})
-        content = (result.project_dir / ".github" / "PULL_REQUEST_TEMPLATE.md").read_text()
+        content = result.index.text(".github/PULL_REQUEST_TEMPLATE.md")
         assert "just lint" in content
         assert "just check" not in content
 
@@ -413,7 +404,7 @@ class TestContributingFix:
     def test_contributing_uses_min_python_version(self, copie):
         """Test that contributing.md uses min_python_version, not undefined python_version."""
         result = copie.copy(extra_answers={"min_python_version": "3.12"})
-        content = (result.project_dir / "docs" / "pages" / "how-to" / "contribute.md").read_text()
+        content = result.index.text("docs/pages/how-to/contribute.md")
         assert "Python 3.12+" in content
 
 
@@ -427,5 +418,5 @@ class TestHooksSkipNotebooks:
         what lets ``check_docs`` build without executing every notebook.
         """
         result = copie.copy(extra_answers={"include_examples": True})
-        content = (result.project_dir / BUILD_DIR / "_notebooks.py").read_text()
+        content = result.index.text(f"{BUILD_DIR}/_notebooks.py")
         assert "MKDOCS_SKIP_NOTEBOOKS" in content
@@ -12,19 +12,18 @@ import sys
 
 import pytest
 from _build_layout import BUILD_DIR
-
-# serve.py puts its own directory on sys.path and imports the build steps as
-# plain top-level names, which sys.modules caches globally -- so a second project
-# loaded in a session would silently reuse the first project's build steps. Purge
-# them before each load, the same isolation _load_markers relies on.
-_BUILD_STEP_MODULES = ("_api_pages", "_notebooks", "_markdown_export")
+from _docs_build_modules import BUILD_STEP_MODULES
 
 _GENERATED = ("docs", "pages", "api", "generated")
 
 
 def _load_serve(project_dir, unique_suffix):
-    """Load a generated `docs_build/serve.py` under a unique module name."""
-    for name in _BUILD_STEP_MODULES:
+    """Load a generated `docs_build/serve.py` under a unique module name.
+
+    serve.py imports the build steps as plain top-level names too; purge them
+    first, the same isolation the loaders in `_docs_build_modules` rely on.
+    """
+    for name in BUILD_STEP_MODULES:
         sys.modules.pop(name, None)
     spec = importlib.util.spec_from_file_location(
         f"generated_serve_{unique_suffix}", project_dir / BUILD_DIR / "serve.py"
@@ -113,3 +112,102 @@ def test_serve_watcher_regenerates_on_source_change(copie):
     finally:
         observer.stop()
         observer.join()
+
+
+def _page_times(project_dir):
+    """Modification time of every page under `docs/pages/api/`, by relative path."""
+    api_dir = project_dir / "docs" / "pages" / "api"
+    return {p.relative_to(api_dir).as_posix(): p.stat().st_mtime_ns for p in api_dir.rglob("*.md")}
+
+
+def _age_pages(project_dir):
+    """Backdate every API page, so a rewrite shows however coarse the filesystem clock."""
+    import os
+
+    for page in (project_dir / "docs" / "pages" / "api").rglob("*.md"):
+        os.utime(page, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_serve_refresh_rewrites_only_what_an_edit_reaches(copie):
+    """A save in one module rewrites that module's pages and leaves the rest alone.
+
+    The engine rebuilds the site for every page written, so the full regeneration
+    turned a one-line edit into a rebuild of the whole API tree. Pages of a module
+    the edit cannot reach, and pages whose content did not change, must not be
+    touched at all -- an identical rewrite costs the same rebuild.
+    """
+    result = copie.copy(extra_answers={"include_examples": False})
+    assert result.exit_code == 0
+    project_dir = result.project_dir
+    package_dir = project_dir / "src" / "test_project"
+    (package_dir / "other.py").write_text(
+        '"""Another module."""\n\n\nclass Other:\n    """Untouched by the edit."""\n', encoding="utf-8"
+    )
+
+    serve = _load_serve(project_dir, "refresh_scoped")
+    serve.regenerate()
+    _age_pages(project_dir)
+    hello = package_dir / "hello.py"
+    _add_public_class(project_dir, "test_project", "FreshWidget")
+    serve.regenerate(frozenset({str(hello)}))
+
+    touched = {path for path, mtime in _page_times(project_dir).items() if mtime != 1_000_000_000}
+    assert "generated/test_project.hello.FreshWidget.md" in touched, "the new class got no page"
+    assert "hello.md" in touched, "the edited module's overview table was not updated"
+    assert not {p for p in touched if "other" in p}, f"pages the edit cannot reach were rewritten: {sorted(touched)}"
+    assert touched == {"hello.md", "generated/test_project.hello.FreshWidget.md"}, (
+        f"pages whose content did not change were rewritten: {sorted(touched)}"
+    )
+
+
+def test_serve_refresh_removes_a_vanished_symbols_page(copie):
+    """Deleting a class removes its page on the next refresh, and nothing else."""
+    result = copie.copy(extra_answers={"include_examples": False})
+    assert result.exit_code == 0
+    project_dir = result.project_dir
+    hello = project_dir / "src" / "test_project" / "hello.py"
+    original = hello.read_text(encoding="utf-8")
+
+    serve = _load_serve(project_dir, "refresh_removed")
+    _add_public_class(project_dir, "test_project", "Doomed")
+    serve.regenerate()
+    assert "test_project.hello.Doomed.md" in _generated_pages(project_dir)
+
+    hello.write_text(original, encoding="utf-8")
+    serve.regenerate(frozenset({str(hello)}))
+    assert "test_project.hello.Doomed.md" not in _generated_pages(project_dir), "a deleted class kept its page"
+
+
+def test_serve_refresh_falls_back_when_a_submodule_appears(copie):
+    """A new public submodule is beyond a scoped refresh; it must still get its pages."""
+    result = copie.copy(extra_answers={"include_examples": False})
+    assert result.exit_code == 0
+    project_dir = result.project_dir
+
+    serve = _load_serve(project_dir, "refresh_new_module")
+    serve.regenerate()
+    added = project_dir / "src" / "test_project" / "extra.py"
+    added.write_text('"""Added during the preview."""\n\n\ndef helper():\n    """Help."""\n', encoding="utf-8")
+    serve.regenerate(frozenset({str(added)}))
+
+    assert (project_dir / "docs" / "pages" / "api" / "extra.md").is_file()
+    assert "test_project.extra.helper.md" in _generated_pages(project_dir)
+
+
+def test_serve_watcher_hands_over_every_changed_path(copie_session_minimal):
+    """A settled burst is handed over once, with every `.py` path it touched."""
+    import time
+
+    from watchdog.events import DirModifiedEvent, FileModifiedEvent, FileMovedEvent
+
+    serve = _load_serve(copie_session_minimal.project_dir, "handler_paths")
+    handler = serve._SourceChangeHandler()
+    handler.on_any_event(FileModifiedEvent("/src/pkg/a.py"))
+    handler.on_any_event(FileMovedEvent("/src/pkg/b.py", "/src/pkg/c.py"))
+    handler.on_any_event(FileModifiedEvent("/src/pkg/notes.txt"))
+    handler.on_any_event(DirModifiedEvent("/src/pkg"))
+
+    assert not handler.take_due(), "a change was handed over inside the debounce window"
+    time.sleep(serve._DEBOUNCE_SECONDS + 0.1)
+    assert handler.take_due() == {"/src/pkg/a.py", "/src/pkg/b.py", "/src/pkg/c.py"}
+    assert not handler.take_due(), "a settled burst was handed over twice"
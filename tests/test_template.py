@@ -1,5 +1,6 @@
 """Tests for the copier template."""
 
+import ast
 import contextlib
 import json
 import logging
@@ -14,7 +15,8 @@ from pathlib import Path
 
 import pytest
 import yaml
-from _build_layout import BUILD_DIR, TEMPLATES_DIR, mkdocstrings_templates, site_path
+from _build_layout import ARTIFACTS_DIR, BUILD_DIR, TEMPLATES_DIR, mkdocstrings_templates, site_path
+from _docs_build_modules import BUILD_STEP_MODULES, FakePage, load_build, load_glossary, load_markers
 
 
 def test_template_creates_project(copie_session_default):
@@ -54,6 +56,34 @@ def test_template_creates_project(copie_session_default):
     assert (result.project_dir / ".git-cliff.toml").is_file()
 
 
+def test_render_cache_hands_each_test_an_independent_copy(copie):
+    """Identical answers render once, and editing one copy leaves the store and later copies alone."""
+    if not copie.cache.enabled:
+        pytest.skip("COPIER_RENDER_CACHE=0 renders every project fresh")
+    answers = {"project_name": "Cache Probe", "include_examples": False}
+    first = copie.copy(extra_answers=answers).project_dir.rename(copie.tmp_path / "first")
+    (first / "README.md").write_text("edited\n", encoding="utf-8")
+
+    second = copie.copy(extra_answers=answers)
+    assert second.result is None, "the second render should have been a copy of the first"
+    assert (second.project_dir / "README.md").read_text(encoding="utf-8") != "edited\n"
+    assert (second.project_dir / "src" / "test_project" / "__init__.py").is_file()
+
+
+def test_render_cache_lock_is_released_and_reclaims_a_stale_one(tmp_path):
+    """The lock file is gone after the body, and one a dead worker left behind is not waited on."""
+    from _render_cache import _STALE_LOCK_SECONDS, _locked
+
+    lock = tmp_path / "key.lock"
+    lock.touch()
+    old = lock.stat().st_mtime - _STALE_LOCK_SECONDS - 1
+    os.utime(lock, (old, old))
+
+    with _locked(lock):
+        assert lock.stat().st_mtime > old, "the stale lock should have been replaced by a fresh one"
+    assert not lock.exists()
+
+
 def test_readthedocs_config_included(copie_session_default):
     """Test that ReadTheDocs config is always included."""
     result = copie_session_default
@@ -130,6 +160,9 @@ def test_generated_project_structure(copie_session_default):
     tests_dir = result.project_dir / "tests"
     assert (tests_dir / "conftest.py").is_file()
     assert (tests_dir / "test_hello.py").is_file()
+    assert (tests_dir / "test_exports.py").is_file()
+    assert (tests_dir / "test_import_time.py").is_file()
+    assert (result.project_dir / "benchmarks" / "test_bench_hello.py").is_file()
 
     # Check docs
     docs_dir = result.project_dir / "docs"
@@ -1488,6 +1521,8 @@ def test_generated_project_nox_sessions(copie_session_default):
         ("test_coverage", 180, "Tests and coverage generation"),
         ("lint", 120, "Code quality checks (ruff + ty)"),
         ("test_docstrings", 120, "Docstring tests"),
+        ("import_time", 120, "Import-time profile and budget"),
+        ("bench", 180, "Benchmarks"),
         ("test_examples", 120, "Example notebook execution"),
         ("build_docs", 180, "Documentation build"),
     ]
@@ -2004,116 +2039,6 @@ def test_claude_skills_not_gitignored(copie_session_default):
     )
 
 
-# The build steps the docs tooling imports as siblings. They are plain top-level
-# module names, so `sys.modules` caches them globally and a second project would
-# silently reuse the first project's copies -- see _load_markers.
-_BUILD_STEP_MODULES = ("_api_pages", "_notebooks", "_markdown_export")
-
-
-def _load_markers(project_dir, unique_suffix):
-    """Import a generated docs_build/_markers.py under a unique module name.
-
-    The module name must be unique per project: importing two differently
-    generated marker modules under one name makes ``sys.modules`` return the
-    first, so the second variant is never actually exercised and the test passes
-    while asserting nothing.
-
-    The same trap is wider than it looks. ``_markers.py`` puts its own directory
-    on ``sys.path`` and imports ``_api_pages`` and the shared ``_git_ref`` helper
-    as plain top-level names, which ``sys.modules`` caches globally -- so the
-    *second* project loaded in a session would get the first project's build
-    steps, pointed at the first project's source tree, while its own markers
-    module looked correctly isolated. Purging those names before each load is
-    what keeps the isolation real; ``sys.path.insert(0, ...)`` inside
-    ``_markers.py`` then resolves them against this project.
-
-    Reach the build steps through the returned module (``markers._api_pages``),
-    not by importing them directly -- that is the copy bound to this project.
-    Reset caches through the returned module (``markers.reset_caches()``) so the
-    reset lands on the very caches the marker builders read.
-    """
-    import importlib.util
-
-    for name in (*_BUILD_STEP_MODULES, "_git_ref", "_markers"):
-        sys.modules.pop(name, None)
-
-    spec = importlib.util.spec_from_file_location(
-        f"generated_markers_{unique_suffix}", project_dir / BUILD_DIR / "_markers.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_build(project_dir, unique_suffix):
-    """Import a generated docs_build/build.py under a unique module name.
-
-    ``build.py`` hosts the explicit pre/post-build steps (``prebuild`` /
-    ``postbuild``) that replaced the mkdocs ``on_pre_build`` / ``on_post_build``
-    hooks, and imports ``_api_pages``, ``_markdown_export`` and (with examples)
-    ``_notebooks`` as plain top-level names. Same isolation trap as
-    ``_load_markers``: purge the build steps before each load, or a second
-    project binds the first project's steps. Reach the steps through the returned
-    module (``build._notebooks`` / ``build._markdown_export`` / ``build._api_pages``).
-    """
-    import importlib.util
-
-    for name in (*_BUILD_STEP_MODULES, "_git_ref"):
-        sys.modules.pop(name, None)
-
-    spec = importlib.util.spec_from_file_location(
-        f"generated_build_{unique_suffix}", project_dir / BUILD_DIR / "build.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_git_ref(project_dir, unique_suffix):
-    """Import a generated docs_build/_git_ref.py under a unique module name.
-
-    ``_git_ref.py`` is the single definition of "which commit is this build",
-    shared by the marker and source-link extensions. It imports no build steps,
-    but a unique module name per load matches the isolation discipline the other
-    loaders use and keeps its module cache (``_CACHE``) from bleeding between
-    projects.
-    """
-    import importlib.util
-
-    for name in (*_BUILD_STEP_MODULES, "_git_ref"):
-        sys.modules.pop(name, None)
-
-    spec = importlib.util.spec_from_file_location(
-        f"generated_git_ref_{unique_suffix}", project_dir / BUILD_DIR / "_git_ref.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_glossary(project_dir, unique_suffix):
-    """Import a generated docs_build/_glossary.py under a unique module name.
-
-    The glossary extension imports ``_current_page`` from ``_markers`` as a plain
-    top-level name, which pulls in ``_markers``, ``_git_ref`` and the build steps
-    -- all cached globally by ``sys.modules``. Purge them (``_markers`` included)
-    before each load, or a second project's glossary binds the first project's
-    modules and reads the wrong glossary file. The linker keeps no cache, so
-    nothing else needs resetting between calls.
-    """
-    import importlib.util
-
-    for name in (*_BUILD_STEP_MODULES, "_git_ref", "_markers"):
-        sys.modules.pop(name, None)
-
-    spec = importlib.util.spec_from_file_location(
-        f"generated_glossary_{unique_suffix}", project_dir / BUILD_DIR / "_glossary.py"
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
 def _reset_hook_caches(markers):
     """Clear every per-build cache the docs tooling reaches, across all modules.
 
@@ -2184,7 +2109,7 @@ def test_reexported_symbols_resolve(copie_session_minimal):
     """Re-exported symbols resolve, and the API page members table populates."""
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "reexport")
+    markers = load_markers(project_dir, "reexport")
 
     members = markers._get_public_members(project_dir, "shapes")
     names = {e["name"] for e in members["classes"] + members["functions"]}
@@ -2214,7 +2139,7 @@ def test_reexports_guarded_by_try_resolve(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "tryblock")
+    markers = load_markers(project_dir, "tryblock")
 
     members = markers._get_public_members(project_dir, "optional")
     names = {e["name"] for e in members["classes"] + members["functions"]}
@@ -2229,7 +2154,7 @@ def test_api_name_lookup_without_importing_package(copie_session_minimal):
 
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "noimport")
+    markers = load_markers(project_dir, "noimport")
     _reset_hook_caches(markers)
 
     lookup = markers._api_pages._get_api_name_lookup(project_dir)
@@ -2244,7 +2169,7 @@ def test_api_name_lookup_every_name_has_a_page(copie_session_minimal):
     """Interlock: every resolvable name has a generated page to link to."""
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "interlock")
+    markers = load_markers(project_dir, "interlock")
     _reset_hook_caches(markers)
 
     markers._api_pages._generate_api_pages(project_dir)
@@ -2257,6 +2182,50 @@ def test_api_name_lookup_every_name_has_a_page(copie_session_minimal):
     assert not missing, f"lookup resolves names with no generated page: {missing}"
 
 
+def test_api_generation_rewrites_only_changed_pages(copie_session_minimal, capsys):
+    """A generation with nothing to change writes nothing, and says so.
+
+    Pages used to be deleted and rewritten on every build. Each rewrite moves the
+    mtime both engines use to decide what to rebuild, and between the delete and
+    the rewrite a concurrent build saw the pages missing.
+    """
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "write_if_changed")
+    _reset_hook_caches(markers)
+    markers._api_pages._generate_api_pages(project_dir)
+    api_dir = project_dir / "docs" / "pages" / "api"
+    pages = sorted(api_dir.rglob("*.md"))
+    for page in pages:
+        os.utime(page, ns=(1_000_000_000, 1_000_000_000))
+    capsys.readouterr()
+
+    markers._api_pages._generate_api_pages(project_dir)
+
+    rewritten = [p.relative_to(api_dir).as_posix() for p in pages if p.stat().st_mtime_ns != 1_000_000_000]
+    assert not rewritten, f"unchanged pages were rewritten: {rewritten}"
+    assert "0 created, 0 updated, 0 removed" in capsys.readouterr().out
+
+
+def test_api_generation_removes_only_vanished_pages(copie_session_minimal, capsys):
+    """A detail page whose symbol is gone is deleted; every other page stays put."""
+    project_dir = copie_session_minimal.project_dir
+    generated = project_dir / "docs" / "pages" / "api" / "generated"
+    markers = load_markers(project_dir, "vanished_pages")
+    _reset_hook_caches(markers)
+    markers._api_pages._generate_api_pages(project_dir)
+    kept = sorted(generated.glob("*.md"))
+    assert kept, "no detail pages to keep; the test would pass vacuously"
+    orphan = generated / "minimal_project.hello.Gone.md"
+    orphan.write_text("# Gone\n", encoding="utf-8")
+    capsys.readouterr()
+
+    markers._api_pages._generate_api_pages(project_dir)
+
+    assert not orphan.exists(), "a page for a symbol that no longer exists survived"
+    assert all(p.exists() for p in kept), "a current page was deleted along with the stale one"
+    assert "1 removed" in capsys.readouterr().out
+
+
 def test_api_name_lookup_available_without_examples(copie_session_minimal):
     """The lookup is not gated behind include_examples."""
     build = copie_session_minimal.project_dir / BUILD_DIR
@@ -2282,27 +2251,9 @@ def test_api_name_lookup_shared_with_notebook_usage(copie_session_default):
     )
 
 
-class _FakeFile:
-    def __init__(self, src_path, dest_path, abs_src_path=None):
-        self.src_path = src_path
-        self.dest_path = dest_path
-        # mkdocs' File exposes the on-disk source; the subpage index reads each
-        # sibling's own H1 and summary out of it.
-        self.abs_src_path = abs_src_path
-
-
-class _FakePage:
-    """The subset of mkdocs' Page the marker Preprocessor and its tests touch."""
-
-    def __init__(self, src_path, dest_path):
-        self.file = _FakeFile(src_path, dest_path)
-        self.meta = {}
-        self.toc = []
-
-
 def _generated_page(package_name, class_name):
     src = f"pages/api/generated/{package_name}.models.{class_name}.md"
-    return _FakePage(src, src.replace(".md", "/index.html"))
+    return FakePage(src, src.replace(".md", "/index.html"))
 
 
 def _write_models_module(project_dir, package_name):
@@ -2341,7 +2292,7 @@ def _write_glossary(project_dir, extra=""):
 
 
 def _glossary_page(src="pages/explanation/concepts.md"):
-    return _FakePage(src, src.replace(".md", "/index.html"))
+    return FakePage(src, src.replace(".md", "/index.html"))
 
 
 def test_glossary_terms_link_on_other_pages(copie_session_minimal):
@@ -2352,7 +2303,7 @@ def test_glossary_terms_link_on_other_pages(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_link")
+    glossary = load_glossary(project_dir, "glossary_link")
 
     md = "The memory buffer holds rows. A second memory buffer mention.\n\nThe forecasting horizon matters."
     out = "\n".join(glossary._linkify(md.split("\n"), _glossary_page()))
@@ -2372,7 +2323,7 @@ def test_glossary_skips_terms_not_opted_in(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_optin")
+    glossary = load_glossary(project_dir, "glossary_optin")
 
     out = "\n".join(glossary._linkify(["Each step is a step."], _glossary_page()))
 
@@ -2384,7 +2335,7 @@ def test_glossary_never_links_inside_code_or_headings(copie_session_minimal):
     """Code is not prose, and a link inside a heading or another link is broken markup."""
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_skip")
+    glossary = load_glossary(project_dir, "glossary_skip")
 
     md = (
         "## The memory buffer heading\n"
@@ -2422,7 +2373,7 @@ def test_glossary_never_links_inside_an_autodoc_directive(copie_session_minimal)
         project_dir,
         extra="Stationarity { #stationarity .autolink }\n:   A stable statistical regime.\n",
     )
-    glossary = _load_glossary(project_dir, "glossary_autodoc")
+    glossary = load_glossary(project_dir, "glossary_autodoc")
 
     md = (
         "::: pkg.stationarity.ASinhTransformer\n"
@@ -2446,7 +2397,7 @@ def test_glossary_page_does_not_link_itself(copie_session_minimal):
     """The glossary must not turn its own definitions into links to themselves."""
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_self")
+    glossary = load_glossary(project_dir, "glossary_self")
 
     page = _glossary_page("pages/explanation/glossary.md")
     out = "\n".join(glossary._linkify(["A memory buffer is defined here."], page))
@@ -2460,7 +2411,7 @@ def test_glossary_absent_is_not_an_error(copie_session_minimal):
     glossary_file = project_dir / "docs" / "pages" / "explanation" / "glossary.md"
     if glossary_file.exists():
         glossary_file.unlink()
-    glossary = _load_glossary(project_dir, "glossary_absent")
+    glossary = load_glossary(project_dir, "glossary_absent")
 
     lines = ["A memory buffer here."]
     assert glossary._linkify(lines, _glossary_page()) == lines
@@ -2475,7 +2426,7 @@ def test_glossary_skips_fenced_code_blocks(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_fence")
+    glossary = load_glossary(project_dir, "glossary_fence")
 
     md = "```python\nmemory buffer = 1\n```\n\nThen a real memory buffer in prose.\n"
     out = "\n".join(glossary._linkify(md.split("\n"), _glossary_page()))
@@ -2495,7 +2446,7 @@ def test_glossary_state_does_not_leak_between_pages(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_glossary(project_dir)
-    glossary = _load_glossary(project_dir, "glossary_leak")
+    glossary = load_glossary(project_dir, "glossary_leak")
 
     first = "\n".join(glossary._linkify(["The memory buffer on page one."], _glossary_page("pages/explanation/a.md")))
     second = "\n".join(glossary._linkify(["The memory buffer on page two."], _glossary_page("pages/explanation/b.md")))
@@ -2504,6 +2455,115 @@ def test_glossary_state_does_not_leak_between_pages(copie_session_minimal):
     assert "glossary.md#memory-buffer" in second, "state leaked across pages: the term stopped linking on a later page"
 
 
+def test_glossary_is_read_once_while_the_file_is_unchanged(copie_session_minimal, monkeypatch):
+    """Pages share one parse of the glossary; an edit is still seen on the next page.
+
+    The file was re-read and its pattern recompiled for every page. Caching it
+    outright would serve a stale glossary through `mkdocs serve`, so the cache is
+    checked against the file's stamp instead.
+    """
+    project_dir = copie_session_minimal.project_dir
+    _write_glossary(project_dir)
+    glossary = load_glossary(project_dir, "glossary_cached")
+    reads = []
+    real_read = glossary._get_glossary_terms
+    monkeypatch.setattr(glossary, "_get_glossary_terms", lambda root: reads.append(root) or real_read(root))
+
+    for name in ("a", "b", "c"):
+        glossary._linkify(["The memory buffer."], _glossary_page(f"pages/explanation/{name}.md"))
+    assert len(reads) == 1, f"the glossary was read {len(reads)} times for three pages"
+
+    _write_glossary(project_dir, extra="Warm start { #warm-start .autolink }\n:   Resuming from a fit.\n")
+    out = "\n".join(glossary._linkify(["A warm start."], _glossary_page()))
+    assert "[warm start](glossary.md#warm-start)" in out, "an edited glossary was not picked up"
+    assert len(reads) == 2
+
+
+def _alternation_link(lines, terms):
+    """The regex linker the trie replaced, kept here as the reference semantics."""
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\b", re.IGNORECASE
+    )
+    linked = set()
+
+    def _sub(match):
+        term = match.group(1).lower()
+        if term in linked:
+            return match.group(0)
+        linked.add(term)
+        return f"[{match.group(0)}](glossary.md#{terms[term]})"
+
+    return [pattern.sub(_sub, line) for line in lines]
+
+
+def _thousand_term_corpus():
+    """A synthetic 1,000-term glossary and 1,500 lines of prose that use it.
+
+    The terms are one to three words drawn from a shared vocabulary, so many
+    are prefixes of others (longest-match-first is exercised) and many recur
+    (first-occurrence-only is too). The prose mixes case, as real prose does.
+    """
+    import random
+
+    rng = random.Random(0)  # noqa: S311
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(600)
+    ]
+    terms = {}
+    while len(terms) < 1000:
+        term = " ".join(rng.sample(vocabulary, rng.randint(1, 3)))
+        terms[term] = term.replace(" ", "-")
+    phrases = vocabulary + list(terms)
+    lines = [
+        " ".join(rng.choice(phrases).title() if rng.random() < 0.2 else rng.choice(phrases) for _ in range(25)) + "."
+        for _ in range(1500)
+    ]
+    return terms, lines
+
+
+def _trie_link(glossary, lines, terms):
+    trie = glossary._build_trie(terms)
+    linked = set()
+    return [glossary._link_prose(line, trie, terms, "glossary.md", linked) for line in lines]
+
+
+@pytest.mark.slow
+def test_glossary_matcher_links_a_thousand_terms_as_the_regex_did(copie_session_minimal):
+    """On a synthetic 1,000-term glossary the trie links exactly as the alternation it replaced."""
+    glossary = load_glossary(copie_session_minimal.project_dir, "glossary_equiv")
+    terms, lines = _thousand_term_corpus()
+    actual = _trie_link(glossary, lines, terms)
+    assert actual == _alternation_link(lines, terms), "the trie matcher links differently from the alternation"
+    assert sum(line.count("](glossary.md#") for line in actual) > 100, "the corpus links too little to test anything"
+
+
+@pytest.mark.benchmark
+def test_glossary_matcher_benchmark_on_a_thousand_terms(copie_session_minimal):
+    """The trie links a 1,000-term glossary faster than the regex alternation.
+
+    Wall-clock against wall-clock, so it sits behind the `benchmark` marker with
+    the other timing checks; `test_glossary_matcher_links_a_thousand_terms_as_the_regex_did`
+    is the always-on check that the two agree.
+    """
+    import time
+
+    glossary = load_glossary(copie_session_minimal.project_dir, "glossary_bench")
+    terms, lines = _thousand_term_corpus()
+
+    started = time.perf_counter()
+    _alternation_link(lines, terms)
+    regex_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _trie_link(glossary, lines, terms)
+    trie_seconds = time.perf_counter() - started
+
+    print(f"\n1000-term glossary over {len(lines)} lines: regex {regex_seconds:.3f}s, trie {trie_seconds:.3f}s")
+    assert trie_seconds < regex_seconds, (
+        f"the trie ({trie_seconds:.3f}s) is not faster than the regex ({regex_seconds:.3f}s)"
+    )
+
+
 def _write_notebook(project_dir, stem, gallery_body, imports=""):
     nb = project_dir / "examples" / f"{stem}.py"
     nb.parent.mkdir(parents=True, exist_ok=True)
@@ -2519,7 +2579,7 @@ def test_notebook_export_is_cached_by_source_hash(copie_session_default):
     `mkdocs serve`.
     """
     project_dir = copie_session_default.project_dir
-    build = _load_build(project_dir, "nbcache")
+    build = load_build(project_dir, "nbcache")
 
     notebook = project_dir / "examples" / "cache_probe.py"
     notebook.parent.mkdir(parents=True, exist_ok=True)
@@ -2527,26 +2587,308 @@ def test_notebook_export_is_cached_by_source_hash(copie_session_default):
     output_dir = project_dir / "docs" / "examples" / "cache_probe"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    digest = build._notebooks._notebook_content_hash(notebook)
+    manifest = build._notebooks._export_manifest(project_dir, notebook)
 
     # Nothing exported yet.
-    assert not build._notebooks._is_cached(output_dir, digest), "claimed a cache hit with no exported page"
+    assert not build._notebooks._is_cached(output_dir, manifest), "claimed a cache hit with no exported page"
 
-    # A hash with no rendered page must not count: the export may have died
+    # A manifest with no rendered page must not count: the export may have died
     # before writing the html, and reusing that ships a missing page.
-    (output_dir / build._notebooks._SOURCE_HASH_FILE).write_text(digest, encoding="utf-8")
-    assert not build._notebooks._is_cached(output_dir, digest), "claimed a cache hit with no index.html"
+    (output_dir / build._notebooks._MANIFEST_FILE).write_text(json.dumps(manifest), encoding="utf-8")
+    assert not build._notebooks._is_cached(output_dir, manifest), "claimed a cache hit with no index.html"
 
     (output_dir / "index.html").write_text("<html></html>", encoding="utf-8")
-    assert build._notebooks._is_cached(output_dir, digest), "did not reuse an unchanged export"
+    assert build._notebooks._is_cached(output_dir, manifest), "did not reuse an unchanged export"
 
     # Editing the notebook must invalidate it, or the site serves a stale render.
     notebook.write_text("x = 2\n", encoding="utf-8")
-    assert not build._notebooks._is_cached(output_dir, build._notebooks._notebook_content_hash(notebook)), (
+    assert not build._notebooks._is_cached(output_dir, build._notebooks._export_manifest(project_dir, notebook)), (
         "reused the export of an edited notebook"
     )
 
 
+def test_notebook_export_is_invalidated_by_the_package_it_imports(copie_session_default):
+    """A package edit the notebook can see re-exports it; one it cannot see does not.
+
+    Hashing the notebook alone left a stale render in place forever after an
+    edit to the package changed its output. The imports are followed through the
+    package: the notebook imports the root, whose `__init__` imports `hello`.
+    """
+    project_dir = copie_session_default.project_dir
+    build = load_build(project_dir, "nbmanifest")
+    package_dir = project_dir / "src" / "test_project"
+    init = package_dir / "__init__.py"
+    unrelated = package_dir / "unrelated.py"
+    original_init = init.read_text(encoding="utf-8")
+    notebook = project_dir / "examples" / "manifest_probe.py"
+    notebook.write_text("import marimo\n\nfrom test_project import Greeter\n", encoding="utf-8")
+    try:
+        init.write_text(original_init + "\nfrom .hello import Greeter\n", encoding="utf-8")
+        unrelated.write_text("X = 1\n", encoding="utf-8")
+        manifest = build._notebooks._export_manifest(project_dir, notebook)
+        assert set(manifest["modules"]) == {"src/test_project/__init__.py", "src/test_project/hello.py"}
+        assert {"notebook", "lockfile", "marimo"} <= set(manifest)
+
+        unrelated.write_text("X = 2\n", encoding="utf-8")
+        assert build._notebooks._export_manifest(project_dir, notebook) == manifest, (
+            "a module the notebook never imports invalidated its export"
+        )
+
+        hello = package_dir / "hello.py"
+        hello_source = hello.read_text(encoding="utf-8")
+        hello.write_text(hello_source + "\n# changed\n", encoding="utf-8")
+        try:
+            assert build._notebooks._export_manifest(project_dir, notebook) != manifest, (
+                "an edit to a module the notebook imports (through the package root) kept the stale export"
+            )
+        finally:
+            hello.write_text(hello_source, encoding="utf-8")
+    finally:
+        init.write_text(original_init, encoding="utf-8")
+        unrelated.unlink(missing_ok=True)
+        notebook.unlink()
+
+
+def _fake_marimo(record, *, fail=(), missing=(), barrier=None, linger=0.0):
+    """A `subprocess.run` stand-in for marimo's export: records each call, writes the page.
+
+    Exports are subprocesses, so the scheduler is what is under test here, not
+    marimo -- which the sandboxed suite may not even have. A stem in *missing*
+    fails as if marimo were not installed, at once; every other export then
+    takes *linger* seconds.
+    """
+    import threading
+    import time
+
+    lock = threading.Lock()
+
+    def run(cmd, **_kwargs):
+        notebook = Path(cmd[cmd.index("--no-sandbox") + 1])
+        with lock:
+            record.append(notebook.stem)
+        if barrier is not None:
+            barrier.wait()
+        if notebook.stem in missing:
+            raise FileNotFoundError(cmd[0])
+        time.sleep(linger)
+        if notebook.stem in fail:
+            raise subprocess.CalledProcessError(1, cmd, stderr=f"boom in {notebook.stem}")
+        Path(cmd[cmd.index("-o") + 1]).write_text("<html></html>", encoding="utf-8")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    return run
+
+
+def _notebook_project(copie, stems):
+    """A fresh project whose examples are exactly *stems*, each a trivial notebook."""
+    result = copie.copy(extra_answers={"include_examples": True})
+    assert result.exit_code == 0
+    examples = result.project_dir / "examples"
+    for existing in examples.rglob("*.py"):
+        existing.unlink()
+    for stem in stems:
+        (examples / f"{stem}.py").write_text(f"x = {stem!r}\n", encoding="utf-8")
+    return result.project_dir
+
+
+def test_notebook_export_starts_the_longest_first(copie, monkeypatch):
+    """Never-timed notebooks go first, then the rest by last-known duration.
+
+    The slowest export bounds a concurrent build; started last, it finishes last.
+    """
+    project_dir = _notebook_project(copie, ["quick", "slow", "fresh"])
+    build = load_build(project_dir, "nb_order")
+    build._notebooks._artifacts.store(
+        project_dir, "notebook_durations", "durations", {"examples/quick.py": 1.0, "examples/slow.py": 40.0}
+    )
+    started = []
+    monkeypatch.setattr(build._notebooks.subprocess, "run", _fake_marimo(started))
+
+    build._notebooks.export(project_dir, workers=1)
+
+    assert started == ["fresh", "slow", "quick"]
+    durations = build._notebooks._artifacts.load(project_dir, "notebook_durations", "durations")
+    assert set(durations) == {"examples/quick.py", "examples/slow.py", "examples/fresh.py"}
+
+
+def test_notebook_export_runs_workers_concurrently(copie, monkeypatch):
+    """`MKDOCS_NOTEBOOK_WORKERS` notebooks really do run at once.
+
+    Each fake export waits at a barrier sized to the worker count, so a serial
+    loop deadlocks into the barrier's timeout instead of passing.
+    """
+    import threading
+
+    project_dir = _notebook_project(copie, ["a", "b", "c"])
+    build = load_build(project_dir, "nb_concurrent")
+    started = []
+    monkeypatch.setattr(
+        build._notebooks.subprocess, "run", _fake_marimo(started, barrier=threading.Barrier(3, timeout=10))
+    )
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_WORKERS", "3")
+
+    build._notebooks.export(project_dir)
+
+    assert sorted(started) == ["a", "b", "c"]
+    assert all((project_dir / "docs" / "examples" / s / "index.html").is_file() for s in started)
+
+
+def test_notebook_export_failures_are_collected_not_fatal_midway(copie, monkeypatch, capsys):
+    """One failing notebook does not stop the others; the summary names every failure."""
+    project_dir = _notebook_project(copie, ["good", "bad", "worse"])
+    build = load_build(project_dir, "nb_failures")
+    started = []
+    monkeypatch.setattr(build._notebooks.subprocess, "run", _fake_marimo(started, fail={"bad", "worse"}))
+
+    with pytest.raises(RuntimeError) as excinfo:
+        build._notebooks.export(project_dir, workers=2)
+
+    assert str(excinfo.value) == (
+        "[docs] 2 notebook(s) had cell execution errors:\n  - examples/bad.py\n  - examples/worse.py"
+    )
+    assert (project_dir / "docs" / "examples" / "good" / "index.html").is_file()
+    err = capsys.readouterr().err
+    # Each failure's report is printed in one piece, its stderr right below it.
+    for stem in ("bad", "worse"):
+        assert re.search(rf"FAILED html examples/{stem}\.py: [^\n]*\nboom in {stem}\n", err), err
+
+
+def test_notebook_export_drains_running_exports_when_marimo_is_missing(copie, monkeypatch, capsys):
+    """A missing marimo stops new exports, not the record of ones already running.
+
+    All three start at once; the missing-marimo result arrives first, and the
+    failure and the success that finish after it are still reported and timed.
+    """
+    import threading
+
+    project_dir = _notebook_project(copie, ["bad", "good", "nomarimo"])
+    build = load_build(project_dir, "nb_missing")
+    started = []
+    monkeypatch.setattr(
+        build._notebooks.subprocess,
+        "run",
+        _fake_marimo(started, fail={"bad"}, missing={"nomarimo"}, barrier=threading.Barrier(3, timeout=10), linger=0.3),
+    )
+
+    with pytest.raises(RuntimeError, match=r"1 notebook\(s\) had cell execution errors:\n  - examples/bad\.py$"):
+        build._notebooks.export(project_dir, workers=3)
+
+    durations = build._notebooks._artifacts.load(project_dir, "notebook_durations", "durations")
+    assert set(durations) == {"examples/bad.py", "examples/good.py"}
+    assert capsys.readouterr().err.count("marimo not found") == 1
+
+
+def test_notebook_export_rejects_a_zero_worker_count(copie):
+    """`workers=0` is an error, not a silent fallback to the CPU count."""
+    project_dir = _notebook_project(copie, ["a"])
+    build = load_build(project_dir, "nb_zero_workers")
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        build._notebooks.export(project_dir, workers=0)
+
+
+def test_notebook_export_runs_one_notebook_per_stem(copie, monkeypatch):
+    """Notebooks sharing a stem share an output dir; only the last in sorted order is exported.
+
+    Run on separate threads, both would rmtree and refill one directory while the
+    other's export is still writing there.
+    """
+    project_dir = _notebook_project(copie, ["other"])
+    for subdir in ("dir_a", "dir_b"):
+        (project_dir / "examples" / subdir).mkdir()
+        (project_dir / "examples" / subdir / "collide.py").write_text("x = 1\n", encoding="utf-8")
+    build = load_build(project_dir, "nb_stem_collision")
+    started, exported = [], []
+    fake = _fake_marimo(started)
+
+    def run(cmd, **kwargs):
+        exported.append(Path(cmd[cmd.index("--no-sandbox") + 1]).relative_to(project_dir).as_posix())
+        return fake(cmd, **kwargs)
+
+    monkeypatch.setattr(build._notebooks.subprocess, "run", run)
+    with caplog_at_warning() as records:
+        build._notebooks.export(project_dir, workers=4)
+
+    assert sorted(exported) == ["examples/dir_b/collide.py", "examples/other.py"]
+    assert any("only examples/dir_b/collide.py is exported" in r for r in records)
+
+
+def test_notebook_store_turns_a_fresh_checkout_into_a_restore(copie, monkeypatch, tmp_path):
+    """A second checkout sharing the store links the export instead of executing it."""
+    project_dir = _notebook_project(copie, ["shared"])
+    build = load_build(project_dir, "nb_store")
+    store = tmp_path / "store"
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_STORE", str(store))
+    started = []
+    monkeypatch.setattr(build._notebooks.subprocess, "run", _fake_marimo(started))
+    build._notebooks.export(project_dir, workers=1)
+    assert started == ["shared"]
+
+    # What a fresh clone or CI runner has: no exports in place, the store restored.
+    shutil.rmtree(project_dir / "docs" / "examples")
+    build._notebooks.export(project_dir, workers=1)
+
+    assert started == ["shared"], "a stored export was executed again"
+    page = project_dir / "docs" / "examples" / "shared" / "index.html"
+    stored = [p for p in store.rglob("index.html") if ".tmp" not in p.parent.name]
+    assert page.is_file() and len(stored) == 1
+    assert page.stat().st_ino == stored[0].stat().st_ino, "the restore copied instead of hardlinking on one filesystem"
+
+
+def test_notebook_store_evicts_least_recently_used_first(copie_session_default, monkeypatch, tmp_path):
+    """Pruning drops the entries used longest ago until the store fits its bound."""
+    build = load_build(copie_session_default.project_dir, "nb_prune")
+    store = tmp_path / "store"
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_STORE", str(store))
+    for age, key in enumerate(["aa" + "1" * 62, "bb" + "2" * 62, "cc" + "3" * 62]):
+        entry = store / key[:2] / key
+        entry.mkdir(parents=True)
+        (entry / "index.html").write_bytes(b"x" * 1000)
+        os.utime(entry, (1_000_000 + age, 1_000_000 + age))
+
+    removed, freed = build._notebooks.prune_store(max_bytes=1500)
+
+    assert (removed, freed) == (2, 2000)
+    assert [p.parent.name[:2] for p in store.rglob("index.html")] == ["cc"], "evicted the most recently used entry"
+
+
+def test_build_prune_store_refuses_without_a_store(copie_session_default, monkeypatch):
+    """`build.py prune-store` with no store configured is an error, not a silent no-op."""
+    build = load_build(copie_session_default.project_dir, "nb_prune_cli")
+    monkeypatch.delenv("MKDOCS_NOTEBOOK_STORE", raising=False)
+    with pytest.raises(SystemExit, match="MKDOCS_NOTEBOOK_STORE"):
+        build.prune_store("10")
+
+
+def test_notebook_store_sweeps_interrupted_writes(copie_session_default, monkeypatch, tmp_path):
+    """Staging left by an interrupted store write is removed once stale, never while it may be live."""
+    build = load_build(copie_session_default.project_dir, "nb_sweep")
+    store = tmp_path / "store"
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_STORE", str(store))
+    monkeypatch.delenv("MKDOCS_NOTEBOOK_STORE_MAX_MB", raising=False)
+    stale, live = store / "aa" / ".aa1.123.4.tmp", store / "bb" / ".bb2.567.8.tmp"
+    for staging in (stale, live):
+        staging.mkdir(parents=True)
+        (staging / "index.html").write_bytes(b"x")
+    os.utime(stale, (1_000_000, 1_000_000))
+
+    assert build._notebooks.prune_store() == (0, 0)
+
+    assert not stale.exists(), "an interrupted write was left in the store"
+    assert live.is_dir(), "a write that may still be renamed into place was removed"
+
+
+@pytest.mark.parametrize("size", ["ten", "-1", "nan", "inf"])
+def test_build_prune_store_rejects_a_malformed_size(copie_session_default, monkeypatch, tmp_path, size):
+    """A bad size, on the command line or in the environment, exits with a message, not a traceback."""
+    build = load_build(copie_session_default.project_dir, "nb_prune_size")
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_STORE", str(tmp_path / "store"))
+    with pytest.raises(SystemExit, match=rf"prune-store size must be a size in MB, got '{size}'"):
+        build.prune_store(size)
+    monkeypatch.setenv("MKDOCS_NOTEBOOK_STORE_MAX_MB", size)
+    with pytest.raises(SystemExit, match=rf"MKDOCS_NOTEBOOK_STORE_MAX_MB must be a size in MB, got '{size}'"):
+        build.prune_store()
+
+
 def test_notebook_cache_is_absent_without_examples(copie_session_minimal):
     """The caching code ships only where notebooks do.
 
@@ -2554,11 +2896,15 @@ def test_notebook_cache_is_absent_without_examples(copie_session_minimal):
     project does not ship at all -- so no build module carries it. Scanning every
     build script (not just one file) keeps this honest against wherever the code
     might reappear.
+
+    Hashing as such is no longer a signal: every project persists its API surface
+    through `_artifacts.py`, which hashes the package source. What must not leak
+    is the notebook cache's own machinery.
     """
     build = copie_session_minimal.project_dir / BUILD_DIR
     sources = "\n".join(p.read_text(encoding="utf-8") for p in sorted(build.glob("*.py")))
     assert "_notebook_content_hash" not in sources, "notebook caching leaked into a no-examples project"
-    assert "import hashlib" not in sources, "hashlib imported with nothing to hash"
+    assert "_MANIFEST_FILE" not in sources, "the notebook export manifest leaked into a no-examples project"
 
 
 def _reset_gallery_caches(markers):
@@ -2577,7 +2923,7 @@ def test_declared_api_references_override_imports(copie_session_default):
         '"title": "Declared", "description": "d", "category": "tutorial", "api_references": ["Beta"]',
         imports="from test_project.models import Alpha, Gamma\n",
     )
-    markers = _load_markers(project_dir, "egl_declared")
+    markers = load_markers(project_dir, "egl_declared")
     _reset_gallery_caches(markers)
 
     usage = markers._get_notebook_api_usage(project_dir)
@@ -2602,7 +2948,7 @@ def test_absent_api_references_falls_back_to_imports(copie_session_default):
         '"title": "Fallback", "description": "d", "category": "tutorial"',
         imports="from test_project.models import Alpha\n",
     )
-    markers = _load_markers(project_dir, "egl_fallback")
+    markers = load_markers(project_dir, "egl_fallback")
     _reset_gallery_caches(markers)
 
     usage = markers._get_notebook_api_usage(project_dir)
@@ -2621,7 +2967,7 @@ def test_empty_api_references_means_no_pages(copie_session_default):
         '"title": "Optout", "description": "d", "category": "tutorial", "api_references": []',
         imports="from test_project.models import Alpha\n",
     )
-    markers = _load_markers(project_dir, "egl_empty")
+    markers = load_markers(project_dir, "egl_empty")
     _reset_gallery_caches(markers)
 
     usage = markers._get_notebook_api_usage(project_dir)
@@ -2639,7 +2985,7 @@ def test_unresolvable_api_reference_is_ignored(copie_session_default):
         "bogus_nb",
         '"title": "Bogus", "description": "d", "category": "tutorial", "api_references": ["NotAThing", "Beta"]',
     )
-    markers = _load_markers(project_dir, "egl_bogus")
+    markers = load_markers(project_dir, "egl_bogus")
     _reset_gallery_caches(markers)
 
     usage = markers._get_notebook_api_usage(project_dir)
@@ -2663,7 +3009,7 @@ def test_api_example_cards_are_capped(copie_session_default):
             f"capped_{i:02d}",
             f'"title": "Capped {i:02d}", "description": "d", "category": "tutorial", "api_references": ["Capstone"]',
         )
-    markers = _load_markers(project_dir, "egl_cap")
+    markers = load_markers(project_dir, "egl_cap")
     _reset_gallery_caches(markers)
 
     html = markers._build_api_examples_html(project_dir, "test_project.capped.Capstone")
@@ -2687,7 +3033,7 @@ def test_api_example_cards_under_cap_have_no_gallery_link(copie_session_default)
         "solo_nb",
         '"title": "Solo", "description": "d", "category": "tutorial", "api_references": ["Gamma"]',
     )
-    markers = _load_markers(project_dir, "egl_undercap")
+    markers = load_markers(project_dir, "egl_undercap")
     _reset_gallery_caches(markers)
 
     html = markers._build_api_examples_html(project_dir, "test_project.models.Gamma")
@@ -2698,7 +3044,7 @@ def test_api_example_cards_under_cap_have_no_gallery_link(copie_session_default)
 
 def test_companion_path_variants_match_same_page(copie_session_default):
     """companion is hand-written, so authored spellings must all match."""
-    markers = _load_markers(copie_session_default.project_dir, "egl_norm")
+    markers = load_markers(copie_session_default.project_dir, "egl_norm")
     variants = [
         "/pages/how-to/x/",
         "pages/how-to/x",
@@ -2712,7 +3058,7 @@ def test_companion_path_variants_match_same_page(copie_session_default):
 def test_companion_placeholder_renders_nothing_when_unmatched(copie_session_default):
     """A page with the placeholder and no companion notebooks renders empty."""
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "egl_nocompanion")
+    markers = load_markers(project_dir, "egl_nocompanion")
     _reset_gallery_caches(markers)
 
     html = markers._build_companion_cards_html(project_dir, "pages/how-to/nobody-references-me.md")
@@ -2731,6 +3077,54 @@ def test_companion_cache_is_registered_by_name(copie_session_default):
     assert "_COMPANION_INDEX_CACHE" in markers_source, "companion cache does not follow the *_CACHE convention"
 
 
+def test_notebook_index_reparses_only_changed_notebooks(copie_session_default, monkeypatch):
+    """A fresh process answers from the persisted index; an edit re-parses one file.
+
+    The gallery, the usage map and the export each used to parse every notebook,
+    in every process. The index is keyed on each notebook's hash, so what a new
+    `build.py prebuild`, engine or `serve.py` pays is one parse per edited notebook.
+    """
+    project_dir = copie_session_default.project_dir
+    probe = project_dir / "examples" / "index_probe.py"
+    probe.write_text('__gallery__ = {"title": "Probe"}\n\nfrom test_project import Greeter\n', encoding="utf-8")
+    try:
+        index = load_markers(project_dir, "nbindex_cold")._notebook_index
+        first = index.load(project_dir)
+        assert first[probe]["gallery"] == {"title": "Probe"}
+        assert first[probe]["imported_names"] == ["Greeter"]
+        assert first[probe]["package_imports"] == ["test_project", "test_project.Greeter"]
+
+        index = load_markers(project_dir, "nbindex_warm")._notebook_index
+        parsed = []
+        real_parse = index.ast.parse
+        monkeypatch.setattr(
+            index.ast, "parse", lambda source, *a, **kw: parsed.append(1) or real_parse(source, *a, **kw)
+        )
+        assert index.load(project_dir) == first
+        assert not parsed, "an unchanged notebook was parsed again in a fresh process"
+
+        probe.write_text('__gallery__ = {"title": "Edited"}\n', encoding="utf-8")
+        assert index.load(project_dir)[probe]["gallery"] == {"title": "Edited"}
+        assert len(parsed) == 1, f"one edited notebook cost {len(parsed)} parses"
+    finally:
+        probe.unlink()
+
+
+def test_gallery_consumers_share_one_notebook_index(copie_session_default, monkeypatch):
+    """The gallery, the companion cards and EXAMPLES_FOR read one index per build."""
+    project_dir = copie_session_default.project_dir
+    markers = load_markers(project_dir, "nbindex_shared")
+    markers.reset_caches()
+    loads = []
+    real_load = markers._notebook_index.load
+    monkeypatch.setattr(markers._notebook_index, "load", lambda root: loads.append(root) or real_load(root))
+
+    markers._get_gallery_items(project_dir)
+    markers._get_companion_index(project_dir)
+    markers._get_notebook_api_usage(project_dir)
+    assert len(loads) == 1, f"examples/ was indexed {len(loads)} times in one build"
+
+
 def test_gallery_features_absent_without_examples(copie_session_minimal):
     """The whole feature is gated behind include_examples."""
     markers_source = (copie_session_minimal.project_dir / BUILD_DIR / "_markers.py").read_text(encoding="utf-8")
@@ -2791,9 +3185,9 @@ def test_markers_strip_examples_placeholder_without_examples(copie_session_minim
     import behind an ungated caller, so the gated `_inject` path gets its own test.
     """
     project_dir = copie_session_minimal.project_dir
-    markers = _load_markers(project_dir, "min_examples_for")
+    markers = load_markers(project_dir, "min_examples_for")
 
-    page = _FakePage("pages/reference/api.md", "pages/reference/api/index.html")
+    page = FakePage("pages/reference/api.md", "pages/reference/api/index.html")
     out = markers._inject("# API\n\n<!-- EXAMPLES_FOR:foo.Bar -->\n", page, config={})
 
     assert "EXAMPLES_FOR" not in out, "the examples marker was not stripped in a no-examples project"
@@ -3056,7 +3450,7 @@ def _cache_modules(markers_module):
     directly, so these are the instances bound to *this* generated project.
     """
     modules = [markers_module]
-    modules += [m for m in (getattr(markers_module, n, None) for n in _BUILD_STEP_MODULES) if m is not None]
+    modules += [m for m in (getattr(markers_module, n, None) for n in BUILD_STEP_MODULES) if m is not None]
     return modules
 
 
@@ -3090,7 +3484,7 @@ def test_on_config_resets_every_cache(request, fixture_name, expects_gallery):
     second variant is never actually exercised.
     """
     project_dir = request.getfixturevalue(fixture_name).project_dir
-    markers = _load_markers(project_dir, f"reset_{fixture_name}")
+    markers = load_markers(project_dir, f"reset_{fixture_name}")
 
     found = _cache_names(markers)
     assert found, "no *_CACHE globals discovered"
@@ -3122,7 +3516,7 @@ def test_reset_caches_returns_none(copie_session_default):
     ``reset_caches`` has no config to hand back and no hook contract to meet, so
     it simply returns None.
     """
-    markers = _load_markers(copie_session_default.project_dir, "reset_returns")
+    markers = load_markers(copie_session_default.project_dir, "reset_returns")
     assert markers.reset_caches() is None
 
 
@@ -3171,7 +3565,14 @@ def test_build_steps_import_no_mkdocs(request, fixture_name, expects_notebooks):
     and a substring guard fails on both.
     """
     build = request.getfixturevalue(fixture_name).project_dir / BUILD_DIR
-    steps = ["_api_pages.py", "_markdown_export.py"] + (["_notebooks.py"] if expects_notebooks else [])
+    steps = [
+        "_api_pages.py",
+        "_markdown_export.py",
+        "_precompress.py",
+        "_profile.py",
+        "_artifacts.py",
+        "_config.py",
+    ] + (["_notebooks.py", "_notebook_index.py", "_example_assets.py"] if expects_notebooks else [])
     for step in steps:
         path = build / step
         assert path.is_file(), f"{step} was not generated"
@@ -3182,6 +3583,8 @@ def test_notebooks_module_absent_without_examples(copie_session_minimal):
     """A project without examples gets no notebook export module, and no dangling call."""
     build = copie_session_minimal.project_dir / BUILD_DIR
     assert not (build / "_notebooks.py").exists(), "the notebook export module shipped without examples"
+    assert not (build / "_notebook_index.py").exists(), "the notebook index module shipped without examples"
+    assert not (build / "_example_assets.py").exists(), "the example asset module shipped without examples"
     build_source = (build / "build.py").read_text(encoding="utf-8")
     assert "_notebooks" not in build_source, "build.py references a module this project does not have"
 
@@ -3215,7 +3618,7 @@ def test_api_pages_generate_runs_without_a_docs_build(copie_session_default, tmp
     if api_dir.exists():
         shutil.rmtree(api_dir)
 
-    build = _load_build(project, "steps_generate")
+    build = load_build(project, "steps_generate")
     build._api_pages.generate(project)
 
     assert (api_dir / "hello.md").is_file(), "no submodule page was generated"
@@ -3250,7 +3653,7 @@ def test_markdown_export_runs_against_a_prebuilt_site(copie_session_default, tmp
         encoding="utf-8",
     )
 
-    build = _load_build(copie_session_default.project_dir, "steps_mdexport")
+    build = load_build(copie_session_default.project_dir, "steps_mdexport")
     build._markdown_export.export(site_dir, docs_dir)
 
     rendered = (site_dir / "pages" / "guide.md").read_text(encoding="utf-8")
@@ -3259,6 +3662,290 @@ def test_markdown_export_runs_against_a_prebuilt_site(copie_session_default, tmp
     assert "Body text." in fallback, "a page with no built HTML was not copied as source"
 
 
+def _markdown_site(tmp_path, pages):
+    """A docs tree and a built site holding one rendered article per page in *pages*."""
+    docs_dir, site_dir = tmp_path / "docs", tmp_path / "site"
+    for stem, body in pages.items():
+        (docs_dir / "pages").mkdir(parents=True, exist_ok=True)
+        (docs_dir / "pages" / f"{stem}.md").write_text(f"# {stem}\n", encoding="utf-8")
+        (site_dir / "pages" / stem).mkdir(parents=True, exist_ok=True)
+        (site_dir / "pages" / stem / "index.html").write_text(
+            f'<html><body><article class="md-content__inner md-typeset"><h1>{stem}</h1><p>{body}</p></article>'
+            "</body></html>",
+            encoding="utf-8",
+        )
+    return docs_dir, site_dir
+
+
+def test_markdown_export_converts_only_changed_articles(copie_session_default, tmp_path, monkeypatch):
+    """A postbuild after one edit converts one page; the rest come from the last run.
+
+    The engine empties the site on every build, so the unchanged pages' Markdown
+    must be restored from `.artifacts/`, not merely left alone.
+    """
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First.", "beta": "Second."})
+    project_root = tmp_path / "project"
+    build = load_build(copie_session_default.project_dir, "mdexport_incremental")
+    export = build._markdown_export
+    export.export(site_dir, docs_dir, project_root)
+    first = {stem: (site_dir / "pages" / f"{stem}.md").read_text(encoding="utf-8") for stem in ("alpha", "beta")}
+
+    converted = []
+    real_convert = export._html_to_markdown
+    monkeypatch.setattr(export, "_html_to_markdown", lambda html: converted.append(html) or real_convert(html))
+    for stem in ("alpha", "beta"):
+        (site_dir / "pages" / f"{stem}.md").unlink()
+    beta_html = site_dir / "pages" / "beta" / "index.html"
+    beta_html.write_text(beta_html.read_text(encoding="utf-8").replace("Second.", "Edited."), encoding="utf-8")
+    export.export(site_dir, docs_dir, project_root)
+
+    assert len(converted) == 1 and "Edited." in converted[0], f"converted {len(converted)} pages for one edit"
+    assert (site_dir / "pages" / "alpha.md").read_text(encoding="utf-8") == first["alpha"]
+    assert "Edited." in (site_dir / "pages" / "beta.md").read_text(encoding="utf-8")
+
+
+def test_markdown_export_prunes_deleted_pages(copie_session_default, tmp_path):
+    """A page removed from the docs loses its Markdown copy and its cached conversion."""
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First.", "beta": "Second."})
+    project_root = tmp_path / "project"
+    export = load_build(copie_session_default.project_dir, "mdexport_prune")._markdown_export
+    export.export(site_dir, docs_dir, project_root)
+    converted_dir = project_root / ARTIFACTS_DIR / "docs_build" / export._CONVERTED_DIR
+    assert len(list(converted_dir.glob("*.md"))) == 2
+
+    (docs_dir / "pages" / "beta.md").unlink()
+    export.export(site_dir, docs_dir, project_root)
+
+    assert not (site_dir / "pages" / "beta.md").exists(), "a deleted page kept its Markdown copy"
+    assert (site_dir / "pages" / "alpha.md").is_file()
+    assert len(list(converted_dir.glob("*.md"))) == 1, "the deleted page's conversion was kept"
+
+
+def test_markdown_export_prunes_deleted_pages_it_copied_as_source(copie_session_default, tmp_path):
+    """A page with no built article is copied as source, and is pruned like a converted one."""
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First."})
+    (docs_dir / "pages" / "unbuilt.md").write_text("# Unbuilt\n", encoding="utf-8")
+    project_root = tmp_path / "project"
+    export = load_build(copie_session_default.project_dir, "mdexport_prune_fallback")._markdown_export
+    export.export(site_dir, docs_dir, project_root)
+    assert (site_dir / "pages" / "unbuilt.md").read_text(encoding="utf-8") == "# Unbuilt\n"
+
+    (docs_dir / "pages" / "unbuilt.md").unlink()
+    export.export(site_dir, docs_dir, project_root)
+
+    assert not (site_dir / "pages" / "unbuilt.md").exists(), "a deleted source-copied page kept its Markdown"
+    assert (site_dir / "pages" / "alpha.md").is_file()
+
+
+def test_markdown_export_process_pool_matches_in_process(copie_session_default, tmp_path, monkeypatch):
+    """`MKDOCS_MARKDOWN_WORKERS` converts on a process pool, to byte-identical output."""
+    pages = {f"page{i}": f"Body <strong>{i}</strong> with <code>x</code>." for i in range(12)}
+    export = load_build(copie_session_default.project_dir, "mdexport_pool")._markdown_export
+
+    serial_docs, serial_site = _markdown_site(tmp_path / "serial", pages)
+    export.export(serial_site, serial_docs, tmp_path / "serial" / "project", workers=1)
+    monkeypatch.setenv(export._WORKERS_ENV, "3")
+    pooled_docs, pooled_site = _markdown_site(tmp_path / "pooled", pages)
+    export.export(pooled_site, pooled_docs, tmp_path / "pooled" / "project")
+
+    for stem in pages:
+        relative = Path("pages") / f"{stem}.md"
+        assert (pooled_site / relative).read_bytes() == (serial_site / relative).read_bytes()
+
+
+def test_markdown_export_bundles_pages_in_nav_order(copie_session_default, tmp_path):
+    """`llms-full.txt` follows the mkdocs.yml nav, and its index locates every page by byte range."""
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First.", "beta": "Second.", "gamma": "Third."})
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    (project_root / "mkdocs.yml").write_text(
+        "nav:\n  - Guide:\n    - Beta: pages/beta.md\n    - pages/alpha.md\n  - Home: https://example.com\n",
+        encoding="utf-8",
+    )
+    export = load_build(copie_session_default.project_dir, "mdexport_bundle")._markdown_export
+    export.export(site_dir, docs_dir, project_root)
+
+    bundle = (site_dir / "llms-full.txt").read_bytes()
+    index = json.loads((site_dir / "llms-full.index.json").read_text(encoding="utf-8"))
+    entries = index["llms-full.txt"]
+    assert [e["page"] for e in entries] == ["pages/beta.md", "pages/alpha.md", "pages/gamma.md"], (
+        "nav pages must come first, in nav order, with unlisted pages after"
+    )
+    assert entries[0]["title"] == "Beta" and entries[0]["url"] == "pages/beta/"
+    assert sum(e["length"] for e in entries) == len(bundle)
+    for entry in entries:
+        chunk = bundle[entry["offset"] : entry["offset"] + entry["length"]]
+        assert chunk.startswith(f"<!-- page: {entry['url']} -->".encode())
+        assert (site_dir / entry["page"]).read_bytes().strip() in chunk
+    assert not list(site_dir.glob("llms-guide.txt")), "section bundles are opt-in"
+
+
+def test_markdown_export_writes_section_bundles_when_asked(copie_session_default, tmp_path, monkeypatch):
+    """`MKDOCS_LLMS_SECTIONS` adds one bundle per top-level nav section, indexed like the full one."""
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First.", "beta": "Second."})
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    (project_root / "mkdocs.yml").write_text(
+        "nav:\n  - How-to Guides:\n    - pages/alpha.md\n  - Beta: pages/beta.md\n", encoding="utf-8"
+    )
+    export = load_build(copie_session_default.project_dir, "mdexport_sections")._markdown_export
+    monkeypatch.setenv(export._SECTIONS_ENV, "1")
+    export.export(site_dir, docs_dir, project_root)
+
+    index = json.loads((site_dir / "llms-full.index.json").read_text(encoding="utf-8"))
+    assert sorted(index) == ["llms-full.txt", "llms-how-to-guides.txt"]
+    section = index["llms-how-to-guides.txt"]
+    assert [e["page"] for e in section] == ["pages/alpha.md"] and section[0]["offset"] == 0
+    assert (site_dir / "llms-how-to-guides.txt").read_bytes() == (
+        (site_dir / "llms-full.txt").read_bytes()[: section[0]["length"]]
+    )
+
+
+def test_markdown_export_section_bundles_never_share_a_file(copie_session_default, tmp_path, monkeypatch):
+    """A section slugging to `full`, or to another section's slug, gets a file of its own.
+
+    "Full" would otherwise be written into `llms-full.txt` a second time through
+    the same handle, and "API" and "Api!" would merge into one bundle.
+    """
+    docs_dir, site_dir = _markdown_site(tmp_path, {"alpha": "First.", "beta": "Second.", "gamma": "Third."})
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    (project_root / "mkdocs.yml").write_text(
+        "nav:\n  - Full:\n    - pages/alpha.md\n  - API:\n    - pages/beta.md\n  - Api!:\n    - pages/gamma.md\n",
+        encoding="utf-8",
+    )
+    export = load_build(copie_session_default.project_dir, "mdexport_section_slugs")._markdown_export
+    monkeypatch.setenv(export._SECTIONS_ENV, "1")
+    export.export(site_dir, docs_dir, project_root)
+
+    index = json.loads((site_dir / "llms-full.index.json").read_text(encoding="utf-8"))
+    assert {name: [e["page"] for e in entries] for name, entries in index.items()} == {
+        "llms-full.txt": ["pages/alpha.md", "pages/beta.md", "pages/gamma.md"],
+        "llms-full-2.txt": ["pages/alpha.md"],
+        "llms-api.txt": ["pages/beta.md"],
+        "llms-api-2.txt": ["pages/gamma.md"],
+    }
+    full = (site_dir / "llms-full.txt").read_bytes()
+    assert sum(e["length"] for e in index["llms-full.txt"]) == len(full)
+    assert full.count(b"<!-- page: pages/alpha/ -->") == 1
+
+
+def test_markdown_export_shares_asset_blocks_across_example_pages(copie_session_default, tmp_path):
+    """A frontend block embedded by several notebook pages ships once, under `examples/_assets/`.
+
+    Blocks only one page embeds, small blocks and data `<script>`s stay inline,
+    and the page still carries the injected RTD stylesheet.
+    """
+    runtime = "window.marimoRuntime = function () { return 42; };\n" * 60
+    theme = ".marimo { color: black; }\n" * 60
+    project_root = tmp_path / "project"
+    for stem in ("first", "second"):
+        export_dir = project_root / "docs" / "examples" / stem
+        export_dir.mkdir(parents=True)
+        (export_dir / "index.html").write_text(
+            f'<html><head><style media="screen">{theme}</style><script type="module">{runtime}</script>'
+            f'<script type="application/json">{{"notebook": "{stem}" {" " * 2048}}}</script>'
+            f"<script>var {stem} = 1;</script></head><body>{stem}</body></html>",
+            encoding="utf-8",
+        )
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    export = load_build(copie_session_default.project_dir, "mdexport_assets")._markdown_export
+    export.export(site_dir, docs_dir, project_root)
+
+    assets = site_dir / "examples" / "_assets"
+    shared = sorted(path.name for path in assets.iterdir())
+    assert sorted(name.rsplit(".", 1)[1] for name in shared) == ["css", "js"], shared
+    contents = {path.read_text(encoding="utf-8") for path in assets.iterdir()}
+    assert contents == {runtime, theme}
+    for stem in ("first", "second"):
+        page = (site_dir / "examples" / stem / "index.html").read_text(encoding="utf-8")
+        assert runtime not in page and theme not in page, f"{stem} still embeds a shared block"
+        for name in shared:
+            assert f"../_assets/{name}" in page, f"{stem} does not reference {name}"
+        assert '<script type="module" src="../_assets/' in page
+        assert 'media="screen"' in page, "the extracted block lost its attributes"
+        assert f'"notebook": "{stem}"' in page and f"var {stem} = 1;" in page
+        assert "readthedocs-flyout" in page, "the RTD stylesheet was not injected"
+
+
+@pytest.mark.parametrize(
+    ("css", "extractable"),
+    [
+        ('@import "theme.css";', False),
+        ("@import 'theme.css';", False),
+        ('.logo { background: url("logo.png"); }', False),
+        ('@import "https://cdn.example.com/theme.css";', True),
+        ('@import "/assets/theme.css";', True),
+        (".logo { background: url(data:image/png;base64,AAAA); }", True),
+    ],
+)
+def test_example_assets_keep_styles_with_relative_references_inline(copie_session_default, css, extractable):
+    """A style block that loads something by relative path resolves it elsewhere once moved to `_assets/`."""
+    example_assets = load_build(
+        copie_session_default.project_dir, "example_assets_relative"
+    )._markdown_export._example_assets
+    block = example_assets._BLOCK_RE.search(f"<style>{css}\n{'.x { color: red; }' * 100}</style>")
+    assert example_assets._extractable(block) is extractable
+
+
+def _precompress_site(tmp_path):
+    """A built site with one large compressible page, one tiny page and one incompressible script."""
+    site_dir = tmp_path / "site"
+    (site_dir / "pages" / "big").mkdir(parents=True)
+    (site_dir / "pages" / "big" / "index.html").write_text("<p>repeated text</p>\n" * 500, encoding="utf-8")
+    (site_dir / "index.html").write_text("<p>tiny</p>", encoding="utf-8")
+    (site_dir / "noise.js").write_bytes(os.urandom(4096))
+    (site_dir / "logo.png").write_bytes(b"\0" * 4096)
+    return site_dir
+
+
+def test_precompress_writes_only_worthwhile_gzip_siblings(copie_session_default, tmp_path):
+    """Large text files get a `.gz` that decompresses to them; small, incompressible and binary files do not."""
+    import gzip
+
+    site_dir = _precompress_site(tmp_path)
+    precompress = load_build(copie_session_default.project_dir, "precompress_basic")._precompress
+    precompress.compress(site_dir, tmp_path / "project", workers=2)
+
+    page = site_dir / "pages" / "big" / "index.html"
+    assert gzip.decompress((site_dir / "pages" / "big" / "index.html.gz").read_bytes()) == page.read_bytes()
+    assert not (site_dir / "index.html.gz").exists(), "a file below the size threshold was compressed"
+    assert not (site_dir / "noise.js.gz").exists(), "a variant that saves nothing was written"
+    assert not (site_dir / "logo.png.gz").exists(), "a binary asset was compressed"
+
+
+def test_precompress_recompresses_only_changed_files(copie_session_default, tmp_path, monkeypatch):
+    """A rebuild into an emptied site restores unchanged files' variants from `.artifacts/`."""
+    site_dir = _precompress_site(tmp_path)
+    (site_dir / "other.css").write_text("body { color: red; }\n" * 200, encoding="utf-8")
+    project_root = tmp_path / "project"
+    precompress = load_build(copie_session_default.project_dir, "precompress_incremental")._precompress
+    precompress.compress(site_dir, project_root, workers=1)
+    first = (site_dir / "other.css.gz").read_bytes()
+
+    compressed = []
+    real_compress_one = precompress._compress_one
+
+    def counting(path, encoders, previous, cache_dir):
+        result = real_compress_one(path, encoders, previous, cache_dir)
+        if result[2]:
+            compressed.append(path.name)
+        return result
+
+    monkeypatch.setattr(precompress, "_compress_one", counting)
+    for sibling in site_dir.rglob("*.gz"):
+        sibling.unlink()
+    page = site_dir / "pages" / "big" / "index.html"
+    page.write_text(page.read_text(encoding="utf-8") + "<p>edited</p>\n", encoding="utf-8")
+    precompress.compress(site_dir, project_root, workers=1)
+
+    assert compressed == ["index.html"], f"recompressed {compressed} for one edited page"
+    assert (site_dir / "other.css.gz").read_bytes() == first
+
+
 def _toc_hrefs(html):
     """Same-page hrefs listed in the rendered table of contents.
 
@@ -3527,7 +4214,7 @@ def test_no_phantom_cache_without_examples(copie_session_minimal):
     ungated reset silently grows module attributes nothing reads -- and the
     discovery test would then dutifully confirm they are cleared.
     """
-    markers = _load_markers(copie_session_minimal.project_dir, "reset_phantom")
+    markers = load_markers(copie_session_minimal.project_dir, "reset_phantom")
     markers.reset_caches()
 
     for gallery_cache in ("_GALLERY_CACHE", "_COMPANION_INDEX_CACHE", "_NOTEBOOK_API_USAGE_CACHE"):
@@ -3567,7 +4254,7 @@ def test_reexported_members_render_in_the_api_page_table(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "table_render")
+    markers = load_markers(project_dir, "table_render")
     _reset_hook_caches(markers)
 
     markers._api_pages._generate_api_pages(project_dir)
@@ -3591,7 +4278,7 @@ def test_api_name_lookup_prefers_the_published_path(copie_session_minimal):
         '"""Point."""\n\nfrom minimal_project.naive import SeasonalNaive\n\n__all__ = ["SeasonalNaive"]\n',
         encoding="utf-8",
     )
-    markers = _load_markers(project_dir, "prefer_public")
+    markers = load_markers(project_dir, "prefer_public")
     _reset_hook_caches(markers)
 
     lookup = markers._api_pages._get_api_name_lookup(project_dir)
@@ -3612,7 +4299,7 @@ def test_api_name_lookup_refuses_a_genuine_collision(copie_session_minimal):
         (project_dir / "src" / "minimal_project" / f"{mod}.py").write_text(
             f'"""{mod}."""\n\n\nclass Duplicated:\n    """From {mod}."""\n', encoding="utf-8"
         )
-    markers = _load_markers(project_dir, "collision")
+    markers = load_markers(project_dir, "collision")
     _reset_hook_caches(markers)
 
     lookup = markers._api_pages._get_api_name_lookup(project_dir)
@@ -3634,7 +4321,7 @@ def test_gallery_overflow_link_targets_the_real_gallery_page(copie_session_defau
     bug rather than catching it. Both forms are checked now.
     """
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "gallery_url")
+    markers = load_markers(project_dir, "gallery_url")
     markers._GALLERY_PAGE_CACHE = None
 
     url = markers._get_gallery_page_url(project_dir)
@@ -3708,10 +4395,10 @@ def test_companion_card_renders_with_resolved_links(copie_session_default):
         '"title": "Companion NB", "description": "Demo.", "category": "how-to",'
         ' "companion": "pages/how-to/configure.md"',
     )
-    markers = _load_markers(project_dir, "companion_render")
+    markers = load_markers(project_dir, "companion_render")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/how-to/configure.md", "pages/how-to/configure/index.html")
+    page = FakePage("pages/how-to/configure.md", "pages/how-to/configure/index.html")
     config = {"repo_url": "https://github.com/s/p"}
     out = markers._inject("<!-- COMPANION_NOTEBOOKS -->", page, config=config)
 
@@ -3762,10 +4449,10 @@ def test_reexported_symbols_appear_in_the_api_index(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "api_index")
+    markers = load_markers(project_dir, "api_index")
     _reset_hook_caches(markers)
 
-    prefix = markers._site_root_prefix(_FakePage("pages/reference/api.md", "pages/reference/api/index.html"))
+    prefix = markers._site_root_prefix(FakePage("pages/reference/api.md", "pages/reference/api/index.html"))
     html = markers._build_api_table_html(project_dir, prefix)
 
     assert "Circle" in html, "re-exported class absent from the searchable API index"
@@ -3804,10 +4491,10 @@ def test_api_index_links_resolve_wherever_the_index_lives(copie_session_minimal,
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, f"api_index_{src_path.count('/')}_{len(prefix)}")
+    markers = load_markers(project_dir, f"api_index_{src_path.count('/')}_{len(prefix)}")
     _reset_hook_caches(markers)
 
-    page = _FakePage(src_path, dest_path)
+    page = FakePage(src_path, dest_path)
     assert markers._site_root_prefix(page) == prefix
 
     html = markers._build_api_table_html(project_dir, markers._site_root_prefix(page))
@@ -3846,13 +4533,13 @@ def test_module_toc_is_built_and_resolves_wherever_the_page_lives(
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, f"mtoc_{template_name}_{src_path.count('/')}")
+    markers = load_markers(project_dir, f"mtoc_{template_name}_{src_path.count('/')}")
     markers._api_pages._SURFACE_CACHE = None
 
     # The submodule pages the TOC points at are generated, not committed.
     markers._api_pages._generate_api_pages(project_dir)
 
-    page = _FakePage(src_path, dest_path)
+    page = FakePage(src_path, dest_path)
     page.meta["template"] = template_name
     # _set_module_toc reads the project root from _markers.py's own location and
     # returns None, writing the sidebar onto page.meta directly.
@@ -3872,6 +4559,76 @@ def test_module_toc_is_built_and_resolves_wherever_the_page_lives(
         )
 
 
+def test_module_toc_index_matches_a_scan_of_the_pages(copie_session_minimal):
+    """The TOC index `generate` writes is exactly what reading the pages gives.
+
+    The index replaced a per-page re-read of every overview page. Any drift
+    between the two renders as a sidebar that disagrees with the page it sits
+    beside, with nothing erroring.
+    """
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "mtoc_index")
+    markers.reset_caches()
+    markers._api_pages._generate_api_pages(project_dir)
+    api_dir = project_dir / "docs" / "pages" / "api"
+
+    assert (project_dir / ARTIFACTS_DIR / "docs_build" / "module_toc.json").is_file()
+    index = markers._api_pages._load_module_toc(project_dir)
+    assert index, "the index lists no modules"
+    assert index == markers._api_pages._scan_module_toc(project_dir, api_dir)
+
+
+def test_module_toc_index_lists_no_page_that_is_not_on_disk(copie_session_minimal):
+    """A module in the surface with no overview page gets no sidebar entry, as the scan gives none."""
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "mtoc_missing_page")
+    markers.reset_caches()
+    api_pages = markers._api_pages
+    api_pages._generate_api_pages(project_dir)
+    api_dir = project_dir / "docs" / "pages" / "api"
+    template = (project_dir / BUILD_DIR / "api-submodule.html").read_text(encoding="utf-8")
+    surface = api_pages._load_surface(project_dir)
+    try:
+        api_pages._store_module_toc(project_dir, api_dir, template, {**surface, "ghost": surface["hello"]})
+        index = api_pages._load_module_toc(project_dir)
+        assert not any(entry["module"] == "ghost" for entry in index), "the sidebar links a page that does not exist"
+        assert index == api_pages._scan_module_toc(project_dir, api_dir)
+    finally:
+        api_pages._generate_api_pages(project_dir)
+
+
+def test_module_toc_reads_no_page_while_the_index_holds(copie_session_minimal, monkeypatch):
+    """Rendering many API pages reads the overview pages zero times, not once each."""
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "mtoc_no_reads")
+    markers.reset_caches()
+    markers._api_pages._generate_api_pages(project_dir)
+
+    def _scan(*_args):
+        raise AssertionError("the sidebar re-read the overview pages although the index was current")
+
+    monkeypatch.setattr(markers._api_pages, "_scan_module_toc", _scan)
+    tocs = [markers._build_module_toc(project_dir, f"pages/api/page{i}.md", "../../") for i in range(20)]
+    assert all(toc == tocs[0] for toc in tocs)
+
+
+def test_module_toc_falls_back_when_a_page_changed_after_generation(copie_session_minimal):
+    """A page edited after the index was written is read, not served from the index."""
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "mtoc_stale")
+    markers.reset_caches()
+    markers._api_pages._generate_api_pages(project_dir)
+    page = project_dir / "docs" / "pages" / "api" / "hello.md"
+    original = page.read_text(encoding="utf-8")
+    page.write_text(original + "\n### Added By Hand\n", encoding="utf-8")
+    try:
+        toc = markers._build_module_toc(project_dir, None, "")
+        hello = next(entry for entry in toc if entry["title"].endswith(".hello"))
+        assert any(child["url"].endswith("#added-by-hand") for child in hello["children"]), hello["children"]
+    finally:
+        page.write_text(original, encoding="utf-8")
+
+
 def _write_dependency_shim(project_dir, package_name):
     """A plain module whose public API is re-exported from outside the package.
 
@@ -3921,7 +4678,7 @@ def test_dependency_reexports_stay_in_the_api(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_dependency_shim(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "depshim")
+    markers = load_markers(project_dir, "depshim")
     _reset_hook_caches(markers)
 
     members = markers._get_public_members(project_dir, "shim")
@@ -3948,7 +4705,7 @@ def test_plain_module_imports_are_not_api_without_dunder_all(copie_session_minim
     """
     project_dir = copie_session_minimal.project_dir
     _write_dependency_shim(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "depshim_internal")
+    markers = load_markers(project_dir, "depshim_internal")
     _reset_hook_caches(markers)
 
     members = markers._get_public_members(project_dir, "internal")
@@ -3966,7 +4723,7 @@ def test_third_party_import_rejected_without_dunder_all(copie_session_minimal):
     """
     project_dir = copie_session_minimal.project_dir
     _write_reexport_package(project_dir, "minimal_project")
-    markers = _load_markers(project_dir, "noall")
+    markers = load_markers(project_dir, "noall")
 
     members = markers._get_public_members(project_dir, "noall")
     names = {e["name"] for e in members["classes"] + members["functions"]}
@@ -3994,7 +4751,7 @@ def test_discovery_imports_nothing(copie_session_minimal, tmp_path):
         encoding="utf-8",
     )
     try:
-        markers = _load_markers(project_dir, "noimport")
+        markers = load_markers(project_dir, "noimport")
         members = markers._get_public_members(project_dir, "explodes")
         names = {e["name"] for e in members["classes"] + members["functions"]}
         assert "Survivor" in names, "a class in an unimportable module was not discovered"
@@ -4026,7 +4783,7 @@ def test_unresolvable_reexport_warns_rather_than_vanishing(copie_session_minimal
         encoding="utf-8",
     )
     try:
-        markers = _load_markers(project_dir, "ghost")
+        markers = load_markers(project_dir, "ghost")
         with caplog.at_level(logging.WARNING, logger="mkdocs.hooks"):
             members = markers._get_public_members(project_dir, "ghost")
         names = {e["name"] for e in members["classes"] + members["functions"]}
@@ -4039,6 +4796,165 @@ def test_unresolvable_reexport_warns_rather_than_vanishing(copie_session_minimal
         shim.unlink()
 
 
+def _surface_from_disk_only(markers, project_dir):
+    """Reload the surface in a fresh process's position, with Griffe unavailable.
+
+    Clearing the in-process caches is what a new ``prebuild`` or ``serve.py``
+    starts from; replacing the loader makes any fall-through to a real analysis
+    fail loudly instead of quietly passing as a cache hit.
+    """
+
+    class _NoGriffe:
+        def __init__(self, *_args, **_kwargs):
+            raise AssertionError("the surface was re-analysed although nothing it depends on changed")
+
+    markers.reset_caches()
+    real = markers._api_pages.GriffeLoader
+    markers._api_pages.GriffeLoader = _NoGriffe
+    try:
+        return markers._api_pages._load_surface(project_dir)
+    finally:
+        markers._api_pages.GriffeLoader = real
+
+
+def test_unchanged_tree_reuses_the_persisted_surface(copie_session_minimal):
+    """A second process answers from `.artifacts/`, not from a fresh Griffe load.
+
+    Every process in a build starts cold, so a per-process cache alone made each
+    of them pay the full analysis again. The record must also reproduce the
+    surface exactly: a round trip that reorders or drops a field renders as a
+    different page, not an error.
+    """
+    project_dir = copie_session_minimal.project_dir
+    markers = load_markers(project_dir, "surface_persist")
+    markers.reset_caches()
+    fresh = markers._api_pages._load_surface(project_dir)
+
+    assert (project_dir / ARTIFACTS_DIR / "docs_build" / "api_surface.json").is_file()
+    assert _surface_from_disk_only(markers, project_dir) == fresh
+
+
+def test_source_edit_invalidates_the_persisted_surface(copie_session_minimal):
+    """Any change to the package source is a miss, never a stale page."""
+    project_dir = copie_session_minimal.project_dir
+    hello = project_dir / "src" / "minimal_project" / "hello.py"
+    original = hello.read_text(encoding="utf-8")
+    markers = load_markers(project_dir, "surface_invalidate")
+    markers.reset_caches()
+    markers._api_pages._load_surface(project_dir)
+
+    hello.write_text(
+        original + '\n\nclass Persisted:\n    """Added after the record was written."""\n', encoding="utf-8"
+    )
+    try:
+        markers.reset_caches()
+        names = {e["name"] for e in markers._get_public_members(project_dir, "hello")["classes"]}
+        assert "Persisted" in names, "a source edit was answered from the record written before it"
+    finally:
+        hello.write_text(original, encoding="utf-8")
+        markers.reset_caches()
+
+
+def test_persisted_surface_replays_its_warnings(copie_session_minimal, caplog):
+    """A record hit warns exactly as the analysis that wrote it did.
+
+    ``--strict`` turns the unresolvable-re-export warning into a CI failure. If
+    only the run that analysed the tree emitted it, the second build of the same
+    broken tree would pass.
+    """
+    project_dir = copie_session_minimal.project_dir
+    shim = project_dir / "src" / "minimal_project" / "ghost.py"
+    shim.write_text(
+        '"""Re-exports something that cannot be resolved."""\n\n'
+        "from definitely_not_installed_pkg import Ghost\n\n"
+        '__all__ = ["Ghost"]\n',
+        encoding="utf-8",
+    )
+    try:
+        markers = load_markers(project_dir, "surface_replay")
+        markers.reset_caches()
+        markers._api_pages._load_surface(project_dir)
+        with caplog.at_level(logging.WARNING, logger="mkdocs.hooks"):
+            _surface_from_disk_only(markers, project_dir)
+        assert any("Ghost" in r.getMessage() for r in caplog.records), (
+            f"the record swallowed the warning; warnings seen: {[r.getMessage() for r in caplog.records]}"
+        )
+    finally:
+        shim.unlink()
+        markers.reset_caches()
+
+
+def test_mkdocs_config_is_parsed_once_per_process(copie_session_default, monkeypatch):
+    """Every accessor, and every caller, shares one parse of `mkdocs.yml`.
+
+    The marker extension used to re-read the file for every page, and the
+    source-link extension, the API generator and `build.py` each kept their own
+    copy of the loader. One parse per process is the whole point of `_config`.
+    """
+    project_dir = copie_session_default.project_dir
+    markers = load_markers(project_dir, "config_once")
+    config = markers._config
+    config.reset_caches()
+    expected_site_dir = _mkdocs_config(project_dir)["site_dir"]
+    parses = []
+    real_load = config.yaml.load
+    monkeypatch.setattr(config.yaml, "load", lambda *a, **kw: parses.append(1) or real_load(*a, **kw))
+
+    assert config.nav(project_dir), "the rendered nav did not parse"
+    assert config.repo_url(project_dir).startswith("https://github.com/")
+    assert config.site_dir(project_dir) == expected_site_dir
+    config.preload_modules(project_dir)
+    assert len(parses) == 1, f"mkdocs.yml was parsed {len(parses)} times in one process"
+
+
+def test_mkdocs_config_edit_is_seen_without_a_reset(copie_session_minimal, tmp_path):
+    """An edited `mkdocs.yml` is re-read on the next access, as `serve.py` needs."""
+    config = load_markers(copie_session_minimal.project_dir, "config_revalidate")._config
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text("site_dir: first\n", encoding="utf-8")
+    assert config.site_dir(tmp_path) == "first"
+
+    config_file.write_text("site_dir: second\nrepo_url: https://example.com/x/\n", encoding="utf-8")
+    assert config.site_dir(tmp_path) == "second"
+    assert config.repo_url(tmp_path) == "https://example.com/x"
+
+    config_file.unlink()
+    assert config.load(tmp_path) == {}
+    assert config.site_dir(tmp_path) == "site"
+
+
+def test_default_site_dir_refuses_a_missing_or_broken_mkdocs_yml(copie_session_minimal, tmp_path):
+    """`build.py postbuild` with no site argument errors instead of guessing "site".
+
+    The lenient accessors read a bad config as empty; the default output
+    directory must not, or a hand-run postbuild writes into a directory no
+    build produced without a word.
+    """
+    config = load_markers(copie_session_minimal.project_dir, "config_strict")._config
+    with pytest.raises(OSError):
+        config.site_dir(tmp_path, strict=True)
+
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text("site_dir: [unclosed\n", encoding="utf-8")
+    assert config.site_dir(tmp_path) == "site", "the lenient read no longer tolerates a broken file"
+    with pytest.raises(config.yaml.YAMLError):
+        config.site_dir(tmp_path, strict=True)
+
+    config_file.write_text("- a list\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="not a YAML mapping"):
+        config.site_dir(tmp_path, strict=True)
+
+    build = load_build(copie_session_minimal.project_dir, "config_strict_build")
+    assert build._default_site_dir() == _mkdocs_config(copie_session_minimal.project_dir)["site_dir"]
+
+
+def test_only_the_config_module_parses_mkdocs_yml(copie_session_default):
+    """No docs_build module grows its own `mkdocs.yml` loader back."""
+    build = copie_session_default.project_dir / BUILD_DIR
+    parsers = sorted(p.name for p in build.glob("*.py") if "SafeLoader" in p.read_text(encoding="utf-8"))
+    assert parsers == ["_config.py"], f"mkdocs.yml is parsed outside _config.py: {parsers}"
+
+
 def test_companion_placeholder_renders_no_dangling_heading(copie_session_default):
     """A page with no matching notebooks renders nothing -- not a bare heading.
 
@@ -4046,10 +4962,10 @@ def test_companion_placeholder_renders_no_dangling_heading(copie_session_default
     removing a notebook's companion cannot leave an empty section behind.
     """
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "companion_empty")
+    markers = load_markers(project_dir, "companion_empty")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/how-to/troubleshooting.md", "pages/how-to/troubleshooting/index.html")
+    page = FakePage("pages/how-to/troubleshooting.md", "pages/how-to/troubleshooting/index.html")
     out = markers._inject("<!-- COMPANION_NOTEBOOKS -->", page, config={"repo_url": "https://github.com/s/p"})
 
     assert out.strip() == "", f"an unmatched placeholder left content behind: {out!r}"
@@ -4058,6 +4974,7 @@ def test_companion_placeholder_renders_no_dangling_heading(copie_session_default
 _CLASSIFICATION_PATTERNS = (
     "src/",
     "tests/",
+    "benchmarks/",
     "examples/",
     "docs/examples/",
     ".github/skills/",
@@ -4375,9 +5292,9 @@ def test_companion_marker_that_resolves_to_nothing_warns(copie_session_default):
     to close, left open on the template's own default.
     """
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "companion_resolves_to_nothing")
+    markers = load_markers(project_dir, "companion_resolves_to_nothing")
     _reset_gallery_caches(markers)
-    page = _FakePage("pages/tutorials/named-by-nobody.md", "pages/tutorials/named-by-nobody/index.html")
+    page = FakePage("pages/tutorials/named-by-nobody.md", "pages/tutorials/named-by-nobody/index.html")
 
     with caplog_at_warning() as records:
         out = markers._inject(
@@ -4410,7 +5327,7 @@ def test_sectioned_gallery_is_still_findable_for_the_overflow_link(copie_session
     # section pages beside it. This is yohou's shape.
     gallery.write_text("# Examples\n\n- [Alpha](alpha.md)\n", encoding="utf-8")
     (examples / "alpha.md").write_text("# Alpha\n\n<!-- GALLERY:section:alpha -->\n", encoding="utf-8")
-    markers = _load_markers(project_dir, "sectioned_gallery_home")
+    markers = load_markers(project_dir, "sectioned_gallery_home")
     try:
         _reset_gallery_caches(markers)
         assert "<!-- GALLERY -->" not in gallery.read_text(encoding="utf-8"), "fixture still has a bare marker"
@@ -4430,7 +5347,7 @@ def test_dropped_overflow_link_warns(copie_session_default):
     The drop happens on an `if`, not a marker, so nothing else can notice it.
     """
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "dropped_overflow_warns")
+    markers = load_markers(project_dir, "dropped_overflow_warns")
     _reset_gallery_caches(markers)
 
     # More notebooks than the cap, all using one symbol, and no gallery page.
@@ -4466,7 +5383,7 @@ def test_gallery_overflow_link_resolves_for_an_index_page(copie_session_default)
         "the seeded gallery page carries no <!-- GALLERY --> marker; this test would assert nothing"
     )
 
-    markers = _load_markers(project_dir, "gallery_url_index")
+    markers = load_markers(project_dir, "gallery_url_index")
     _reset_gallery_caches(markers)
     url = markers._get_gallery_page_url(project_dir)
 
@@ -4737,9 +5654,9 @@ def test_misspelled_marker_warns_instead_of_shipping_blank_space(copie_session_d
     would have reported it never saw it.
     """
     project_dir = copie_session_default.project_dir
-    markers = _load_markers(project_dir, "unhandled_markers")
+    markers = load_markers(project_dir, "unhandled_markers")
     _reset_gallery_caches(markers)
-    page = _FakePage("pages/examples/x.md", "pages/examples/x/index.html")
+    page = FakePage("pages/examples/x.md", "pages/examples/x/index.html")
 
     for marker in ("<!-- GALLERY:quickstart -->", "<!-- SUBPAGES_FOR:x -->", "<!-- EXAMPLES_FOR -->"):
         with caplog_at_warning() as records:
@@ -4754,6 +5671,140 @@ def test_misspelled_marker_warns_instead_of_shipping_blank_space(copie_session_d
     assert not records, "an ordinary HTML comment was flagged as a broken marker"
 
 
+def test_profile_traces_markers_per_page(copie_session_default, tmp_path, monkeypatch):
+    """With `MKDOCS_PROFILE` set, each marker is timed against its page and lands in the trace and summary."""
+    import atexit
+
+    import griffe
+
+    monkeypatch.setenv("MKDOCS_PROFILE", "1")
+    # Profiling wraps Griffe's extension registry; undone at teardown.
+    monkeypatch.setattr(griffe.Extensions, "add", griffe.Extensions.add)
+    markers = load_markers(copie_session_default.project_dir, "profiled")
+    profile = markers._profile
+    # Written by hand below, into tmp_path, not into the shared fixture at exit.
+    atexit.unregister(profile.write)
+    page = FakePage("pages/api/index.md", "pages/api/index.html")
+    markers._inject("# API\n\n<!-- API_TABLE -->\n", page, config={})
+    profile.write(tmp_path)
+
+    profile_dir = tmp_path / ARTIFACTS_DIR / "docs_build" / profile._PROFILE_DIR
+    events = json.loads((profile_dir / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+    timed = [e for e in events if e["cat"] == "marker"]
+    assert [e["name"] for e in timed] == ["<!-- API_TABLE -->"]
+    assert timed[0]["args"] == {"page": "pages/api/index.md"} and timed[0]["ph"] == "X"
+    summary = (profile_dir / "summary.txt").read_text(encoding="utf-8")
+    assert "<!-- API_TABLE -->" in summary and "pages/api/index.md" in summary
+
+
+def test_profile_times_griffe_extensions_from_the_caller(copie_session_default, monkeypatch):
+    """Extension hooks are timed as Griffe registers them; the extensions import nothing for it.
+
+    The extensions are loaded by mkdocstrings, one file at a time, and stay
+    self-contained: no `sys.path` edit and no import of the build tooling.
+    """
+    import atexit
+    import importlib.util
+    from types import SimpleNamespace
+
+    import griffe
+
+    build = copie_session_default.project_dir / BUILD_DIR
+    for extension in ("_see_also.py", "_references.py", "_source_links.py"):
+        source = (build / extension).read_text(encoding="utf-8")
+        assert "_profile" not in source, f"{extension} imports the profiler"
+    for extension in ("_see_also.py", "_references.py"):
+        assert "sys.path" not in (build / extension).read_text(encoding="utf-8"), f"{extension} edits sys.path"
+
+    monkeypatch.setenv("MKDOCS_PROFILE", "1")
+    monkeypatch.setattr(griffe.Extensions, "add", griffe.Extensions.add)
+    profile = load_markers(copie_session_default.project_dir, "profiled_griffe")._profile
+    atexit.unregister(profile.write)
+    spec = importlib.util.spec_from_file_location("generated_see_also_profiled", build / "_see_also.py")
+    see_also = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(see_also)
+
+    griffe.Extensions(see_also.SeeAlsoExtension()).call(
+        "on_object", obj=SimpleNamespace(path="test_project.hello.Greeter", docstring=None)
+    )
+
+    timed = [e for e in profile._EVENTS if e["cat"] == "griffe"]
+    assert [(e["name"], e["args"]) for e in timed] == [
+        ("SeeAlsoExtension.on_object", {"object": "test_project.hello.Greeter"})
+    ], "only the hook the extension overrides is timed, against its object"
+
+
+def test_profile_records_nothing_when_unset(copie_session_default, tmp_path, monkeypatch):
+    """Unset, the spans are no-ops and nothing is written."""
+    monkeypatch.delenv("MKDOCS_PROFILE", raising=False)
+    markers = load_markers(copie_session_default.project_dir, "unprofiled")
+    page = FakePage("pages/api/index.md", "pages/api/index.html")
+    markers._inject("# API\n\n<!-- API_TABLE -->\n", page, config={})
+    markers._profile.write(tmp_path)
+
+    assert markers._profile._EVENTS == []
+    assert not (tmp_path / ARTIFACTS_DIR).exists()
+
+
+def _line_replace_marker(markdown, marker, replacement):
+    """The per-marker, line-by-line substitution `_inject` made before its single scan.
+
+    Kept as the reference the tokenizer is checked against: a re-indented marker
+    must land exactly where the old pass put it.
+    """
+    out = []
+    for line in markdown.split("\n"):
+        if line.strip() != marker:
+            out.append(line.replace(marker, replacement) if marker in line else line)
+            continue
+        indent = line[: len(line) - len(line.lstrip())]
+        if replacement:
+            out.extend(indent + rline if rline.strip() else "" for rline in replacement.split("\n"))
+    return "\n".join(out)
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "# X\n\n<!-- SUBPAGES -->\n\nafter\n",
+        "!!! note\n\n    <!-- SUBPAGES -->\n\n- item\n  <!-- SUBPAGES -->  \n",
+        "prose <!-- SUBPAGES --> inline\n",
+        "<!-- SUBPAGES -->",
+        "first\n<!-- SUBPAGES -->",
+        "first\n<!-- SUBPAGES -->\n<!-- SUBPAGES -->",
+        "<!-- SUBPAGES -->\n<!-- SUBPAGES -->",
+    ],
+)
+@pytest.mark.parametrize("replacement", ["- [A](a.md)\n\n- [B](b.md)\n", "one line", ""])
+def test_marker_scan_matches_line_by_line_substitution(copie_session_default, markdown, replacement):
+    """The single-scan substitution re-indents, inlines and drops lines exactly as the old passes did."""
+    markers = load_markers(copie_session_default.project_dir, "marker_scan")
+    out = markers._substitute_markers(markdown, lambda _marker: (replacement, True), "x.md")
+    assert out == _line_replace_marker(markdown, "<!-- SUBPAGES -->", replacement)
+
+
+def test_inject_builds_each_marker_once(copie_session_default, monkeypatch):
+    """A marker repeated on a page is built once, and every other marker still resolves in the same scan."""
+    project_dir = copie_session_default.project_dir
+    markers = load_markers(project_dir, "marker_once")
+    _reset_gallery_caches(markers)
+    page = FakePage("pages/examples/x.md", "pages/examples/x/index.html")
+    calls = []
+    monkeypatch.setattr(markers, "_build_gallery_html", lambda *_a, **_k: calls.append(1) or "GALLERY-CARDS")
+    monkeypatch.setattr(markers, "_build_api_table_html", lambda *_a: "API-TABLE")
+
+    with caplog_at_warning() as records:
+        out = markers._inject(
+            "<!-- GALLERY -->\n\n<!-- API_TABLE -->\n\n<!-- GALLERY -->\n\n<!-- GALLERY:quickstart -->\n",
+            page,
+            config={"repo_url": "https://x/y"},
+        )
+
+    assert len(calls) == 1, f"the gallery was built {len(calls)} times for one marker"
+    assert out.count("GALLERY-CARDS") == 2 and "API-TABLE" in out
+    assert len(records) == 1 and "GALLERY:quickstart" in records[0]
+
+
 def test_nested_notebook_playground_link_keeps_its_subdirectory(copie_session_default):
     """The marimo link points at the notebook's real path, not a flat guess.
 
@@ -4770,7 +5821,7 @@ def test_nested_notebook_playground_link_keeps_its_subdirectory(copie_session_de
     nested = project_dir / "examples" / "data-features"
     _write_sectioned_notebook(nested, "nested_demo", title="Nested Demo", section="data-features")
     try:
-        markers = _load_markers(project_dir, "nested_playground")
+        markers = load_markers(project_dir, "nested_playground")
         _reset_gallery_caches(markers)
         item = next(i for i in markers._get_gallery_items(project_dir) if i["stem"] == "nested_demo")
 
@@ -4802,7 +5853,7 @@ def test_duplicate_notebook_stems_are_reported(copie_session_default):
         # A fresh build module loads fresh, empty-cache build steps, so prebuild
         # scans the notebooks from scratch -- no gallery-cache reset is needed here,
         # and the caches build.py owns are not the marker gallery caches anyway.
-        build = _load_build(project_dir, "stem_collision")
+        build = load_build(project_dir, "stem_collision")
         os.environ["MKDOCS_SKIP_NOTEBOOKS"] = "1"
         with caplog_at_warning() as records:
             build.prebuild()
@@ -4843,7 +5894,7 @@ def test_api_table_module_links_point_at_pages_that_exist(copie_session_minimal)
         '__all__ = ["BaseThing", "Widget"]\n',
         encoding="utf-8",
     )
-    markers = _load_markers(project_dir, "api_module_links")
+    markers = load_markers(project_dir, "api_module_links")
     markers._api_pages._SURFACE_CACHE = None
     markers._api_pages._API_NAME_LOOKUP_CACHE = None
 
@@ -4887,7 +5938,7 @@ def test_root_only_exports_reach_the_api(copie_session_minimal):
         '__all__ = ["BaseThing", "Widget"]\n',
         encoding="utf-8",
     )
-    markers = _load_markers(project_dir, "root_exports")
+    markers = load_markers(project_dir, "root_exports")
     markers._api_pages._SURFACE_CACHE = None
     markers._api_pages._API_NAME_LOOKUP_CACHE = None
 
@@ -4909,6 +5960,132 @@ def test_root_only_exports_reach_the_api(copie_session_minimal):
     )
 
 
+def test_lazy_root_exports_reach_the_api_without_a_runtime_import(copie):
+    """The shipped ``__init__`` exports lazily, and the docs still see every name.
+
+    The root imports no submodule when the package is imported: its public names
+    resolve through ``__getattr__`` and ``_LAZY_EXPORTS``. The API pages are built
+    by Griffe from the source, which only sees them through the ``TYPE_CHECKING``
+    imports, so a name added there the way the shipped comment asks must reach
+    the API -- at its module path when a submodule publishes it, at the root
+    when only the root does.
+    """
+    result = copie.copy()
+    project_dir = result.project_dir
+    init = project_dir / "src" / "test_project" / "__init__.py"
+    shipped = init.read_text(encoding="utf-8")
+    runtime_imports = [
+        node
+        for node in ast.parse(shipped).body
+        if isinstance(node, ast.ImportFrom) and node.level and node.module != "__future__"
+    ]
+    assert not runtime_imports, "the package root imports a submodule eagerly"
+    assert '"Greeter": ".hello"' in shipped
+
+    (init.parent / "_base.py").write_text(
+        '"""Private module."""\n\n\nclass BaseThing:\n    """A public base class in a private module."""\n',
+        encoding="utf-8",
+    )
+    extended = (
+        shipped
+        .replace(
+            "    from .hello import Greeter\n", "    from ._base import BaseThing\n    from .hello import Greeter\n"
+        )
+        .replace("_LAZY_EXPORTS = {\n", '_LAZY_EXPORTS = {\n    "BaseThing": "._base",\n')
+        .replace('__all__ = ["Greeter"', '__all__ = ["BaseThing", "Greeter"')
+    )
+    assert extended.count("BaseThing") == 3, "the shipped __init__ no longer has the shape its comment describes"
+    init.write_text(extended, encoding="utf-8")
+
+    markers = load_markers(project_dir, "lazy_exports")
+    _reset_hook_caches(markers)
+    roots = markers._get_root_members(project_dir)
+    assert [c["name"] for c in roots["classes"]] == ["BaseThing"]
+    lookup = markers._api_pages._get_api_name_lookup(project_dir)
+    assert lookup.get("BaseThing") == "test_project.BaseThing"
+    assert lookup.get("Greeter") == "test_project.hello.Greeter"
+
+
+def test_import_time_profile_parses_the_interpreter_tree(copie_session_default):
+    """The shipped import-time check reads a real ``-X importtime`` tree and its budget.
+
+    The generated test only runs inside the project, against the installed
+    package, so this exercises its parser on an import whose shape is known:
+    ``json`` pulls in ``json.decoder``, which pulls in ``json.scanner``.
+    """
+    import importlib.util
+
+    project_dir = copie_session_default.project_dir
+    spec = importlib.util.spec_from_file_location(
+        "generated_import_time", project_dir / "tests" / "test_import_time.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import json"], capture_output=True, text=True, check=True
+    ).stderr
+    imports = module.subtree(module.parse(stderr), "json")
+    assert imports[-1].module == "json"
+    assert imports[-1].depth == 0
+    by_name = {entry.module: entry for entry in imports}
+    assert by_name["json.scanner"].depth == by_name["json.decoder"].depth + 1
+    assert imports[-1].cumulative_us >= sum(entry.self_us for entry in imports if entry.depth == 1)
+    report = module.report(imports, top=3)
+    assert report.startswith("import test_project: ")
+    assert report.count("\n  ") == 6, "three modules under each of the self and cumulative headings"
+
+    budget = module.budget()
+    assert isinstance(budget["max_total_ms"], int)
+    assert "numpy" in budget["heavy_modules"]
+
+    noxfile = (project_dir / "noxfile.py").read_text(encoding="utf-8")
+    assert 'session.run("python", "tests/test_import_time.py")' in noxfile
+    assert "import-time:" in (project_dir / "justfile").read_text(encoding="utf-8")
+
+
+def test_benchmark_comparison_fails_past_the_configured_regression(copie_session_default, tmp_path):
+    """``benchmarks/compare.py`` applies the ``[tool.benchmarks]`` budget to two runs.
+
+    The benchmarks themselves need pytest-benchmark and run only inside the
+    project (``nox -s bench``); the comparison is plain Python over its JSON, so
+    it is exercised here on runs of a known shape.
+    """
+    import importlib.util
+
+    project_dir = copie_session_default.project_dir
+    spec = importlib.util.spec_from_file_location("generated_bench_compare", project_dir / "benchmarks" / "compare.py")
+    compare = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(compare)
+    assert compare.settings() == {"max_regression_percent": 10, "statistic": "median"}
+
+    def run(path, **medians):
+        benchmarks = [
+            {"fullname": f"benchmarks/test_bench_hello.py::{name}", "stats": {"median": median, "mean": median * 3}}
+            for name, median in medians.items()
+        ]
+        path.write_text(json.dumps({"benchmarks": benchmarks}), encoding="utf-8")
+        return str(path)
+
+    baseline = run(tmp_path / "baseline.json", greet=1.0e-6, gone=1.0e-6)
+    within = run(tmp_path / "within.json", greet=1.09e-6, new=5.0e-6)
+    slower = run(tmp_path / "slower.json", greet=1.2e-6)
+
+    assert compare.main([baseline, within]) == 0, "a 9% slowdown is inside the 10% budget; new and gone never fail"
+    assert compare.main([baseline, slower]) == 1
+    assert compare.main([baseline, slower, "--max-regression", "25"]) == 0
+    assert compare.main([baseline, within, "--statistic", "mean"]) == 0
+    assert compare.main([str(tmp_path / "missing.json"), within]) == 2
+
+    noxfile = (project_dir / "noxfile.py").read_text(encoding="utf-8")
+    assert 'BENCHMARKS_DIR = ARTIFACTS_DIR / "benchmarks"' in noxfile
+    assert 'f"--benchmark-json={latest}"' in noxfile
+    assert "bench *ARGS:" in (project_dir / "justfile").read_text(encoding="utf-8")
+    bench = (project_dir / "benchmarks" / "test_bench_hello.py").read_text(encoding="utf-8")
+    assert "pytestmark = pytest.mark.bench" in bench
+    assert "Greeter" in bench
+
+
 def test_subpages_reports_a_sibling_missing_from_the_nav(copie_session_default):
     """An index lists sibling files; the sidebar comes from mkdocs.yml. Disagreement is reported.
 
@@ -4927,8 +6104,8 @@ def test_subpages_reports_a_sibling_missing_from_the_nav(copie_session_default):
     (subdir / "configure.md").write_text("# Configure\n\nHow to configure.\n", encoding="utf-8")
     (subdir / "troubleshooting.md").write_text("# Troubleshooting\n\nWhen things break.\n", encoding="utf-8")
 
-    markers = _load_markers(project_dir, "subpages_orphan")
-    page = _FakePage("pages/orphan-index/index.md", "pages/orphan-index/index.html")
+    markers = load_markers(project_dir, "subpages_orphan")
+    page = FakePage("pages/orphan-index/index.md", "pages/orphan-index/index.html")
     # troubleshooting is deliberately absent from the nav.
     config = {
         "nav": [
@@ -4959,10 +6136,10 @@ def test_gallery_section_marker_renders_only_that_section(copie_session_default)
     _write_sectioned_notebook(examples, "sec_alpha_two", title="Alpha Two", section="alpha")
     _write_sectioned_notebook(examples, "sec_beta_one", title="Beta One", section="beta")
 
-    markers = _load_markers(project_dir, "gallery_section")
+    markers = load_markers(project_dir, "gallery_section")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/examples/alpha.md", "pages/examples/alpha/index.html")
+    page = FakePage("pages/examples/alpha.md", "pages/examples/alpha/index.html")
     out = markers._inject("# Alpha\n\n<!-- GALLERY:section:alpha -->\n", page, config={"repo_url": "https://x/y"})
 
     assert "<!-- GALLERY:section:alpha -->" not in out, "the sectioned marker was left in the page as a dead comment"
@@ -4980,10 +6157,10 @@ def test_unknown_gallery_section_warns_instead_of_rendering_nothing(copie_sessio
     project_dir = copie_session_default.project_dir
     _write_sectioned_notebook(project_dir / "examples", "sec_real", title="Real", section="real")
 
-    markers = _load_markers(project_dir, "gallery_section_unknown")
+    markers = load_markers(project_dir, "gallery_section_unknown")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/examples/typo.md", "pages/examples/typo/index.html")
+    page = FakePage("pages/examples/typo.md", "pages/examples/typo/index.html")
     with caplog.at_level(logging.WARNING, logger="mkdocs.hooks"):
         markers._inject("# T\n\n<!-- GALLERY:section:typoed -->\n", page, config={"repo_url": "https://x/y"})
 
@@ -5006,10 +6183,10 @@ def test_companion_cards_render_without_a_marker_on_the_page(copie_session_defau
         companion="pages/how-to/configure.md",
     )
 
-    markers = _load_markers(project_dir, "companion_no_marker")
+    markers = load_markers(project_dir, "companion_no_marker")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/how-to/configure.md", "pages/how-to/configure/index.html")
+    page = FakePage("pages/how-to/configure.md", "pages/how-to/configure/index.html")
     out = markers._inject("# Configure\n\nProse.\n", page, config={"repo_url": "https://x/y"})
 
     assert "Unmarked Companion" in out, "a notebook naming this page as its companion is nowhere on it"
@@ -5032,10 +6209,10 @@ def test_companion_cards_stay_inside_an_indented_marker(copie_session_default):
         companion="pages/how-to/troubleshooting.md",
     )
 
-    markers = _load_markers(project_dir, "companion_indented")
+    markers = load_markers(project_dir, "companion_indented")
     _reset_gallery_caches(markers)
 
-    page = _FakePage("pages/how-to/troubleshooting.md", "pages/how-to/troubleshooting/index.html")
+    page = FakePage("pages/how-to/troubleshooting.md", "pages/how-to/troubleshooting/index.html")
     source = '# Troubleshooting\n\n!!! tip "Try it interactively"\n    <!-- COMPANION_NOTEBOOKS -->\n'
     out = markers._inject(source, page, config={"repo_url": "https://x/y"})
 
@@ -5067,8 +6244,8 @@ def test_index_page_lists_its_subpages(copie_session_default):
     # A nested section owns its own index; the how-to index must not reach into it.
     (subdir / "nested" / "deep.md").write_text("# Deep Nested Page\n\nDetails.\n", encoding="utf-8")
 
-    markers = _load_markers(project_dir, "subpages")
-    page = _FakePage("pages/subpages-order/index.md", "pages/subpages-order/index.html")
+    markers = load_markers(project_dir, "subpages")
+    page = FakePage("pages/subpages-order/index.md", "pages/subpages-order/index.html")
     # Troubleshooting is deliberately the nav's only entry AND the last of the
     # three by title ("Contributing to..." < "How to Configure..." <
     # "Troubleshooting"). Asserting it leads therefore fails if nav order is
@@ -5114,8 +6291,8 @@ def test_subpage_with_no_h1_falls_back_to_its_nav_title(copie_session_default):
     (docs_dir / "changelog.md").write_text('--8<-- "CHANGELOG.md"\n', encoding="utf-8")
     (docs_dir / "orphan.md").write_text("Body with no heading and no nav entry.\n", encoding="utf-8")
 
-    markers = _load_markers(project_dir, "subpages_navfallback")
-    page = _FakePage("pages/navfallback/index.md", "pages/navfallback/index.html")
+    markers = load_markers(project_dir, "subpages_navfallback")
+    page = FakePage("pages/navfallback/index.md", "pages/navfallback/index.html")
     config = {"nav": [{"Reference": [{"Changelog": "pages/navfallback/changelog.md"}]}]}
     out = markers._inject("# Nav\n\n<!-- SUBPAGES -->\n", page, config=config)
 
@@ -5146,8 +6323,8 @@ def test_subpage_index_summarises_each_page_from_its_own_source(copie_session_de
         encoding="utf-8",
     )
 
-    markers = _load_markers(project_dir, "subpages_desc")
-    page = _FakePage("pages/subtest/index.md", "pages/subtest/index.html")
+    markers = load_markers(project_dir, "subpages_desc")
+    page = FakePage("pages/subtest/index.md", "pages/subtest/index.html")
     out = markers._inject("# Sub\n\n<!-- SUBPAGES -->\n", page, config={})
 
     assert "Summary from frontmatter." in out, "a frontmatter description was not used as the summary"
@@ -5353,8 +6530,8 @@ def test_seeded_reference_index_lists_the_headingless_changelog(copie_session_de
     )
 
     docs = project_dir / "docs"
-    markers = _load_markers(project_dir, "seeded_reference_index")
-    page = _FakePage("pages/reference/index.md", "pages/reference/index.html")
+    markers = load_markers(project_dir, "seeded_reference_index")
+    page = FakePage("pages/reference/index.md", "pages/reference/index.html")
     source = (docs / "pages" / "reference" / "index.md").read_text(encoding="utf-8")
     assert "<!-- SUBPAGES -->" in source, "the seeded reference index no longer asks for its subpages"
 
@@ -5389,7 +6566,7 @@ def test_headingless_changelog_still_gets_a_summary(copie_session_default):
         "the seeded changelog grew its own H1; it would duplicate the one inside CHANGELOG.md"
     )
 
-    markers = _load_markers(project_dir, "changelog_summary")
+    markers = load_markers(project_dir, "changelog_summary")
     title, description = markers._page_title_and_description(str(changelog))
     assert title is None, "a bare include has no H1 of its own; the nav supplies the title"
     assert description, "the changelog frontmatter yields no summary"
@@ -5664,8 +6841,8 @@ def test_seeded_reference_index_lists_the_citation_page(copie_session_default):
     citation_page = project_dir / "docs" / "pages" / "reference" / "citation.md"
     assert citation_page.is_file(), "the template ships no docs citation page"
 
-    markers = _load_markers(project_dir, "reference_index_citation")
-    page = _FakePage("pages/reference/index.md", "pages/reference/index.html")
+    markers = load_markers(project_dir, "reference_index_citation")
+    page = FakePage("pages/reference/index.md", "pages/reference/index.html")
     source = (project_dir / "docs" / "pages" / "reference" / "index.md").read_text(encoding="utf-8")
 
     with caplog_at_warning() as records: